@@ -117,6 +117,24 @@ def publish(paths, targets, gui):
     Commands.publish(list(paths), targets, gui)
 
 
+@main_cli.command()
+@click.argument("queue_dir")
+@click.option(
+    "--max-requests", type=int, default=None,
+    help="Stop after processing this amount of requests")
+@click.option(
+    "--idle-timeout", type=float, default=None,
+    help="Stop when no request arrived for this amount of seconds")
+def publish_worker(queue_dir, max_requests, idle_timeout):
+    """Start publish worker processing publish requests from a queue.
+
+    Worker keeps addons and publish plugins loaded between requests.
+    Requests are json files in 'pending' subfolder of queue directory.
+    """
+
+    Commands.publish_worker(queue_dir, max_requests, idle_timeout)
+
+
 @main_cli.command(context_settings={"ignore_unknown_options": True})
 def publish_report_viewer():
     from ayon_core.tools.publisher.publish_report_viewer import main
@@ -148,6 +148,29 @@ class Commands:
 
         log.info("Publish finished.")
 
+    @staticmethod
+    def publish_worker(queue_dir, max_requests=None, idle_timeout=None):
+        """Start long running publish worker.
+
+        Worker processes publish requests from queue directory. Addons
+        and publish plugins are loaded only once.
+
+        Args:
+            queue_dir (str): Directory with queue of publish requests.
+            max_requests (Optional[int]): Stop after processing this amount
+                of requests.
+            idle_timeout (Optional[float]): Stop when there was no request
+                for this amount of seconds.
+        """
+
+        from ayon_core.lib import Logger
+        from ayon_core.pipeline.publish import PublishWorker
+
+        Logger.set_process_name("Publish worker")
+
+        worker = PublishWorker(queue_dir)
+        worker.run(max_requests, idle_timeout)
+
     @staticmethod
     def extractenvironments(output_json_path, project, asset, task, app,
                             env_group):
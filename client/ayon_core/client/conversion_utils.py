@@ -1,6 +1,7 @@
 import os
 import arrow
 import collections
+import functools
 import json
 
 import six
@@ -16,7 +17,12 @@ from .constants import (
     CURRENT_WORKFILE_INFO_SCHEMA,
     REPRESENTATION_FILES_FIELDS,
 )
-from .utils import create_entity_id, prepare_entity_changes
+from .utils import (
+    create_entity_id,
+    prepare_entity_changes,
+    get_attributes_for_type,
+    get_fields_mapping_cache,
+)
 
 # --- Project entity ---
 PROJECT_FIELDS_MAPPING_V3_V4 = {
@@ -69,6 +75,76 @@ REPRESENTATION_FIELDS_MAPPING_V3_V4 = {
 }
 
 
+_NOT_SET = object()
+
+
+class _ConversionStats:
+    counts = collections.Counter()
+
+
+def _count_conversion(entity_type, key):
+    _ConversionStats.counts[(entity_type, key)] += 1
+
+
+def get_conversion_stats():
+    """How many times were fields and entities converted to v3.
+
+    Counts are collected since start of process or since last reset by
+    'reset_conversion_stats'. Can be used to find code which should use
+    native v4 queries from 'entities_v4'.
+
+    Returns:
+        dict[str, dict[str, int]]: Counts by entity type. Counts of
+            converted fields are split into 'fields_cache_hits' and
+            'fields_cache_misses', converted entities are in 'entities'.
+    """
+
+    output = collections.defaultdict(dict)
+    for (entity_type, key), count in _ConversionStats.counts.items():
+        output[entity_type][key] = count
+    return dict(output)
+
+
+def reset_conversion_stats():
+    """Reset counts of conversions."""
+
+    _ConversionStats.counts.clear()
+
+
+def _cache_fields_conversion(entity_type):
+    """Cache output of fields conversion function for requested fields.
+
+    Converted fields are stored per server connection because they depend
+    on attributes schema. Cache is reset with attributes schema.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(fields, con):
+            if not fields:
+                return None
+
+            key = (entity_type, frozenset(fields))
+            cache = get_fields_mapping_cache(con)
+            output = cache.get(key, _NOT_SET)
+            if output is _NOT_SET:
+                _count_conversion(entity_type, "fields_cache_misses")
+                output = func(key[1], con)
+                if output is not None:
+                    output = frozenset(output)
+                cache[key] = output
+            else:
+                _count_conversion(entity_type, "fields_cache_hits")
+
+            # Callers may add fields to output
+            if output is not None:
+                output = set(output)
+            return output
+        return wrapper
+    return decorator
+
+
+@_cache_fields_conversion("project")
 def project_fields_v3_to_v4(fields, con):
     """Convert project fields from v3 to v4 structure.
 
@@ -85,7 +161,7 @@ def project_fields_v3_to_v4(fields, con):
     if not fields:
         return None
 
-    project_attribs = con.get_attributes_for_type("project")
+    project_attribs = get_attributes_for_type(con, "project")
     output = set()
     for field in fields:
         # If config is needed the rest api call must be used
@@ -177,6 +253,7 @@ def convert_v4_project_to_v3(project):
         Dict[str, Any]: Project converted to v3 structure.
     """
 
+    _count_conversion("project", "entities")
     if not project:
         return project
 
@@ -284,6 +361,7 @@ def convert_v4_project_to_v3(project):
     return output
 
 
+@_cache_fields_conversion("folder")
 def folder_fields_v3_to_v4(fields, con):
     """Convert folder fields from v3 to v4 structure.
 
@@ -297,7 +375,7 @@ def folder_fields_v3_to_v4(fields, con):
     if not fields:
         return None
 
-    folder_attributes = con.get_attributes_for_type("folder")
+    folder_attributes = get_attributes_for_type(con, "folder")
     output = set()
     for field in fields:
         if field in ("schema", "type", "parent"):
@@ -370,6 +448,7 @@ def convert_v4_folder_to_v3(folder, project_name):
         Dict[str, Any]: Converted v4 folder to v3 asset.
     """
 
+    _count_conversion("folder", "entities")
     output = {
         "_id": folder["id"],
         "parent": project_name,
@@ -409,6 +488,7 @@ def convert_v4_folder_to_v3(folder, project_name):
     return output
 
 
+@_cache_fields_conversion("subset")
 def subset_fields_v3_to_v4(fields, con):
     """Convert subset fields from v3 to v4 structure.
 
@@ -422,7 +502,7 @@ def subset_fields_v3_to_v4(fields, con):
     if not fields:
         return None
 
-    product_attributes = con.get_attributes_for_type("product")
+    product_attributes = get_attributes_for_type(con, "product")
 
     output = set()
     for field in fields:
@@ -463,6 +543,7 @@ def subset_fields_v3_to_v4(fields, con):
 
 
 def convert_v4_subset_to_v3(subset):
+    _count_conversion("subset", "entities")
     output = {
         "_id": subset["id"],
         "type": "subset",
@@ -495,6 +576,7 @@ def convert_v4_subset_to_v3(subset):
     return output
 
 
+@_cache_fields_conversion("version")
 def version_fields_v3_to_v4(fields, con):
     """Convert version fields from v3 to v4 structure.
 
@@ -508,7 +590,7 @@ def version_fields_v3_to_v4(fields, con):
     if not fields:
         return None
 
-    version_attributes = con.get_attributes_for_type("version")
+    version_attributes = get_attributes_for_type(con, "version")
 
     output = set()
     for field in fields:
@@ -570,6 +652,7 @@ def convert_v4_version_to_v3(version):
         Dict[str, Any]: Conveted version entity to v3 structure.
     """
 
+    _count_conversion("version", "entities")
     version_num = version["version"]
     if version_num < 0:
         output = {
@@ -614,6 +697,7 @@ def convert_v4_version_to_v3(version):
     return output
 
 
+@_cache_fields_conversion("representation")
 def representation_fields_v3_to_v4(fields, con):
     """Convert representation fields from v3 to v4 structure.
 
@@ -627,7 +711,9 @@ def representation_fields_v3_to_v4(fields, con):
     if not fields:
         return None
 
-    representation_attributes = con.get_attributes_for_type("representation")
+    representation_attributes = get_attributes_for_type(
+        con, "representation"
+    )
 
     output = set()
     for field in fields:
@@ -669,6 +755,7 @@ def convert_v4_representation_to_v3(representation):
         Dict[str, Any]: Converted representation to v3 structure.
     """
 
+    _count_conversion("representation", "entities")
     output = {
         "type": "representation",
         "schema": CURRENT_REPRESENTATION_SCHEMA,
@@ -773,6 +860,7 @@ def workfile_info_fields_v3_to_v4(fields):
 
 
 def convert_v4_workfile_info_to_v3(workfile_info, task):
+    _count_conversion("workfile_info", "entities")
     output = {
         "type": "workfile",
         "schema": CURRENT_WORKFILE_INFO_SCHEMA,
@@ -794,7 +882,7 @@ def convert_v4_workfile_info_to_v3(workfile_info, task):
 
 
 def convert_create_asset_to_v4(asset, project, con):
-    folder_attributes = con.get_attributes_for_type("folder")
+    folder_attributes = get_attributes_for_type(con, "folder")
 
     asset_data = asset["data"]
     parent_id = asset_data["visualParent"]
@@ -850,7 +938,7 @@ def convert_create_task_to_v4(task, project, con):
 
 
 def convert_create_subset_to_v4(subset, con):
-    product_attributes = con.get_attributes_for_type("product")
+    product_attributes = get_attributes_for_type(con, "product")
 
     subset_data = subset["data"]
     product_type = subset_data.get("family")
@@ -868,9 +956,9 @@ def convert_create_subset_to_v4(subset, con):
 
     attribs = {}
     data = {}
-    if "subsetGroup" in subset_data:
-        subset_data["productGroup"] = subset_data.pop("subsetGroup")
     for key, value in subset_data.items():
+        if key == "subsetGroup":
+            key = "productGroup"
         if key not in product_attributes:
             data[key] = value
         elif value is not None:
@@ -886,7 +974,7 @@ def convert_create_subset_to_v4(subset, con):
 
 
 def convert_create_version_to_v4(version, con):
-    version_attributes = con.get_attributes_for_type("version")
+    version_attributes = get_attributes_for_type(con, "version")
     converted_version = {
         "version": version["name"],
         "productId": version["parent"],
@@ -929,7 +1017,7 @@ def convert_create_hero_version_to_v4(hero_version, project_name, con):
 
         return version
 
-    version_attributes = con.get_attributes_for_type("version")
+    version_attributes = get_attributes_for_type(con, "version")
     converted_version = {
         "version": hero_version["version"],
         "productId": hero_version["parent"],
@@ -957,7 +1045,9 @@ def convert_create_hero_version_to_v4(hero_version, project_name, con):
 
 
 def convert_create_representation_to_v4(representation, con):
-    representation_attributes = con.get_attributes_for_type("representation")
+    representation_attributes = get_attributes_for_type(
+        con, "representation"
+    )
 
     converted_representation = {
         "name": representation["name"],
@@ -986,7 +1076,8 @@ def convert_create_representation_to_v4(representation, con):
 
     converted_representation["files"] = new_files
 
-    context = representation["context"]
+    # Input data are not modified
+    context = dict(representation["context"])
     if "folder" not in context:
         context["folder"] = {
             "name": context.get("asset")
@@ -1003,13 +1094,14 @@ def convert_create_representation_to_v4(representation, con):
     }
 
     representation_data = representation["data"]
-    representation_data["template"] = (
-        representation_data["template"]
-        .replace("{subset}", "{product[name]}")
-        .replace("{family}", "{product[type]}")
-    )
-
     for key, value in representation_data.items():
+        if key == "template":
+            value = (
+                value
+                .replace("{subset}", "{product[name]}")
+                .replace("{family}", "{product[type]}")
+            )
+
         if key not in representation_attributes:
             data[key] = value
         elif value is not None:
@@ -1031,7 +1123,7 @@ def convert_create_workfile_info_to_v4(data, project_name, con):
     if not task:
         return None
 
-    workfile_attributes = con.get_attributes_for_type("workfile")
+    workfile_attributes = get_attributes_for_type(con, "workfile")
     filename = data["filename"]
     possible_attribs = {
         "extension": os.path.splitext(filename)[-1]
@@ -1095,7 +1187,7 @@ def _to_flat_dict(data):
 def convert_update_folder_to_v4(project_name, asset_id, update_data, con):
     new_update_data = {}
 
-    folder_attributes = con.get_attributes_for_type("folder")
+    folder_attributes = get_attributes_for_type(con, "folder")
     full_update_data = _from_flat_dict(update_data)
     data = full_update_data.get("data")
 
@@ -1155,7 +1247,7 @@ def convert_update_folder_to_v4(project_name, asset_id, update_data, con):
 def convert_update_subset_to_v4(project_name, subset_id, update_data, con):
     new_update_data = {}
 
-    product_attributes = con.get_attributes_for_type("product")
+    product_attributes = get_attributes_for_type(con, "product")
     full_update_data = _from_flat_dict(update_data)
     data = full_update_data.get("data")
     new_data = {}
@@ -1208,7 +1300,7 @@ def convert_update_subset_to_v4(project_name, subset_id, update_data, con):
 def convert_update_version_to_v4(project_name, version_id, update_data, con):
     new_update_data = {}
 
-    version_attributes = con.get_attributes_for_type("version")
+    version_attributes = get_attributes_for_type(con, "version")
     full_update_data = _from_flat_dict(update_data)
     data = full_update_data.get("data")
     new_data = {}
@@ -1280,7 +1372,7 @@ def convert_update_representation_to_v4(
 ):
     new_update_data = {}
 
-    folder_attributes = con.get_attributes_for_type("folder")
+    folder_attributes = get_attributes_for_type(con, "folder")
     full_update_data = _from_flat_dict(update_data)
     data = full_update_data.get("data")
 
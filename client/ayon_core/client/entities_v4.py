@@ -0,0 +1,316 @@
+"""Query functions returning AYON entities without conversion to v3.
+
+Functions in 'entities.py' convert requested fields and queried entities
+between v4 and v3 (mongo document) structure. That is needed by code
+which still works with v3 documents, but conversion is not for free when
+thousands of entities are processed and most of the callers need only
+few fields.
+
+Functions in this module pass requested v4 fields to server directly and
+return entities as they were received. Fields should be always passed,
+all fields (including all attributes) are queried otherwise.
+"""
+
+from .utils import get_ayon_server_api_connection
+
+_REPRESENTATIONS_HIERARCHY_QUERY = """
+query RepresentationsHierarchy(
+    $projectName: String!, $representationIds: [String!], $first: Int
+) {
+    project(name: $projectName) {
+        representations(ids: $representationIds, first: $first) {
+            edges { node {
+                id
+                name
+                version {
+                    id
+                    version
+                    productId
+                    product {
+                        id
+                        name
+                        productType
+                        attrib { productGroup }
+                        folder { id name path }
+                    }
+                }
+            } }
+        }
+    }
+}
+"""
+
+
+def _prepare_fields(fields, required_fields):
+    if fields is None:
+        return None
+    fields = set(fields)
+    fields |= required_fields
+    return fields
+
+
+def get_folders(
+    project_name,
+    folder_ids=None,
+    folder_paths=None,
+    folder_names=None,
+    parent_ids=None,
+    active=True,
+    fields=None
+):
+    """Query folder entities.
+
+    Args:
+        project_name (str): Project name.
+        folder_ids (Optional[Iterable[str]]): Folder ids.
+        folder_paths (Optional[Iterable[str]]): Folder paths.
+        folder_names (Optional[Iterable[str]]): Folder names.
+        parent_ids (Optional[Iterable[str]]): Ids of parent folders.
+        active (Optional[bool]): Filter by active state. Both active and
+            inactive are returned if set to None.
+        fields (Optional[Iterable[str]]): Fields of folders to query.
+
+    Returns:
+        Generator[dict[str, Any]]: Folder entities.
+    """
+
+    con = get_ayon_server_api_connection()
+    return con.get_folders(
+        project_name,
+        folder_ids=folder_ids,
+        folder_paths=folder_paths,
+        folder_names=folder_names,
+        parent_ids=parent_ids,
+        active=active,
+        fields=_prepare_fields(fields, {"id"})
+    )
+
+
+def get_products(
+    project_name,
+    product_ids=None,
+    product_names=None,
+    folder_ids=None,
+    names_by_folder_ids=None,
+    active=True,
+    fields=None
+):
+    """Query product entities.
+
+    Args:
+        project_name (str): Project name.
+        product_ids (Optional[Iterable[str]]): Product ids.
+        product_names (Optional[Iterable[str]]): Product names.
+        folder_ids (Optional[Iterable[str]]): Ids of parent folders.
+        names_by_folder_ids (Optional[dict[str, Iterable[str]]]): Product
+            names by folder ids.
+        active (Optional[bool]): Filter by active state. Both active and
+            inactive are returned if set to None.
+        fields (Optional[Iterable[str]]): Fields of products to query.
+
+    Returns:
+        Generator[dict[str, Any]]: Product entities.
+    """
+
+    con = get_ayon_server_api_connection()
+    return con.get_products(
+        project_name,
+        product_ids=product_ids,
+        product_names=product_names,
+        folder_ids=folder_ids,
+        names_by_folder_ids=names_by_folder_ids,
+        active=active,
+        fields=_prepare_fields(fields, {"id"})
+    )
+
+
+def get_versions(
+    project_name,
+    version_ids=None,
+    product_ids=None,
+    versions=None,
+    hero=True,
+    standard=True,
+    latest=None,
+    active=True,
+    fields=None
+):
+    """Query version entities.
+
+    Hero versions have negative 'version' value. Unlike 'get_versions'
+    in 'entities.py' the version which hero version represents is not
+    queried.
+
+    Args:
+        project_name (str): Project name.
+        version_ids (Optional[Iterable[str]]): Version ids.
+        product_ids (Optional[Iterable[str]]): Ids of parent products.
+        versions (Optional[Iterable[int]]): Version numbers.
+        hero (bool): Query hero versions.
+        standard (bool): Query standard versions.
+        latest (Optional[bool]): Query only last versions of products.
+        active (Optional[bool]): Filter by active state. Both active and
+            inactive are returned if set to None.
+        fields (Optional[Iterable[str]]): Fields of versions to query.
+
+    Returns:
+        Generator[dict[str, Any]]: Version entities.
+    """
+
+    con = get_ayon_server_api_connection()
+    return con.get_versions(
+        project_name,
+        version_ids=version_ids,
+        product_ids=product_ids,
+        versions=versions,
+        hero=hero,
+        standard=standard,
+        latest=latest,
+        active=active,
+        fields=_prepare_fields(fields, {"id", "version"})
+    )
+
+
+def get_last_versions(project_name, product_ids, active=True, fields=None):
+    """Query last versions of products.
+
+    Args:
+        project_name (str): Project name.
+        product_ids (Iterable[str]): Product ids.
+        active (Optional[bool]): Filter by active state. Both active and
+            inactive are returned if set to None.
+        fields (Optional[Iterable[str]]): Fields of versions to query.
+
+    Returns:
+        dict[str, dict[str, Any]]: Last version entity by product id.
+    """
+
+    product_ids = set(product_ids)
+    if not product_ids:
+        return {}
+
+    versions = get_versions(
+        project_name,
+        product_ids=product_ids,
+        hero=False,
+        latest=True,
+        active=active,
+        fields=_prepare_fields(fields, {"productId"})
+    )
+    return {
+        version["productId"]: version
+        for version in versions
+    }
+
+
+def get_representations(
+    project_name,
+    representation_ids=None,
+    representation_names=None,
+    version_ids=None,
+    names_by_version_ids=None,
+    active=True,
+    fields=None
+):
+    """Query representation entities.
+
+    Args:
+        project_name (str): Project name.
+        representation_ids (Optional[Iterable[str]]): Representation ids.
+        representation_names (Optional[Iterable[str]]): Representation
+            names.
+        version_ids (Optional[Iterable[str]]): Ids of parent versions.
+        names_by_version_ids (Optional[dict[str, Iterable[str]]]):
+            Representation names by version ids.
+        active (Optional[bool]): Filter by active state. Both active and
+            inactive are returned if set to None.
+        fields (Optional[Iterable[str]]): Fields of representations to
+            query.
+
+    Returns:
+        Generator[dict[str, Any]]: Representation entities.
+    """
+
+    con = get_ayon_server_api_connection()
+    return con.get_representations(
+        project_name,
+        representation_ids=representation_ids,
+        representation_names=representation_names,
+        version_ids=version_ids,
+        names_by_version_ids=names_by_version_ids,
+        active=active,
+        fields=_prepare_fields(fields, {"id"})
+    )
+
+
+def get_representations_parents(project_name, representation_ids):
+    """Parent entities of representations.
+
+    Args:
+        project_name (str): Project name.
+        representation_ids (Iterable[str]): Representation ids.
+
+    Returns:
+        dict[str, tuple[dict, dict, dict, dict]]: Version, product, folder
+            and project entities by representation id.
+    """
+
+    representation_ids = set(representation_ids)
+    if not representation_ids:
+        return {}
+    con = get_ayon_server_api_connection()
+    return con.get_representations_parents(project_name, representation_ids)
+
+
+def get_representations_hierarchy(
+    project_name, representation_ids, chunk_size=500
+):
+    """Representations with their parent version, product and folder.
+
+    Whole hierarchy is received in one request (per chunk of ids) instead
+    of querying each entity type separately. Only fields needed to
+    identify the entities are received.
+
+    Args:
+        project_name (str): Project name.
+        representation_ids (Iterable[str]): Representation ids.
+        chunk_size (Optional[int]): Maximum count of representations
+            queried in one request.
+
+    Returns:
+        dict[str, dict[str, Any]]: Representation entities by id. Parent
+            entities are available under 'version' key of representation,
+            'product' key of version and 'folder' key of product. Parent
+            is 'None' if it was not found.
+    """
+
+    representation_ids = list(set(representation_ids))
+    output = {}
+    if not representation_ids:
+        return output
+
+    con = get_ayon_server_api_connection()
+    for idx in range(0, len(representation_ids), chunk_size):
+        chunk_ids = representation_ids[idx:idx + chunk_size]
+        response = con.query_graphql(
+            _REPRESENTATIONS_HIERARCHY_QUERY,
+            {
+                "projectName": project_name,
+                "representationIds": chunk_ids,
+                "first": len(chunk_ids),
+            }
+        )
+        errors = response.errors
+        if errors:
+            raise RuntimeError(
+                "Failed to query representations hierarchy: {}".format(
+                    errors
+                )
+            )
+        project = response.data["data"]["project"]
+        if not project:
+            continue
+        for edge in project["representations"]["edges"]:
+            node = edge["node"]
+            output[node["id"]] = node
+    return output
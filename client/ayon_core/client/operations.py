@@ -423,6 +423,10 @@ def failed_json_default(value):
 class ServerCreateOperation(CreateOperation):
     """Operation to create an entity.
 
+    Data are converted to server entity without copying values, so they
+    should not be modified until the operation is committed. Json
+    serialization of data is validated on commit.
+
     Args:
         project_name (str): On which project operation will happen.
         entity_type (str): Type of entity on which change happens.
@@ -435,7 +439,6 @@ class ServerCreateOperation(CreateOperation):
 
         if not data:
             data = {}
-        data = copy.deepcopy(data)
         if entity_type == "project":
             raise ValueError("Project cannot be created using operations")
 
@@ -480,28 +483,20 @@ class ServerCreateOperation(CreateOperation):
                 "Unhandled entity type \"{}\"".format(entity_type)
             )
 
-        # Simple check if data can be dumped into json
-        #   - should raise error on 'ObjectId' object
-        try:
-            new_data = json.loads(
-                json.dumps(new_data, default=entity_data_json_default)
-            )
-
-        except:
-            raise ValueError("Couldn't json parse body: {}".format(
-                json.dumps(new_data, default=failed_json_default)
-            ))
-
         super(ServerCreateOperation, self).__init__(
-            project_name, entity_type, new_data
+            project_name, entity_type, None
         )
+        # Converted data are new object, copy is not needed
+        if not new_data:
+            new_data = {}
+        self._data = new_data
 
         if "id" not in self._data:
             self._data["id"] = create_entity_id()
 
         if tasks:
-            copied_tasks = copy.deepcopy(tasks)
-            for task_name, task in copied_tasks.items():
+            for task_name, task in tasks.items():
+                task = dict(task)
                 task["name"] = task_name
                 task["folderId"] = self._data["id"]
                 self.session.create_entity(
@@ -591,16 +586,6 @@ class ServerUpdateOperation(UpdateOperation):
                 "Unhandled entity type \"{}\"".format(entity_type)
             )
 
-        try:
-            new_update_data = json.loads(
-                json.dumps(new_update_data, default=entity_data_json_default)
-            )
-
-        except:
-            raise ValueError("Couldn't json parse body: {}".format(
-                json.dumps(new_update_data, default=failed_json_default)
-            ))
-
         super(ServerUpdateOperation, self).__init__(
             project_name, entity_type, entity_id, new_update_data
         )
@@ -676,11 +661,29 @@ class ServerDeleteOperation(DeleteOperation):
 
 
 class OperationsSession(BaseOperationsSession):
-    def __init__(self, con=None, *args, **kwargs):
+    """Session of operations committed to server.
+
+    Args:
+        con (Optional[ServerAPI]): Server connection.
+        max_operations_per_request (Optional[int]): Maximum number of
+            operations sent in single request. Operations of a project are
+            sent in single request if not set. Operations of each request
+            are processed as a transaction on server, so commit of session
+            with more operations than the limit is not atomic. Operations
+            sent in previous requests are not reverted when a request fails.
+    """
+
+    max_operations_per_request = None
+
+    def __init__(
+        self, con=None, *args, max_operations_per_request=None, **kwargs
+    ):
         super(OperationsSession, self).__init__(*args, **kwargs)
         if con is None:
             con = get_ayon_server_api_connection()
         self._con = con
+        if max_operations_per_request is not None:
+            self.max_operations_per_request = max_operations_per_request
         self._project_cache = {}
         self._nested_operations = collections.defaultdict(list)
 
@@ -706,51 +709,76 @@ class OperationsSession(BaseOperationsSession):
             operations_by_project[operation.project_name].append(operation)
 
         body_by_id = {}
-        results = []
         for project_name, operations in operations_by_project.items():
-            operations_body = []
+            # Each operation is encoded only once, which also validates
+            #   that data can be converted to json
+            encoded_operations = []
             for operation in operations:
                 body = operation.to_server_operation()
-                if body is not None:
-                    try:
-                        json.dumps(body)
-                    except:
-                        raise ValueError("Couldn't json parse body: {}".format(
-                            json.dumps(
-                                body, indent=4, default=failed_json_default
-                            )
-                        ))
-
-                    body_by_id[operation.id] = body
-                    operations_body.append(body)
-
-            if operations_body:
-                result = self._con.post(
-                    "projects/{}/operations".format(project_name),
-                    operations=operations_body,
-                    canFail=False
-                )
-                results.append(result.data)
+                if body is None:
+                    continue
+                try:
+                    encoded_operations.append(json.dumps(
+                        body,
+                        separators=(",", ":"),
+                        default=entity_data_json_default
+                    ))
+                except Exception:
+                    raise ValueError("Couldn't json parse body: {}".format(
+                        json.dumps(
+                            body, indent=4, default=failed_json_default
+                        )
+                    ))
+                body_by_id[operation.id] = body
 
-        for result in results:
-            if result.get("success"):
+            if not encoded_operations:
                 continue
 
-            if "operations" not in result:
-                raise FailedOperations(
-                    "Operation failed. Content: {}".format(str(result))
+            # Operations split to multiple requests are not one transaction
+            chunk_size = self.max_operations_per_request
+            if not chunk_size:
+                chunk_size = len(encoded_operations)
+
+            # Next chunk is not sent if previous failed
+            for idx in range(0, len(encoded_operations), chunk_size):
+                result = self._post_encoded_operations(
+                    project_name, encoded_operations[idx:idx + chunk_size]
                 )
+                self._validate_result(result.data, body_by_id)
 
-            for op_result in result["operations"]:
-                if not op_result["success"]:
-                    operation_id = op_result["id"]
-                    raise FailedOperations((
-                        "Operation \"{}\" failed with data:\n{}\nError: {}."
-                    ).format(
-                        operation_id,
-                        json.dumps(body_by_id[operation_id], indent=4),
-                        op_result.get("error", "unknown"),
-                    ))
+    def _validate_result(self, result, body_by_id):
+        if result.get("success"):
+            return
+
+        if "operations" not in result:
+            raise FailedOperations(
+                "Operation failed. Content: {}".format(str(result))
+            )
+
+        for op_result in result["operations"]:
+            if not op_result["success"]:
+                operation_id = op_result["id"]
+                raise FailedOperations((
+                    "Operation \"{}\" failed with data:\n{}\nError: {}."
+                ).format(
+                    operation_id,
+                    json.dumps(
+                        body_by_id[operation_id],
+                        indent=4,
+                        default=entity_data_json_default
+                    ),
+                    op_result.get("error", "unknown"),
+                ))
+
+    def _post_encoded_operations(self, project_name, encoded_operations):
+        # Request body is joined from already encoded operations
+        body = "{{\"operations\":[{}],\"canFail\":false}}".format(
+            ",".join(encoded_operations)
+        )
+        return self._con.raw_post(
+            "projects/{}/operations".format(project_name),
+            data=body.encode("utf-8"),
+        )
 
     def create_entity(self, project_name, entity_type, data, nested_id=None):
         """Fast access to 'ServerCreateOperation'.
@@ -196,6 +196,16 @@ class BaseOperationsSession(object):
     def __len__(self):
         return len(self._operations)
 
+    @property
+    def operations(self):
+        """Registered operations in order in which they'll happen.
+
+        Returns:
+            List[BaseOperation]: Operations.
+        """
+
+        return list(self._operations)
+
     def add(self, operation):
         """Add operation to be processed.
 
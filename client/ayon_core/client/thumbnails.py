@@ -8,6 +8,9 @@ overflow OpenPype logic it's here for now.
 
 import os
 import time
+import sqlite3
+import threading
+import contextlib
 import collections
 
 import appdirs
@@ -26,13 +29,22 @@ class AYONThumbnailCache:
     thumbnail id validation and file names are thumbnail ids with matching
     extension. Extensions are predefined (.png and .jpeg).
 
+    Size and last access time of each cached thumbnail is stored in sqlite
+    index next to the thumbnails directory. The index is created from files
+    in the directory on first use, after that the directory is not walked
+    anymore. Last access time of a thumbnail is written to the index at
+    most once per 'last_access_update_interval' so cache hits don't write
+    to disk each time. Index rows of files which were removed outside of
+    the cache are dropped when the missing file is looked up or evicted.
+
     Cache has cleanup mechanism which is triggered on initialized by default.
 
     The cleanup has 2 levels:
-    1. soft cleanup which remove all files that are older then 'days_alive'
-    2. max size cleanup which remove all files until the thumbnails folder
-        contains less then 'max_filesize'
-        - this is time consuming so it's not triggered automatically
+    1. soft cleanup which remove all files that were not accessed for
+        'days_alive'
+    2. max size cleanup which remove least recently used files until the
+        thumbnails folder contains less then 'max_filesize'
+        - not triggered automatically
 
     Args:
         cleanup (bool): Trigger soft cleanup (Cleanup expired thumbnails).
@@ -44,9 +56,18 @@ class AYONThumbnailCache:
     # Max size of thumbnail directory (in bytes)
     # - default 2 Gb
     max_filesize = 2 * 1024 * 1024 * 1024
+    index_filename = "thumbnails_index.db"
+    # Minimum time between updates of last access time of a thumbnail
+    #   in index (in seconds)
+    last_access_update_interval = 10 * 60
 
     def __init__(self, cleanup=True):
         self._thumbnails_dir = None
+        self._index_path = None
+        self._index_connection = None
+        self._index_lock = threading.Lock()
+        # Last access time written to index by index key
+        self._last_access_by_key = {}
         self._days_alive_secs = self.days_alive * 24 * 60 * 60
         if cleanup:
             self.cleanup()
@@ -59,32 +80,42 @@ class AYONThumbnailCache:
         """
 
         if self._thumbnails_dir is None:
-            # TODO use generic function
-            directory = appdirs.user_data_dir("AYON", "Ynput")
-            self._thumbnails_dir = os.path.join(directory, "thumbnails")
+            self._thumbnails_dir = os.path.join(
+                self._get_root_dir(), "thumbnails"
+            )
         return self._thumbnails_dir
 
     thumbnails_dir = property(get_thumbnails_dir)
 
+    def get_index_path(self):
+        """Path to sqlite index of cached thumbnails.
+
+        Returns:
+            str: Path to index file.
+        """
+
+        if self._index_path is None:
+            self._index_path = os.path.join(
+                self._get_root_dir(), self.index_filename
+            )
+        return self._index_path
+
     def get_thumbnails_dir_file_info(self):
         """Get information about all files in thumbnails directory.
 
+        Modification time is time of last access to the thumbnail.
+
         Returns:
             List[FileInfo]: List of file information about all files.
         """
 
         thumbnails_dir = self.thumbnails_dir
-        files_info = []
-        if not os.path.exists(thumbnails_dir):
-            return files_info
-
-        for root, _, filenames in os.walk(thumbnails_dir):
-            for filename in filenames:
-                path = os.path.join(root, filename)
-                files_info.append(FileInfo(
-                    path, os.path.getsize(path), os.path.getmtime(path)
-                ))
-        return files_info
+        with self._index_cursor() as cursor:
+            cursor.execute("SELECT path, size, last_access FROM thumbnails")
+            return [
+                FileInfo(os.path.join(thumbnails_dir, path), size, atime)
+                for path, size, atime in cursor.fetchall()
+            ]
 
     def get_thumbnails_dir_size(self, files_info=None):
         """Got full size of thumbnail directory.
@@ -97,16 +128,15 @@ class AYONThumbnailCache:
             int: File size of all files in thumbnail directory.
         """
 
-        if files_info is None:
-            files_info = self.get_thumbnails_dir_file_info()
+        if files_info is not None:
+            return sum(
+                file_info.size
+                for file_info in files_info
+            )
 
-        if not files_info:
-            return 0
-
-        return sum(
-            file_info.size
-            for file_info in files_info
-        )
+        with self._index_cursor() as cursor:
+            cursor.execute("SELECT TOTAL(size) FROM thumbnails")
+            return int(cursor.fetchone()[0])
 
     def cleanup(self, check_max_size=False):
         """Cleanup thumbnails directory.
@@ -125,32 +155,133 @@ class AYONThumbnailCache:
         if check_max_size:
             self._max_size_cleanup(thumbnails_dir)
 
-    def _soft_cleanup(self, thumbnails_dir):
-        current_time = time.time()
+    def _get_root_dir(self):
+        # TODO use generic function
+        return appdirs.user_data_dir("AYON", "Ynput")
+
+    def _get_index_connection(self):
+        if self._index_connection is not None:
+            return self._index_connection
+
+        index_path = self.get_index_path()
+        index_dir = os.path.dirname(index_path)
+        os.makedirs(index_dir, exist_ok=True)
+        index_exists = os.path.exists(index_path)
+        # Connection is shared by threads of this object, access is
+        #   guarded by '_index_lock'
+        connection = sqlite3.connect(
+            index_path, timeout=10, check_same_thread=False
+        )
+        # Write-ahead log does not block readers and with 'NORMAL'
+        #   synchronization does not sync to disk on each commit
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS thumbnails ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL"
+            ")"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS thumbnails_last_access"
+            " ON thumbnails (last_access)"
+        )
+        if not index_exists:
+            self._fill_index(connection)
+        connection.commit()
+        self._index_connection = connection
+        return connection
+
+    def _fill_index(self, connection):
+        """Add files from thumbnails directory to index.
+
+        Used only once when index is created, e.g. for thumbnails cached
+        before the index did exist.
+        """
+
+        thumbnails_dir = self.thumbnails_dir
+        if not os.path.exists(thumbnails_dir):
+            return
+
+        rows = []
         for root, _, filenames in os.walk(thumbnails_dir):
             for filename in filenames:
                 path = os.path.join(root, filename)
-                modification_time = os.path.getmtime(path)
-                if current_time - modification_time > self._days_alive_secs:
-                    os.remove(path)
+                stat = os.stat(path)
+                rows.append((
+                    self._get_index_key(path), stat.st_size, stat.st_mtime
+                ))
+        connection.executemany(
+            "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?)", rows
+        )
+
+    @contextlib.contextmanager
+    def _index_cursor(self):
+        with self._index_lock:
+            connection = self._get_index_connection()
+            cursor = connection.cursor()
+            try:
+                yield cursor
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def _get_index_key(self, path):
+        return os.path.relpath(path, self.thumbnails_dir).replace("\\", "/")
+
+    def _remove_indexed_files(self, cursor, paths):
+        thumbnails_dir = self.thumbnails_dir
+        for path in paths:
+            try:
+                os.remove(os.path.join(thumbnails_dir, path))
+            except FileNotFoundError:
+                pass
+        self._remove_index_rows(cursor, paths)
+
+    def _remove_index_rows(self, cursor, paths):
+        for path in paths:
+            self._last_access_by_key.pop(path, None)
+        cursor.executemany(
+            "DELETE FROM thumbnails WHERE path = ?",
+            [(path, ) for path in paths]
+        )
+
+    def _soft_cleanup(self, thumbnails_dir):
+        expire_time = time.time() - self._days_alive_secs
+        with self._index_cursor() as cursor:
+            cursor.execute(
+                "SELECT path FROM thumbnails WHERE last_access < ?",
+                (expire_time, )
+            )
+            paths = [row[0] for row in cursor.fetchall()]
+            self._remove_indexed_files(cursor, paths)
 
     def _max_size_cleanup(self, thumbnails_dir):
-        files_info = self.get_thumbnails_dir_file_info()
-        size = self.get_thumbnails_dir_size(files_info)
+        # Rows of files removed outside of the cache are counted to the size
+        #   until they're evicted or the missing file is looked up
+        size = self.get_thumbnails_dir_size()
         if size < self.max_filesize:
             return
 
-        sorted_file_info = collections.deque(
-            sorted(files_info, key=lambda item: item.modification_time)
-        )
         diff = size - self.max_filesize
-        while diff > 0:
-            if not sorted_file_info:
-                break
-
-            file_info = sorted_file_info.popleft()
-            diff -= file_info.size
-            os.remove(file_info.path)
+        with self._index_cursor() as cursor:
+            # Least recently used files are removed first
+            cursor.execute(
+                "SELECT path, size FROM thumbnails ORDER BY last_access"
+            )
+            paths = []
+            while diff > 0:
+                row = cursor.fetchone()
+                if row is None:
+                    break
+                path, file_size = row
+                paths.append(path)
+                diff -= file_size
+            self._remove_indexed_files(cursor, paths)
 
     def get_thumbnail_filepath(self, project_name, thumbnail_id):
         """Get thumbnail by thumbnail id.
@@ -167,6 +298,7 @@ class AYONThumbnailCache:
         if not thumbnail_id:
             return None
 
+        index_keys = []
         for ext in (
             ".png",
             ".jpeg",
@@ -175,9 +307,45 @@ class AYONThumbnailCache:
                 self.thumbnails_dir, project_name, thumbnail_id + ext
             )
             if os.path.exists(filepath):
+                self._update_last_access(filepath)
                 return filepath
+            index_keys.append(self._get_index_key(filepath))
+
+        # Drop index rows of files removed outside of the cache
+        with self._index_cursor() as cursor:
+            cursor.execute(
+                "SELECT path FROM thumbnails WHERE path IN (?, ?)",
+                index_keys
+            )
+            paths = [row[0] for row in cursor.fetchall()]
+            if paths:
+                self._remove_index_rows(cursor, paths)
         return None
 
+    def _update_last_access(self, filepath):
+        index_key = self._get_index_key(filepath)
+        current_time = time.time()
+        last_access = self._last_access_by_key.get(index_key)
+        if (
+            last_access is not None
+            and current_time - last_access < self.last_access_update_interval
+        ):
+            return
+
+        self._last_access_by_key[index_key] = current_time
+        with self._index_cursor() as cursor:
+            cursor.execute(
+                "UPDATE thumbnails SET last_access = ? WHERE path = ?",
+                (current_time, index_key)
+            )
+            if cursor.rowcount:
+                return
+            # File was added to directory without index
+            cursor.execute(
+                "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?)",
+                (index_key, os.path.getsize(filepath), current_time)
+            )
+
     def get_project_dir(self, project_name):
         """Path to root directory for specific project.
 
@@ -193,8 +361,8 @@ class AYONThumbnailCache:
 
     def make_sure_project_dir_exists(self, project_name):
         project_dir = self.get_project_dir(project_name)
-        if not os.path.exists(project_dir):
-            os.makedirs(project_dir)
+        # Thumbnails can be stored from multiple threads at once
+        os.makedirs(project_dir, exist_ok=True)
         return project_dir
 
     def store_thumbnail(self, project_name, thumbnail_id, content, mime_type):
@@ -225,5 +393,16 @@ class AYONThumbnailCache:
 
         current_time = time.time()
         os.utime(thumbnail_path, (current_time, current_time))
+        index_key = self._get_index_key(thumbnail_path)
+        self._last_access_by_key[index_key] = current_time
+        with self._index_cursor() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?)",
+                (
+                    index_key,
+                    len(content),
+                    current_time
+                )
+            )
 
         return thumbnail_path
@@ -1,5 +1,6 @@
 import os
 import uuid
+import weakref
 
 import ayon_api
 
@@ -10,6 +11,22 @@ class _GlobalCache:
     initialized = False
 
 
+class _SchemaCache:
+    # Data based on attributes schema for each server connection
+    cache_by_con = weakref.WeakKeyDictionary()
+
+
+def _get_schema_cache(con):
+    cache = _SchemaCache.cache_by_con.get(con)
+    if cache is None:
+        cache = {
+            "attributes": {},
+            "fields_mapping": {},
+        }
+        _SchemaCache.cache_by_con[con] = cache
+    return cache
+
+
 def get_ayon_server_api_connection():
     if _GlobalCache.initialized:
         con = ayon_api.get_server_api_connection()
@@ -28,6 +45,63 @@ def get_ayon_server_api_connection():
     return con
 
 
+def get_attributes_for_type(con, entity_type):
+    """Attributes schema of entity type cached for server connection.
+
+    Attributes are queried from server only once per connection. Output
+    is shared between calls and must not be modified. Use
+    'reset_attributes_schema_cache' when attributes on server changed.
+
+    Args:
+        con (ayon_api.ServerAPI): Server connection.
+        entity_type (str): Entity type, e.g. 'folder' or 'version'.
+
+    Returns:
+        dict[str, dict[str, Any]]: Attribute definitions by attribute name.
+    """
+
+    attributes_by_type = _get_schema_cache(con)["attributes"]
+    attributes = attributes_by_type.get(entity_type)
+    if attributes is None:
+        attributes = con.get_attributes_for_type(entity_type)
+        attributes_by_type[entity_type] = attributes
+    return attributes
+
+
+def get_fields_mapping_cache(con):
+    """Cache of converted v3 fields for server connection.
+
+    Converted fields depend on attributes schema so the cache is reset
+    together with attributes by 'reset_attributes_schema_cache'.
+
+    Args:
+        con (ayon_api.ServerAPI): Server connection.
+
+    Returns:
+        dict[Any, Any]: Mutable cache of converted fields.
+    """
+
+    return _get_schema_cache(con)["fields_mapping"]
+
+
+def reset_attributes_schema_cache(con=None):
+    """Reset cached attributes schema and data based on it.
+
+    Args:
+        con (Optional[ayon_api.ServerAPI]): Reset cache only of the
+            connection. Cache of all connections is reset if not passed.
+    """
+
+    if con is None:
+        cons = list(_SchemaCache.cache_by_con.keys())
+    else:
+        cons = [con]
+
+    for con in cons:
+        _SchemaCache.cache_by_con.pop(con, None)
+        con.reset_attributes_schema()
+
+
 def create_entity_id():
     return uuid.uuid1().hex
 
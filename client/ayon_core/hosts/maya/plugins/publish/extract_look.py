@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 """Maya look extractor."""
-import sys
-from abc import ABCMeta, abstractmethod
+from abc import ABCMeta
 from collections import OrderedDict
 import contextlib
 import json
 import logging
 import os
+import platform
 import tempfile
 import six
 import attr
@@ -15,13 +15,19 @@ import pyblish.api
 
 from maya import cmds  # noqa
 
+from ayon_core.client import get_last_version_by_subset_name
 from ayon_core.lib import (
     find_executable,
     source_hash,
-    run_subprocess,
     get_oiio_tool_args,
     ToolNotFoundError,
 )
+from ayon_core.lib.texture_processing import (
+    TextureCache,
+    TextureConversionJob,
+    TextureConversionQueue,
+    run_texture_conversion,
+)
 
 from ayon_core.pipeline import publish, KnownPublishError
 from ayon_core.hosts.maya.api import lib
@@ -43,23 +49,9 @@ class TextureResult(object):
     file_hash = attr.ib()
     # The transfer mode, e.g. COPY or HARDLINK
     transfer_mode = attr.ib()
-
-
-def find_paths_by_hash(texture_hash):
-    """Find the texture hash key in the dictionary.
-
-    All paths that originate from it.
-
-    Args:
-        texture_hash (str): Hash of the texture.
-
-    Return:
-        str: path to texture if found.
-
-    """
-    raise KnownPublishError(
-        "This is a bug. \"find_paths_by_hash\" is not compatible with AYON."
-    )
+    # The texture is from studio texture cache and can be hardlinked
+    # even when copy is forced
+    cached = attr.ib(default=False)
 
 
 @contextlib.contextmanager
@@ -116,7 +108,33 @@ class TextureProcessor:
         """
         pass
 
-    @abstractmethod
+    def prepare(self,
+                source,
+                colorspace,
+                color_management,
+                staging_dir):
+        """Prepare processing of the `source` texture.
+
+        Processors converting textures with an external tool should return
+        `TextureConversionJob` with `TextureResult` as its result. Jobs can
+        run concurrently with conversions of other textures.
+
+        Default implementation processes the texture right away.
+
+        Args:
+            source (str): Path to source file.
+            colorspace (str): Colorspace of the source file.
+            color_management (dict): Maya Color management data from
+                `lib.get_color_management_preferences`
+            staging_dir (str): Output directory to write to.
+
+        Returns:
+            Union[TextureResult, TextureConversionJob]: The resulting
+                texture information or job converting the texture.
+
+        """
+        return self.process(source, colorspace, color_management, staging_dir)
+
     def process(self,
                 source,
                 colorspace,
@@ -124,7 +142,7 @@ class TextureProcessor:
                 staging_dir):
         """Process the `source` texture.
 
-        Must be implemented on inherited class.
+        Inherited class must implement `prepare` or this method.
 
         This must always return a TextureResult even when it does not generate
         a texture. If it doesn't generate a texture then it should return a
@@ -141,7 +159,36 @@ class TextureProcessor:
             TextureResult: The resulting texture information.
 
         """
-        pass
+        if type(self).prepare is TextureProcessor.prepare:
+            raise NotImplementedError(
+                "{} must implement 'prepare' or 'process'".format(self)
+            )
+
+        prepared = self.prepare(
+            source, colorspace, color_management, staging_dir
+        )
+        if isinstance(prepared, TextureConversionJob):
+            return self.run_job(prepared)
+        return prepared
+
+    def run_job(self, job):
+        """Run texture conversion job right away.
+
+        Args:
+            job (TextureConversionJob): Job prepared by this processor.
+
+        Returns:
+            TextureResult: The resulting texture information.
+
+        """
+        self.log.debug(" ".join(job.args))
+        try:
+            run_texture_conversion(job, self.log)
+        except Exception:
+            self.log.error("Texture conversion failed: {}".format(job),
+                           exc_info=True)
+            raise
+        return job.result
 
     def __repr__(self):
         # Log instance as class name
@@ -153,7 +200,7 @@ class MakeRSTexBin(TextureProcessor):
 
     extension = ".rstexbin"
 
-    def process(self,
+    def prepare(self,
                 source,
                 colorspace,
                 color_management,
@@ -196,19 +243,17 @@ class MakeRSTexBin(TextureProcessor):
         basename, ext = os.path.splitext(source)
         destination = "{}{}".format(basename, self.extension)
 
-        self.log.debug(" ".join(subprocess_args))
-        try:
-            run_subprocess(subprocess_args, logger=self.log)
-        except Exception:
-            self.log.error("Texture .rstexbin conversion failed",
-                           exc_info=True)
-            six.reraise(*sys.exc_info())
-
-        return TextureResult(
-            path=destination,
-            file_hash=texture_hash,
-            colorspace=colorspace,
-            transfer_mode=COPY
+        return TextureConversionJob(
+            source,
+            destination,
+            subprocess_args,
+            texture_hash,
+            result=TextureResult(
+                path=destination,
+                file_hash=texture_hash,
+                colorspace=colorspace,
+                transfer_mode=COPY
+            )
         )
 
     @staticmethod
@@ -269,14 +314,14 @@ class MakeTX(TextureProcessor):
 
         self.extra_args = extra_args
 
-    def process(self,
+    def prepare(self,
                 source,
                 colorspace,
                 color_management,
                 staging_dir):
-        """Process the texture.
+        """Prepare conversion of the texture.
 
-        This function requires the `maketx` executable to be available in an
+        Conversion requires the `maketx` executable to be available in an
         OpenImageIO toolset detectable by OpenPype.
 
         Args:
@@ -287,7 +332,8 @@ class MakeTX(TextureProcessor):
             staging_dir (str): Output directory to write to.
 
         Returns:
-            TextureResult: The resulting texture information.
+            Union[TextureResult, TextureConversionJob]: The resulting
+                texture information or job converting the texture.
 
         """
 
@@ -381,19 +427,18 @@ class MakeTX(TextureProcessor):
         env = os.environ.copy()
         env.pop("OCIO", None)
 
-        self.log.debug(" ".join(subprocess_args))
-        try:
-            run_subprocess(subprocess_args, env=env)
-        except Exception:
-            self.log.error("Texture maketx conversion failed",
-                           exc_info=True)
-            raise
-
-        return TextureResult(
-            path=destination,
-            file_hash=texture_hash,
-            colorspace=render_colorspace,
-            transfer_mode=COPY
+        return TextureConversionJob(
+            source,
+            destination,
+            subprocess_args,
+            texture_hash,
+            env=env,
+            result=TextureResult(
+                path=destination,
+                file_hash=texture_hash,
+                colorspace=render_colorspace,
+                transfer_mode=COPY
+            )
         )
 
     @staticmethod
@@ -421,6 +466,11 @@ class ExtractLook(publish.Extractor):
     order = pyblish.api.ExtractorOrder + 0.2
     scene_type = "ma"
     look_data_type = "json"
+    # Maximum count of texture conversions running at the same time
+    texture_processing_workers = 4
+    # Studio cache of converted textures with keys 'enabled', 'root'
+    #   (path per platform) and 'max_size_gb'
+    texture_cache = {}
 
     def get_maya_scene_type(self, instance):
         """Get Maya scene type from settings.
@@ -502,6 +552,7 @@ class ExtractLook(publish.Extractor):
         hardlinks = results["fileHardlinks"]
         hashes = results["fileHashes"]
         remap = results["attrRemap"]
+        conversion_jobs = results["conversionJobs"]
 
         # Extract in correct render layer
         self.log.debug("Extracting look maya scene file: {}".format(maya_path))
@@ -539,6 +590,17 @@ class ExtractLook(publish.Extractor):
         with open(json_path, "w") as f:
             json.dump(data, f)
 
+        # Textures are converted while the scene is exported
+        if conversion_jobs:
+            self.log.debug("Waiting for {} texture conversions".format(
+                len(conversion_jobs)))
+            for job in conversion_jobs:
+                job.wait()
+
+            texture_cache = self._get_conversion_queue(context).cache
+            if texture_cache is not None:
+                texture_cache.evict()
+
         if "files" not in instance.data:
             instance.data["files"] = []
         if "hardlinks" not in instance.data:
@@ -603,10 +665,30 @@ class ExtractLook(publish.Extractor):
         might be included more than once amongst the resources as they could
         be the input file to multiple nodes.
 
+        Texture conversions are started in background and are returned in
+        'conversionJobs'. Caller must wait for them before files are
+        transferred.
+
         """
 
         resources = instance.data["resources"]
         color_management = lib.get_color_management_preferences()
+        conversion_queue = self._get_conversion_queue(instance.context)
+        published_paths_by_hash = {}
+        can_hardlink_cache = False
+        if processors:
+            published_paths_by_hash = self._get_published_texture_paths(
+                instance
+            )
+            texture_cache = conversion_queue.cache
+            # Hardlinks are not created on windows, see 'force_copy' below
+            if (
+                texture_cache is not None
+                and platform.system().lower() != "windows"
+            ):
+                can_hardlink_cache = texture_cache.can_hardlink_to(
+                    instance.data["resourcesDir"]
+                )
 
         # TODO: Temporary disable all hardlinking, due to the feature not being
         # used or properly working.
@@ -638,6 +720,7 @@ class ExtractLook(publish.Extractor):
         hardlinks = []
         hashes = {}
         remap = OrderedDict()
+        conversion_jobs = []
         for resource in resources:
             colorspace = resource["color_space"]
 
@@ -678,7 +761,11 @@ class ExtractLook(publish.Extractor):
                     staging_dir=staging_dir,
                     force_copy=force_copy,
                     color_management=color_management,
-                    colorspace=colorspace
+                    colorspace=colorspace,
+                    conversion_queue=conversion_queue,
+                    conversion_jobs=conversion_jobs,
+                    published_paths_by_hash=published_paths_by_hash,
+                    can_hardlink_cache=can_hardlink_cache
                 )
 
                 # Set the resulting color space on the resource
@@ -693,7 +780,10 @@ class ExtractLook(publish.Extractor):
 
                 source = texture_result.path
                 destination = get_resource_destination_cached(source)
-                if force_copy or texture_result.transfer_mode == COPY:
+                if (
+                    texture_result.transfer_mode == COPY
+                    or (force_copy and not texture_result.cached)
+                ):
                     transfers.append((source, destination))
                     self.log.debug('file will be copied {} -> {}'.format(
                         source, destination))
@@ -738,6 +828,7 @@ class ExtractLook(publish.Extractor):
             "fileHardlinks": hardlinks,
             "fileHashes": hashes,
             "attrRemap": remap,
+            "conversionJobs": conversion_jobs,
         }
 
     def get_resource_destination(self, filepath, resources_dir, processors):
@@ -773,21 +864,95 @@ class ExtractLook(publish.Extractor):
             resources_dir, basename + ext
         )
 
-    def _get_existing_hashed_texture(self, texture_hash):
-        """Return the first found filepath from a texture hash"""
+    def _get_conversion_queue(self, context):
+        """Texture conversion queue shared by instances of the publish.
+
+        Identical conversions of textures used by multiple instances are
+        processed only once.
+        """
+        conversion_queue = context.data.get("textureConversionQueue")
+        if conversion_queue is None:
+            conversion_queue = TextureConversionQueue(
+                max_workers=self.texture_processing_workers,
+                logger=self.log,
+                cache=self._get_texture_cache()
+            )
+            context.data["textureConversionQueue"] = conversion_queue
+        return conversion_queue
+
+    def _get_texture_cache(self):
+        """Studio texture cache defined in settings.
+
+        Returns:
+            Union[TextureCache, None]: Texture cache or None if cache is
+                disabled or root is not set for current platform.
+        """
+        cache_settings = self.texture_cache or {}
+        if not cache_settings.get("enabled"):
+            return None
+
+        root = cache_settings.get("root")
+        if isinstance(root, dict):
+            root = root.get(platform.system().lower())
+        if not root:
+            self.log.warning(
+                "Texture cache is enabled but root is not set."
+            )
+            return None
+
+        try:
+            root = root.format(**os.environ)
+        except (KeyError, IndexError, ValueError):
+            self.log.warning(
+                "Failed to fill texture cache root: {}".format(root),
+                exc_info=True
+            )
+            return None
+
+        max_bytes = None
+        max_size_gb = cache_settings.get("max_size_gb")
+        if max_size_gb:
+            max_bytes = int(max_size_gb * (1024 ** 3))
+        return TextureCache(root, max_bytes=max_bytes, logger=self.log)
+
+    def _get_published_texture_paths(self, instance):
+        """Published textures of last version of the product by hash.
+
+        Uses 'sourceHashes' stored on version by previous publish.
+
+        Returns:
+            dict[str, str]: Published texture paths by texture hash.
+        """
+        asset_doc = instance.data.get("assetEntity")
+        product_name = instance.data.get("productName")
+        if not asset_doc or not product_name:
+            return {}
+
+        version_doc = get_last_version_by_subset_name(
+            instance.context.data["projectName"],
+            product_name,
+            asset_id=asset_doc["_id"],
+            fields=["_id", "data.sourceHashes"]
+        )
+        if not version_doc:
+            return {}
+        return version_doc.get("data", {}).get("sourceHashes") or {}
+
+    def _get_existing_hashed_texture(self, texture_hash,
+                                     published_paths_by_hash):
+        """Return published filepath of a texture hash if exists"""
 
         # If source has been published before with the same settings,
-        # then don't reprocess but hardlink from the original
-        existing = find_paths_by_hash(texture_hash)
-        if existing:
-            source = next((p for p in existing if os.path.exists(p)), None)
-            if source:
-                return source
-            else:
-                self.log.warning(
-                    "Paths not found on disk, "
-                    "skipping hardlink: {}".format(existing)
-                )
+        # then don't reprocess but transfer from the published file
+        existing = published_paths_by_hash.get(texture_hash)
+        if not existing:
+            return None
+        if os.path.exists(existing):
+            return existing
+        self.log.warning(
+            "Published texture not found on disk, "
+            "skipping reuse: {}".format(existing)
+        )
 
     def _process_texture(self,
                          filepath,
@@ -795,14 +960,19 @@ class ExtractLook(publish.Extractor):
                          staging_dir,
                          force_copy,
                          color_management,
-                         colorspace):
+                         colorspace,
+                         conversion_queue=None,
+                         conversion_jobs=None,
+                         published_paths_by_hash=None,
+                         can_hardlink_cache=False):
         """Process a single texture file on disk for publishing.
 
         This will:
             1. Check whether it's already published, if so it will do hardlink
                 (if the texture hash is found and force copy is not enabled)
             2. It will process the texture using the supplied texture
-                processors like MakeTX and MakeRSTexBin if enabled.
+                processors like MakeTX and MakeRSTexBin if enabled. Texture
+                converted by processor in previous version is reused.
             3. Compute the destination path for the source file.
 
         Args:
@@ -816,10 +986,22 @@ class ExtractLook(publish.Extractor):
                 `lib.get_color_management_preferences`
             colorspace (str): The source colorspace of the resources this
                 texture belongs to.
+            conversion_queue (Optional[TextureConversionQueue]): Queue
+                running texture conversions. Conversion runs right away if
+                not passed.
+            conversion_jobs (Optional[list[TextureConversionJob]]): Started
+                conversion jobs are added to the list.
+            published_paths_by_hash (Optional[dict[str, str]]): Published
+                textures by texture hash.
+            can_hardlink_cache (bool): Textures from texture cache of
+                conversion queue can be hardlinked to publish.
 
         Returns:
-            TextureResult: The texture result information.
+            TextureResult: The texture result information. Texture file
+                is available once the conversion job is finished.
         """
+        if published_paths_by_hash is None:
+            published_paths_by_hash = {}
 
         if len(processors) > 1:
             raise KnownPublishError(
@@ -832,24 +1014,67 @@ class ExtractLook(publish.Extractor):
                 filepath, processor
             ))
 
-            processed_result = processor.process(filepath,
-                                                 colorspace,
-                                                 color_management,
-                                                 staging_dir)
-            if not processed_result:
+            prepared = processor.prepare(filepath,
+                                         colorspace,
+                                         color_management,
+                                         staging_dir)
+            if not prepared:
                 raise RuntimeError("Texture Processor {} returned "
                                    "no result.".format(processor))
-            self.log.debug("Generated processed "
-                           "texture: {}".format(processed_result.path))
+
+            if not isinstance(prepared, TextureConversionJob):
+                self.log.debug("Generated processed "
+                               "texture: {}".format(prepared.path))
+                return prepared
+
+            processed_result = prepared.result
+            existing = self._get_existing_hashed_texture(
+                prepared.texture_hash, published_paths_by_hash)
+            if existing:
+                self.log.debug("Reusing published processed "
+                               "texture: {}".format(existing))
+                return TextureResult(
+                    path=existing,
+                    file_hash=processed_result.file_hash,
+                    colorspace=processed_result.colorspace,
+                    transfer_mode=COPY
+                )
+
+            texture_cache = None
+            if conversion_queue is not None:
+                texture_cache = conversion_queue.cache
+            if texture_cache is not None:
+                cached_path = texture_cache.get(prepared)
+                if cached_path:
+                    self.log.debug("Reusing cached processed "
+                                   "texture: {}".format(cached_path))
+                    return TextureResult(
+                        path=cached_path,
+                        file_hash=processed_result.file_hash,
+                        colorspace=processed_result.colorspace,
+                        transfer_mode=(
+                            HARDLINK if can_hardlink_cache else COPY
+                        ),
+                        cached=True
+                    )
+
+            if conversion_queue is None:
+                return processor.run_job(prepared)
+
+            self.log.debug(" ".join(prepared.args))
+            job = conversion_queue.submit(prepared)
+            if conversion_jobs is not None:
+                conversion_jobs.append(job)
 
             # TODO: Currently all processors force copy instead of allowing
             #       hardlinks using source hashes. This should be refactored
-            return processed_result
+            return job.result
 
         # No texture processing for this file
         texture_hash = source_hash(filepath)
         if not force_copy:
-            existing = self._get_existing_hashed_texture(filepath)
+            existing = self._get_existing_hashed_texture(
+                texture_hash, published_paths_by_hash)
             if existing:
                 self.log.debug("Found hash in database, preparing hardlink..")
                 return TextureResult(
@@ -4,6 +4,9 @@ from copy import deepcopy
 from ayon_core.client import get_asset_by_id
 from ayon_core.pipeline.create import CreatorError
 
+# Key of clip metadata with id used to find the clip in shared timeline
+CLIP_ID_METADATA_KEY = "ayon_clip_id"
+
 
 class ShotMetadataSolver:
     """ Solving hierarchical metadata
@@ -29,6 +32,8 @@ class ShotMetadataSolver:
         }
         self.shot_add_tasks = []
         self.log = logger
+        # Parents of selected asset are same for all clips of editorial
+        self._parents_by_asset_id = {}
 
     def update_data(
         self,
@@ -41,6 +46,15 @@ class ShotMetadataSolver:
         self.shot_rename = shot_rename
         self.shot_hierarchy = shot_hierarchy
         self.shot_add_tasks = shot_add_tasks
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clear cached parents of selected assets.
+
+        Should be called before processing of new editorial, so changes
+            of hierarchy are reflected.
+        """
+        self._parents_by_asset_id = {}
 
     def _rename_template(self, data):
         """Shot renaming function
@@ -313,7 +327,13 @@ class ShotMetadataSolver:
         formatting_data = self._generate_tokens(shot_name, source_data)
 
         # generate parents from selected asset
-        parents = self._get_parents_from_selected_asset(asset_doc, project_doc)
+        parents = self._parents_by_asset_id.get(asset_doc["_id"])
+        if parents is None:
+            parents = self._get_parents_from_selected_asset(
+                asset_doc, project_doc)
+            self._parents_by_asset_id[asset_doc["_id"]] = parents
+        # Parents may be modified by settings
+        parents = list(parents)
 
         if self.shot_rename["enabled"]:
             shot_name = self._rename_template(formatting_data)
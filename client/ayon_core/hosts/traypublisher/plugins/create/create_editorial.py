@@ -1,4 +1,5 @@
 import os
+from uuid import uuid4
 from copy import deepcopy
 import opentimelineio as otio
 
@@ -11,6 +12,7 @@ from ayon_core.hosts.traypublisher.api.plugin import (
     HiddenTrayPublishCreator
 )
 from ayon_core.hosts.traypublisher.api.editorial import (
+    CLIP_ID_METADATA_KEY,
     ShotMetadataSolver
 )
 from ayon_core.pipeline import CreatedInstance
@@ -27,7 +29,6 @@ from ayon_core.lib import (
     UILabelDef
 )
 
-
 CLIP_ATTR_DEFS = [
     EnumDef(
         "fps",
@@ -198,6 +199,7 @@ or updating already created. Publishing will create OTIO file.
 
         asset_name = instance_data["folderPath"]
         asset_doc = get_asset_by_name(self.project_name, asset_name)
+        project_doc = get_project(self.project_name)
 
         if pre_create_data["fps"] == "from_selection":
             # get asset doc data attributes
@@ -217,6 +219,23 @@ or updating already created. Publishing will create OTIO file.
             sequence_path_data, multi=True)
         media_path = self._get_path_from_file_data(media_path_data)
 
+        # Data used to solve shot metadata are same for all clips
+        self._shot_metadata_solver.clear_cache()
+        shot_source_data = {
+            "anatomy_data": {
+                "project": {
+                    "name": self.project_name,
+                    "code": project_doc["data"]["code"]
+                },
+                "parent": asset_name,
+                "app": self.host_name
+            },
+            "selected_asset_doc": asset_doc,
+            "project_doc": project_doc
+        }
+        # Media file is probed only once for all sequence files
+        media_data = self._get_media_source_metadata(media_path)
+
         first_otio_timeline = None
         for seq_path in sequence_paths:
             # get otio timeline
@@ -234,7 +253,9 @@ or updating already created. Publishing will create OTIO file.
             self._get_clip_instances(
                 otio_timeline,
                 media_path,
+                media_data,
                 clip_instance_properties,
+                shot_source_data,
                 allowed_product_type_presets,
                 os.path.basename(seq_path),
                 first_otio_timeline
@@ -334,7 +355,9 @@ or updating already created. Publishing will create OTIO file.
         self,
         otio_timeline,
         media_path,
+        media_data,
         instance_data,
+        shot_source_data,
         product_type_presets,
         sequence_file_name,
         first_otio_timeline=None
@@ -344,7 +367,9 @@ or updating already created. Publishing will create OTIO file.
         Args:
             otio_timeline (otio.Timeline): otio timeline object
             media_path (str): media file path string
+            media_data (dict): media metadata
             instance_data (dict): clip instance data
+            shot_source_data (dict): data for shot metadata solver
             product_type_presets (list): list of dict settings product presets
         """
 
@@ -354,9 +379,6 @@ or updating already created. Publishing will create OTIO file.
             if track.kind == "Video"
         ]
 
-        # media data for audio stream and reference solving
-        media_data = self._get_media_source_metadata(media_path)
-
         for track in tracks:
             # set track name
             track.name = f"{sequence_file_name} - {otio_timeline.name}"
@@ -373,6 +395,8 @@ or updating already created. Publishing will create OTIO file.
                 if not self._validate_clip_for_processing(otio_clip):
                     continue
 
+                # mark clip so it can be found in shared otio timeline
+                otio_clip.metadata[CLIP_ID_METADATA_KEY] = str(uuid4())
 
                 # get available frames info to clip data
                 self._create_otio_reference(otio_clip, media_path, media_data)
@@ -383,6 +407,7 @@ or updating already created. Publishing will create OTIO file.
                 base_instance_data = self._get_base_instance_data(
                     otio_clip,
                     instance_data,
+                    shot_source_data,
                     track_start_frame
                 )
 
@@ -399,10 +424,12 @@ or updating already created. Publishing will create OTIO file.
                     ):
                         continue
 
-                    instance = self._make_product_instance(
+                    # created instance makes its own copy of data and only
+                    #   top level keys are changed
+                    self._make_product_instance(
                         otio_clip,
                         product_type_preset,
-                        deepcopy(base_instance_data),
+                        dict(base_instance_data),
                         parenting_data
                     )
 
@@ -537,8 +564,9 @@ or updating already created. Publishing will create OTIO file.
 
         # add file extension filter only if it is not shot product type
         if product_type == "shot":
-            instance_data["otioClip"] = (
-                otio.adapters.write_to_string(otio_clip))
+            # clip is found by id in otio timeline of editorial instance
+            instance_data["otioClipId"] = (
+                otio_clip.metadata[CLIP_ID_METADATA_KEY])
             c_instance = self.create_context.creators[
                 "editorial_shot"].create(
                     instance_data)
@@ -605,6 +633,7 @@ or updating already created. Publishing will create OTIO file.
         self,
         otio_clip,
         instance_data,
+        shot_source_data,
         track_start_frame,
     ):
         """Factoring basic set of instance data.
@@ -612,6 +641,7 @@ or updating already created. Publishing will create OTIO file.
         Args:
             otio_clip (otio.Clip): otio clip object
             instance_data (dict): precreate instance data
+            shot_source_data (dict): data for shot metadata solver
             track_start_frame (int): track start frame
 
         Returns:
@@ -628,23 +658,9 @@ or updating already created. Publishing will create OTIO file.
 
         # basic unique asset name
         clip_name = os.path.splitext(otio_clip.name)[0]
-        project_doc = get_project(self.project_name)
 
         shot_name, shot_metadata = self._shot_metadata_solver.generate_data(
-            clip_name,
-            {
-                "anatomy_data": {
-                    "project": {
-                        "name": self.project_name,
-                        "code": project_doc["data"]["code"]
-                    },
-                    "parent": parent_asset_name,
-                    "app": self.host_name
-                },
-                "selected_asset_doc": get_asset_by_name(
-                    self.project_name, parent_asset_name),
-                "project_doc": project_doc
-            }
+            clip_name, shot_source_data
         )
 
         timing_data = self._get_timing_data(
@@ -2,6 +2,10 @@ from pprint import pformat
 import pyblish.api
 import opentimelineio as otio
 
+from ayon_core.hosts.traypublisher.api.editorial import (
+    CLIP_ID_METADATA_KEY
+)
+
 
 class CollectShotInstance(pyblish.api.InstancePlugin):
     """ Collect shot instances
@@ -66,6 +70,10 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
             otio.Clip: otio clip object
         """
         context = instance.context
+        clip_id = instance.data.get("otioClipId")
+        if clip_id:
+            return self._get_otio_clips_by_id(context)[clip_id]
+
         # convert otio clip from string to object
         otio_clip_string = instance.data.pop("otioClip")
         otio_clip = otio.adapters.read_from_string(
@@ -84,6 +92,32 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
 
         return otio_clip
 
+    def _get_otio_clips_by_id(self, context):
+        """Clips of shared otio timeline by their id.
+
+        Mapping is created only once per context.
+
+        Args:
+            context (pyblish.api.Context): publishing context
+
+        Returns:
+            dict[str, otio.Clip]: otio clips by id stored in metadata
+        """
+        clips_by_id = context.data.get("otioClipsById")
+        if clips_by_id is not None:
+            return clips_by_id
+
+        clips_by_id = {}
+        otio_timeline = context.data["otioTimeline"]
+        for clip in otio_timeline.each_child(
+            descended_from_type=otio.schema.Clip
+        ):
+            clip_id = clip.metadata.get(CLIP_ID_METADATA_KEY)
+            if clip_id and clip.parent().kind == "Video":
+                clips_by_id[clip_id] = clip
+        context.data["otioClipsById"] = clips_by_id
+        return clips_by_id
+
     def _distribute_shared_data(self, instance):
         """ Distribute all defined keys.
 
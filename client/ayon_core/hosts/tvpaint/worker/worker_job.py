@@ -3,7 +3,6 @@ import tempfile
 import inspect
 import copy
 import json
-import time
 from uuid import uuid4
 from abc import ABCMeta, abstractmethod, abstractproperty
 
@@ -379,6 +378,10 @@ class TVPaintCommands:
 
 class SenderTVPaintCommands(TVPaintCommands):
     """Sender implementation of TVPaint Commands."""
+    # Timeout of connection to job queue server when waiting for job,
+    #   server sends keepalive message each 15 seconds
+    job_wait_timeout = 60
+
     def _prepare_workfile(self, workfile):
         """Remove job queue root from workfile path.
 
@@ -443,14 +446,12 @@ class SenderTVPaintCommands(TVPaintCommands):
             JobFailed: When job was finished but not successfully.
         """
         job_id = self._send_job()
-        while True:
-            job_status = self._job_queue_module.get_job_status(job_id)
-            if job_status["done"]:
-                break
-            time.sleep(1)
+        job_status = self._job_queue_module.wait_for_job(
+            job_id, timeout=self.job_wait_timeout
+        )
 
         # Check if job state is done
-        if job_status["state"] != "done":
+        if job_status.get("state") != "done":
             raise JobFailed(job_status)
 
         self.set_result(job_status["result"])
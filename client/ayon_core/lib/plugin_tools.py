@@ -144,6 +144,8 @@ def source_hash(filepath, *args):
     """
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
+    # Single 'stat' call instead of 'getmtime' and 'getsize'
+    stat = os.stat(filepath)
+    time = str(stat.st_mtime)
+    size = str(stat.st_size)
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
@@ -0,0 +1,531 @@
+"""Concurrent conversion of textures by external tools.
+
+Texture conversion tools like 'maketx' run as separate processes, so
+running multiple of them at the same time from worker threads converts
+textures in parallel without blocking the host process.
+
+Conversion jobs are identified by source path and hash of the source
+file with conversion arguments. Identical job added to the same queue
+again, e.g. by another publish instance using the same texture, is not
+converted twice.
+
+Converted textures can be stored to 'TextureCache' shared by all
+workstations of a studio so the same texture is not converted again by
+following publishes.
+"""
+
+import os
+import json
+import time
+import uuid
+import errno
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .log import Logger
+from .execute import run_subprocess
+
+
+class TextureConversionJob(object):
+    """Conversion of a texture by an external tool.
+
+    Args:
+        source (str): Path to source texture.
+        destination (str): Path where converted texture is written.
+        args (list[str]): Subprocess arguments running the conversion.
+        texture_hash (str): Hash of source file and conversion arguments
+            created with 'source_hash'.
+        env (Optional[dict[str, str]]): Environment of the subprocess.
+            Current process environment is used if not passed.
+        result (Optional[Any]): Result of the job returned by 'wait', e.g.
+            information about converted texture for publish plugin.
+    """
+
+    def __init__(
+        self, source, destination, args, texture_hash, env=None, result=None
+    ):
+        self.source = source
+        self.destination = destination
+        self.args = args
+        self.texture_hash = texture_hash
+        self.env = env
+        self.result = result
+        self._future = None
+
+    def __repr__(self):
+        return "<{} {} -> {}>".format(
+            self.__class__.__name__, self.source, self.destination
+        )
+
+    @property
+    def key(self):
+        """Identifier of the conversion.
+
+        Returns:
+            tuple[str, str]: Normalized source path and texture hash.
+        """
+
+        return os.path.normpath(self.source), self.texture_hash
+
+    @property
+    def done(self):
+        """Conversion finished or job was not submitted to a queue.
+
+        Returns:
+            bool: Job does not run.
+        """
+
+        return self._future is None or self._future.done()
+
+    def wait(self):
+        """Wait for conversion to finish.
+
+        Returns:
+            Any: Result of the job.
+
+        Raises:
+            Exception: Error raised by the conversion.
+        """
+
+        if self._future is not None:
+            self._future.result()
+        return self.result
+
+
+def run_texture_conversion(job, logger=None):
+    """Run conversion subprocess of the job.
+
+    Args:
+        job (TextureConversionJob): Job to run.
+        logger (Optional[logging.Logger]): Logger of subprocess output.
+
+    Returns:
+        str: Output of the subprocess.
+    """
+
+    return run_subprocess(job.args, env=job.env, logger=logger)
+
+
+class TextureCache(object):
+    """Directory with converted textures shared between publishes.
+
+    Each converted texture is stored in its own directory named by digest
+    of the job key. The directory contains the converted file and
+    'metadata.json' with information about the conversion. Modification
+    time of metadata file is updated on each use and least recently used
+    entries are removed first by 'evict'. Eviction walks all entries so it
+    runs at most once per 'evict_interval' for all processes using the
+    cache, time of last eviction is stored in the cache root.
+
+    Entries are written to temporary directory in cache root first and
+    renamed to final location, so other processes never see partially
+    written files. Files in cache must not be modified, they can be
+    hardlinked to publish.
+
+    Args:
+        root (str): Root directory of the cache.
+        max_bytes (Optional[int]): Maximum size of cached files. Cache
+            size is not limited if not passed.
+        logger (Optional[logging.Logger]): Logger.
+    """
+
+    metadata_filename = "metadata.json"
+    temp_prefix = ".tmp_"
+    last_evict_filename = ".last_evict"
+    # Minimum time between evictions in seconds
+    evict_interval = 60 * 60
+
+    def __init__(self, root, max_bytes=None, logger=None):
+        if logger is None:
+            logger = Logger.get_logger(self.__class__.__name__)
+        self._root = os.path.normpath(root)
+        self._max_bytes = max_bytes
+        self._log = logger
+
+    @property
+    def root(self):
+        return self._root
+
+    def get_entry_dir(self, job):
+        """Directory of cache entry for a job.
+
+        Args:
+            job (TextureConversionJob): Conversion job.
+
+        Returns:
+            str: Path to entry directory. The directory may not exist.
+        """
+
+        source, texture_hash = job.key
+        digest = hashlib.sha256(
+            "{}|{}".format(source, texture_hash).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self._root, digest[:2], digest)
+
+    def get(self, job):
+        """Get cached converted texture of a job.
+
+        Args:
+            job (TextureConversionJob): Conversion job.
+
+        Returns:
+            Union[str, None]: Path to cached converted texture or None if
+                texture is not in cache.
+        """
+
+        entry_dir = self.get_entry_dir(job)
+        metadata_path = os.path.join(entry_dir, self.metadata_filename)
+        path = os.path.join(entry_dir, os.path.basename(job.destination))
+        if not os.path.exists(metadata_path) or not os.path.exists(path):
+            return None
+
+        try:
+            os.utime(metadata_path, None)
+        except OSError:
+            # Entry could be removed by other process in the meantime
+            return None
+        return path
+
+    def store(self, job):
+        """Store converted texture of a finished job to cache.
+
+        Args:
+            job (TextureConversionJob): Finished conversion job.
+
+        Returns:
+            Union[str, None]: Path to cached converted texture or None if
+                storing failed.
+        """
+
+        entry_dir = self.get_entry_dir(job)
+        filename = os.path.basename(job.destination)
+        path = os.path.join(entry_dir, filename)
+        if os.path.exists(path):
+            return path
+
+        temp_dir = os.path.join(
+            self._root, self.temp_prefix + uuid.uuid4().hex
+        )
+        try:
+            os.makedirs(temp_dir)
+            shutil.copyfile(job.destination, os.path.join(temp_dir, filename))
+            source, texture_hash = job.key
+            metadata = {
+                "source": source,
+                "hash": texture_hash,
+                "filename": filename,
+                "size": os.path.getsize(job.destination),
+                "created": time.time(),
+            }
+            metadata_path = os.path.join(temp_dir, self.metadata_filename)
+            with open(metadata_path, "w") as stream:
+                json.dump(metadata, stream)
+
+            parent_dir = os.path.dirname(entry_dir)
+            if not os.path.exists(parent_dir):
+                try:
+                    os.makedirs(parent_dir)
+                except OSError as exc:
+                    if exc.errno != errno.EEXIST:
+                        raise
+            os.rename(temp_dir, entry_dir)
+
+        except OSError:
+            # Other process could store the same entry in the meantime
+            if os.path.exists(path):
+                return path
+            self._log.warning(
+                "Failed to store texture to cache: {}".format(job.source),
+                exc_info=True
+            )
+            return None
+
+        finally:
+            if os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+        self._log.debug("Stored texture to cache: {}".format(path))
+        return path
+
+    def can_hardlink_to(self, directory):
+        """Cached files can be hardlinked to the directory.
+
+        Hardlinks can be created only on the same device. The directory
+        does not have to exist.
+
+        Args:
+            directory (str): Destination directory.
+
+        Returns:
+            bool: Cache root and directory are on the same device.
+        """
+
+        directory = os.path.abspath(directory)
+        while not os.path.exists(directory):
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return False
+            directory = parent
+        try:
+            return os.stat(self._root).st_dev == os.stat(directory).st_dev
+        except OSError:
+            return False
+
+    def get_size(self):
+        """Size of files in cache.
+
+        Returns:
+            int: Size of cached files in bytes.
+        """
+
+        return sum(entry[2] for entry in self._get_entries())
+
+    def evict(self, max_bytes=None, force=False):
+        """Remove least recently used entries over size limit.
+
+        Eviction is skipped if it already happened in last
+        'evict_interval' seconds.
+
+        Args:
+            max_bytes (Optional[int]): Maximum size of cache. Size passed
+                on initialization is used if not passed.
+            force (Optional[bool]): Evict even if last eviction happened
+                in last 'evict_interval' seconds.
+
+        Returns:
+            int: Count of removed entries.
+        """
+
+        if max_bytes is None:
+            max_bytes = self._max_bytes
+        if max_bytes is None:
+            return 0
+
+        if not force and not self._start_evict():
+            return 0
+
+        entries = self._get_entries()
+        size = sum(entry[2] for entry in entries)
+        removed = 0
+        for entry_dir, _, entry_size in sorted(entries, key=lambda e: e[1]):
+            if size <= max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            if os.path.exists(entry_dir):
+                continue
+            size -= entry_size
+            removed += 1
+
+        if removed:
+            self._log.debug(
+                "Removed {} entries from texture cache".format(removed)
+            )
+        return removed
+
+    def _start_evict(self):
+        """Check time of last eviction and store current time.
+
+        Returns:
+            bool: Eviction should run.
+        """
+
+        if not os.path.isdir(self._root):
+            return False
+
+        path = os.path.join(self._root, self.last_evict_filename)
+        try:
+            last_evict = os.path.getmtime(path)
+        except OSError:
+            last_evict = None
+
+        if (
+            last_evict is not None
+            and time.time() - last_evict < self.evict_interval
+        ):
+            return False
+
+        try:
+            with open(path, "w"):
+                pass
+        except OSError:
+            self._log.debug(
+                "Failed to store time of eviction to texture cache",
+                exc_info=True
+            )
+        return True
+
+    def _get_entries(self):
+        """Entries in cache.
+
+        Returns:
+            list[tuple[str, float, int]]: Entry directory, time of last use
+                and size of entry.
+        """
+
+        output = []
+        if not os.path.isdir(self._root):
+            return output
+
+        for prefix in os.listdir(self._root):
+            prefix_dir = os.path.join(self._root, prefix)
+            if prefix.startswith(self.temp_prefix):
+                continue
+            if not os.path.isdir(prefix_dir):
+                continue
+            for digest in os.listdir(prefix_dir):
+                entry_dir = os.path.join(prefix_dir, digest)
+                metadata_path = os.path.join(
+                    entry_dir, self.metadata_filename
+                )
+                try:
+                    last_used = os.path.getmtime(metadata_path)
+                    size = sum(
+                        os.path.getsize(os.path.join(entry_dir, filename))
+                        for filename in os.listdir(entry_dir)
+                    )
+                except OSError:
+                    continue
+                output.append((entry_dir, last_used, size))
+        return output
+
+
+class TextureConversionQueue(object):
+    """Run texture conversion jobs concurrently.
+
+    Jobs start when they're submitted. Use 'wait' on submitted job or
+    'wait_all' to get results.
+
+    Args:
+        max_workers (Optional[int]): Maximum count of conversions running
+            at the same time.
+        converter (Optional[Callable[[TextureConversionJob], Any]]):
+            Function converting the texture of a job. Job subprocess is
+            run by 'run_texture_conversion' if not passed. Can be replaced
+            e.g. by stand-in converter in tests.
+        logger (Optional[logging.Logger]): Logger.
+        cache (Optional[TextureCache]): Cache where converted textures
+            are stored.
+    """
+
+    default_max_workers = 4
+
+    def __init__(
+        self, max_workers=None, converter=None, logger=None, cache=None
+    ):
+        if not max_workers:
+            max_workers = self.default_max_workers
+        if logger is None:
+            logger = Logger.get_logger(self.__class__.__name__)
+        if converter is None:
+            def converter(job):
+                return run_texture_conversion(job, logger)
+
+        self._log = logger
+        self._converter = converter
+        self._cache = cache
+        self._max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._jobs_by_key = {}
+
+    @property
+    def cache(self):
+        """Cache where converted textures are stored.
+
+        Returns:
+            Union[TextureCache, None]: Texture cache.
+        """
+
+        return self._cache
+
+    @property
+    def jobs(self):
+        """Submitted jobs in order of submission.
+
+        Returns:
+            list[TextureConversionJob]: Submitted jobs.
+        """
+
+        with self._lock:
+            return list(self._jobs_by_key.values())
+
+    def submit(self, job):
+        """Submit job to be converted.
+
+        Job with the same key which was already submitted is not converted
+        again. The already submitted job is returned instead.
+
+        Args:
+            job (TextureConversionJob): Job to convert.
+
+        Returns:
+            TextureConversionJob: Job which converts the texture.
+        """
+
+        with self._lock:
+            submitted_job = self._jobs_by_key.get(job.key)
+            if submitted_job is not None:
+                self._log.debug(
+                    "Reusing conversion of {}".format(job.source)
+                )
+                return submitted_job
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers
+                )
+            self._jobs_by_key[job.key] = job
+            job._future = self._executor.submit(self._convert, job)
+        return job
+
+    def wait_all(self):
+        """Wait for all submitted jobs.
+
+        Returns:
+            list[Any]: Results of jobs in order of submission.
+
+        Raises:
+            Exception: First error raised by a conversion. All jobs are
+                finished before the error is raised.
+        """
+
+        jobs = self.jobs
+        error = None
+        results = []
+        for job in jobs:
+            try:
+                results.append(job.wait())
+            except Exception as exc:
+                if error is None:
+                    error = exc
+        if error is not None:
+            raise error
+        return results
+
+    def shutdown(self, wait=True):
+        """Stop worker threads.
+
+        Args:
+            wait (bool): Wait for running conversions.
+        """
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _convert(self, job):
+        self._log.debug("Converting texture {}".format(job.source))
+        try:
+            self._converter(job)
+        except Exception:
+            self._log.error(
+                "Texture conversion failed: {}".format(job.source),
+                exc_info=True
+            )
+            raise
+
+        if self._cache is not None:
+            self._cache.store(job)
@@ -26,6 +26,8 @@ from ayon_core.pipeline.publish.lib import (
     replace_with_published_scene_path
 )
 
+from .lib import get_deadline_webservice
+
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
 
@@ -589,8 +591,48 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             KnownPublishError: if submission fails.
 
         """
-        url = "{}/api/jobs".format(self._deadline_url)
-        response = requests_post(url, json=payload)
+        webservice = get_deadline_webservice(self._deadline_url)
+        response = webservice.submit_job(payload)
+        result = self._process_submit_response(response, payload)
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = result
+
+        return result["_id"]
+
+    def submit_many(self, payloads):
+        """Submit multiple payloads to Deadline API end-point concurrently.
+
+        Payloads must not depend on each other. Submit dependent jobs
+        in following call with ids returned from this one.
+
+        Args:
+            payloads (list[dict]): dicts to become json in deadline
+                submissions.
+
+        Returns:
+            list[str]: resulting Deadline job ids in order of payloads.
+
+        Throws:
+            KnownPublishError: if any submission fails.
+
+        """
+        if not payloads:
+            return []
+
+        webservice = get_deadline_webservice(self._deadline_url)
+        responses = webservice.submit_jobs(payloads)
+        results = [
+            self._process_submit_response(response, payload)
+            for response, payload in zip(responses, payloads)
+        ]
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = results[-1]
+
+        return [result["_id"] for result in results]
+
+    def _process_submit_response(self, response, payload):
         if not response.ok:
             self.log.error("Submission failed!")
             self.log.error(response.status_code)
@@ -605,8 +647,4 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             msg += "Try restarting the Deadline Webservice."
             self.log.warning(msg, exc_info=True)
             raise KnownPublishError("Broken response from DL")
-
-        # for submit publish job
-        self._instance.data["deadlineSubmissionJob"] = result
-
-        return result["_id"]
+        return result
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Client of Deadline Webservice shared by publish plugins.
+
+Connections to webservice are kept alive in pooled session so multiple
+requests during one publish don't open new connection for each request.
+Failed connections are retried with backoff. Requests which did reach
+the webservice are retried only for GET, so job submission can't create
+duplicated jobs.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ayon_core.lib import Logger
+
+
+def _get_verify_ssl():
+    # Same logic as 'requests_get' and 'requests_post' use
+    return False if os.getenv("OPENPYPE_DONT_VERIFY_SSL", True) else True
+
+
+def _create_retry(total, backoff_factor):
+    kwargs = {
+        "total": total,
+        "connect": total,
+        "read": total,
+        "status": total,
+        "backoff_factor": backoff_factor,
+        "status_forcelist": (502, 503, 504),
+        "raise_on_status": False,
+    }
+    # Read and status retries are used only for GET, connect retries
+    #   are used for all methods
+    methods = frozenset({"GET"})
+    try:
+        return Retry(allowed_methods=methods, **kwargs)
+    except TypeError:
+        # urllib3 < 1.26
+        return Retry(method_whitelist=methods, **kwargs)
+
+
+class DeadlineWebservice:
+    """Deadline Webservice client with pooled keep-alive connections.
+
+    Use 'get_deadline_webservice' to get shared client for an url.
+
+    Args:
+        url (str): Deadline Webservice url.
+        timeout (Optional[float]): Timeout of requests in seconds.
+    """
+    # Maximum number of concurrent requests
+    max_workers = 8
+    # Number of job ids requested in single request
+    jobs_batch_size = 50
+    # Retries of failed requests
+    max_retries = 3
+    retry_backoff_factor = 0.5
+
+    def __init__(self, url, timeout=10):
+        self._url = url.rstrip("/")
+        self._timeout = timeout
+        self._log = None
+
+        session = requests.Session()
+        session.verify = _get_verify_ssl()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_workers,
+            max_retries=_create_retry(
+                self.max_retries, self.retry_backoff_factor
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self._session = session
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    @property
+    def url(self):
+        return self._url
+
+    def get(self, endpoint, **kwargs):
+        """Send GET request to webservice endpoint.
+
+        Args:
+            endpoint (str): Endpoint path, e.g. '/api/jobs'.
+            **kwargs: Keyword arguments passed to 'requests.Session.get'.
+
+        Returns:
+            requests.Response: Response from webservice.
+        """
+        kwargs.setdefault("timeout", self._timeout)
+        return self._session.get(self._url + endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        """Send POST request to webservice endpoint.
+
+        Args:
+            endpoint (str): Endpoint path, e.g. '/api/jobs'.
+            **kwargs: Keyword arguments passed to 'requests.Session.post'.
+
+        Returns:
+            requests.Response: Response from webservice.
+        """
+        kwargs.setdefault("timeout", self._timeout)
+        return self._session.post(self._url + endpoint, **kwargs)
+
+    def get_jobs_info(self, job_ids):
+        """Job info of multiple jobs.
+
+        Job ids are requested in batches which are sent concurrently.
+
+        Args:
+            job_ids (Iterable[str]): Deadline job ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Job info by job id. Jobs which were
+                not found are not in output.
+
+        Raises:
+            requests.exceptions.ConnectionError: Webservice is not
+                accessible.
+            RuntimeError: Webservice returned error response.
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        batches = [
+            job_ids[idx:idx + self.jobs_batch_size]
+            for idx in range(0, len(job_ids), self.jobs_batch_size)
+        ]
+        if not batches:
+            return {}
+
+        max_workers = min(self.max_workers, len(batches))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._get_jobs_batch, batches))
+
+        output = {}
+        for jobs_info in results:
+            for job_info in jobs_info:
+                output[job_info["_id"]] = job_info
+        return output
+
+    def get_job_info(self, job_id):
+        """Job info of single job.
+
+        Args:
+            job_id (str): Deadline job id.
+
+        Returns:
+            Union[dict[str, Any], None]: Job info or None if job was not
+                found.
+        """
+        return self.get_jobs_info([job_id]).get(job_id)
+
+    def submit_job(self, payload):
+        """Submit job to Deadline.
+
+        Args:
+            payload (dict[str, Any]): Job payload with 'JobInfo',
+                'PluginInfo' and 'AuxFiles'.
+
+        Returns:
+            requests.Response: Response from webservice.
+        """
+        return self.post("/api/jobs", json=payload)
+
+    def submit_jobs(self, payloads):
+        """Submit multiple jobs to Deadline concurrently.
+
+        Jobs must not depend on each other. Jobs with dependencies should
+        be submitted in next call, once ids of their dependencies are
+        known.
+
+        Args:
+            payloads (Iterable[dict[str, Any]]): Jobs payloads.
+
+        Returns:
+            list[requests.Response]: Responses in order of payloads.
+        """
+        payloads = list(payloads)
+        if len(payloads) < 2:
+            return [self.submit_job(payload) for payload in payloads]
+
+        max_workers = min(self.max_workers, len(payloads))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.submit_job, payloads))
+
+    def _get_jobs_batch(self, job_ids):
+        response = self.get(
+            "/api/jobs", params={"JobID": ",".join(job_ids)}
+        )
+        if not response.ok:
+            self.log.error("Failed to get jobs {}".format(job_ids))
+            self.log.error(response.status_code)
+            self.log.error(response.content)
+            raise RuntimeError(response.text)
+        return response.json() or []
+
+
+_webservices = {}
+_webservices_lock = threading.Lock()
+
+
+def get_deadline_webservice(url):
+    """Shared Deadline Webservice client for url.
+
+    Args:
+        url (str): Deadline Webservice url.
+
+    Returns:
+        DeadlineWebservice: Client for the url.
+    """
+    with _webservices_lock:
+        webservice = _webservices.get(url)
+        if webservice is None:
+            webservice = DeadlineWebservice(url)
+            _webservices[url] = webservice
+    return webservice
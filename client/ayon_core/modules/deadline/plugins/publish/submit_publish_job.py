@@ -4,7 +4,6 @@ import os
 import json
 import re
 from copy import deepcopy
-import requests
 import clique
 
 import pyblish.api
@@ -15,6 +14,7 @@ from ayon_core.client import (
 from ayon_core.pipeline import publish
 from ayon_core.lib import EnumDef, is_in_tests
 from ayon_core.pipeline.version_start import get_versioning_start
+from openpype_modules.deadline.lib import get_deadline_webservice
 
 from ayon_core.pipeline.farm.pyblish_functions import (
     create_skeleton_instance,
@@ -304,8 +304,8 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
 
         self.log.debug("Submitting Deadline publish job ...")
 
-        url = "{}/api/jobs".format(self.deadline_url)
-        response = requests.post(url, json=payload, timeout=10)
+        webservice = get_deadline_webservice(self.deadline_url)
+        response = webservice.submit_job(payload)
         if not response.ok:
             raise Exception(response.text)
 
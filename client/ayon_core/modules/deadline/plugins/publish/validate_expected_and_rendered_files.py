@@ -4,7 +4,8 @@ import requests
 import pyblish.api
 
 from ayon_core.lib import collect_frames
-from openpype_modules.deadline.abstract_submit_deadline import requests_get
+from ayon_core.pipeline.farm.manifest import get_existing_files
+from openpype_modules.deadline.lib import get_deadline_webservice
 
 
 class ValidateExpectedFiles(pyblish.api.InstancePlugin):
@@ -37,9 +38,6 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         for repre in instance.data["representations"]:
             expected_files = self._get_expected_files(repre)
 
-            staging_dir = repre["stagingDir"]
-            existing_files = self._get_existing_files(staging_dir)
-
             if self.allow_user_override:
                 # We always check for user override because the user might have
                 # also overridden the Job frame list to be longer than the
@@ -78,6 +76,12 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
                     # Update the expected files
                     expected_files = job_expected_files
 
+            # Rendered files are taken from manifests written by render
+            #   tasks, directory is listed only if they're not complete
+            existing_files = get_existing_files(
+                repre["stagingDir"], expected_files, dependent_job_ids
+            )
+
             # We don't use set.difference because we do allow other existing
             # files to be in the folder that we might not want to use.
             missing = expected_files - existing_files
@@ -129,8 +133,11 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         """
         all_frame_lists = []
 
+        jobs_info = self._get_jobs_info(instance, dependent_job_ids)
         for job_id in dependent_job_ids:
-            job_info = self._get_job_info(instance, job_id)
+            job_info = jobs_info.get(job_id)
+            if not job_info:
+                continue
             frame_list = job_info["Props"].get("Frames")
             if frame_list:
                 all_frame_lists.extend(frame_list.split(','))
@@ -185,18 +192,19 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
 
         return file_name_template, frame_placeholder
 
-    def _get_job_info(self, instance, job_id):
-        """Calls DL for actual job info for 'job_id'
+    def _get_jobs_info(self, instance, job_ids):
+        """Calls DL for actual job info of 'job_ids'
 
         Might be different than job info saved in metadata.json if user
-        manually changes job pre/during rendering.
+        manually changes job pre/during rendering. Jobs are requested
+        concurrently in batches.
 
         Args:
             instance (pyblish.api.Instance): pyblish instance
-            job_id (str): Deadline job id
+            job_ids (list[str]): Deadline job ids
 
         Returns:
-            (dict): Job info from Deadline
+            (dict): Job info from Deadline by job id
 
         """
         # get default deadline webservice url from deadline module
@@ -206,32 +214,14 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
             deadline_url = instance.data.get("deadlineUrl")
         assert deadline_url, "Requires Deadline Webservice URL"
 
-        url = "{}/api/jobs?JobID={}".format(deadline_url, job_id)
+        webservice = get_deadline_webservice(deadline_url)
         try:
-            response = requests_get(url)
+            return webservice.get_jobs_info(job_ids)
         except requests.exceptions.ConnectionError:
             self.log.error("Deadline is not accessible at "
                            "{}".format(deadline_url))
             return {}
 
-        if not response.ok:
-            self.log.error("Submission failed!")
-            self.log.error(response.status_code)
-            self.log.error(response.content)
-            raise RuntimeError(response.text)
-
-        json_content = response.json()
-        if json_content:
-            return json_content.pop()
-        return {}
-
-    def _get_existing_files(self, staging_dir):
-        """Returns set of existing file names from 'staging_dir'"""
-        existing_files = set()
-        for file_name in os.listdir(staging_dir):
-            existing_files.add(file_name)
-        return existing_files
-
     def _get_expected_files(self, repre):
         """Returns set of file names in representation['files']
 
@@ -14,7 +14,7 @@ from Deadline.Scripting import (
     DirectoryUtils,
     ProcessUtils,
 )
-__version__ = "1.0.1"
+__version__ = "1.1.0"
 VERSION_REGEX = re.compile(
     r"(?P<major>0|[1-9]\d*)"
     r"\.(?P<minor>0|[1-9]\d*)"
@@ -22,6 +22,9 @@ VERSION_REGEX = re.compile(
     r"(?:-(?P<prerelease>[a-zA-Z\d\-.]*))?"
     r"(?:\+(?P<buildmetadata>[a-zA-Z\d\-.]*))?"
 )
+# Manifest of rendered files, must match 'ayon_core.pipeline.farm.manifest'
+MANIFEST_DIRNAME = ".ayon_manifest"
+OUTPUT_PADDING_REGEX = re.compile(r"(?P<hashes>#+)|%(?P<digits>\d*)d")
 
 
 class OpenPypeVersion:
@@ -601,6 +604,68 @@ def inject_render_job_id(deadlinePlugin):
     print(">>> Injection end.")
 
 
+def _get_task_output_filenames(filename, frames):
+    match = OUTPUT_PADDING_REGEX.search(filename)
+    if not match:
+        return {filename}
+
+    if match.group("hashes"):
+        padding = len(match.group("hashes"))
+    else:
+        padding = int(match.group("digits") or 0)
+    head = filename[:match.start()]
+    tail = filename[match.end():]
+    return {
+        "{}{}{}".format(head, str(frame).zfill(padding), tail)
+        for frame in frames
+    }
+
+
+def write_rendered_files_manifest(deadlinePlugin):
+    """Write names of files rendered by current task to job manifest.
+
+    Publish job uses the manifest instead of listing output directories
+    on network storage. Output directory is listed once per task here.
+    """
+    job = deadlinePlugin.GetJob()
+    task_id = deadlinePlugin.GetCurrentTaskId()
+    frames = range(
+        deadlinePlugin.GetStartFrame(), deadlinePlugin.GetEndFrame() + 1
+    )
+    filenames_by_dir = {}
+    for output_dir, filename in zip(
+        job.JobOutputDirectories, job.JobOutputFileNames
+    ):
+        output_dir = RepositoryUtils.CheckPathMapping(output_dir)
+        # Filename may contain subdirectory
+        dirname, filename = os.path.split(
+            os.path.join(output_dir, filename))
+        filenames_by_dir.setdefault(dirname, set()).update(
+            _get_task_output_filenames(filename, frames)
+        )
+
+    for output_dir, filenames in filenames_by_dir.items():
+        try:
+            rendered = filenames.intersection(os.listdir(output_dir))
+            if not rendered:
+                continue
+
+            manifest_dir = os.path.join(output_dir, MANIFEST_DIRNAME)
+            if not os.path.isdir(manifest_dir):
+                os.makedirs(manifest_dir)
+            manifest_path = os.path.join(
+                manifest_dir, "{}.{}.txt".format(job.JobId, task_id))
+            tmp_path = "{}.{}.tmp".format(manifest_path, uuid.uuid4().hex)
+            with open(tmp_path, "w") as stream:
+                stream.write("\n".join(sorted(rendered)) + "\n")
+            os.replace(tmp_path, manifest_path)
+
+        except Exception as exc:
+            # Manifest is optional, publish will list the directory
+            print(">>> Failed to write manifest to {}: {}".format(
+                output_dir, exc))
+
+
 def __main__(deadlinePlugin):
     print("*** GlobalJobPreload {} start ...".format(__version__))
     print(">>> Getting job ...")
@@ -636,3 +701,8 @@ def __main__(deadlinePlugin):
         inject_render_job_id(deadlinePlugin)
     if ayon_render_job == "1" or ayon_remote_job == "1":
         inject_ayon_environment(deadlinePlugin)
+
+    if ayon_render_job == "1" or openpype_render_job == "1":
+        deadlinePlugin.PostRenderTasksCallback += (
+            lambda: write_rendered_files_manifest(deadlinePlugin)
+        )
@@ -27,6 +27,8 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- jobs are stored to database file so they are not lost on server restart,
+    path to the file can be specified (default is in AYON app data)
 
 ### start_worker
 - start worker which will process jobs
@@ -134,19 +136,87 @@ class JobQueueAddon(AYONAddon):
 
     def send_job(self, host_name, job_data):
         import requests
+        from ayon_core.lib import get_ayon_username
 
         job_data = job_data or {}
         job_data["host_name"] = host_name
+        job_data.setdefault("submitter", get_ayon_username())
         api_path = "{}/api/jobs".format(self._server_url)
         post_request = requests.post(api_path, data=json.dumps(job_data))
         return str(post_request.content.decode())
 
+    def send_jobs(self, host_name, jobs_data):
+        """Send multiple jobs in single request.
+
+        Job data can contain 'priority' and 'max_attempts' keys.
+
+        Args:
+            host_name (str): Host name which should process the jobs.
+            jobs_data (list[dict[str, Any]]): Data of each job.
+
+        Returns:
+            list[str]: Ids of created jobs.
+        """
+        import requests
+        from ayon_core.lib import get_ayon_username
+
+        username = get_ayon_username()
+        jobs_data = [
+            {"submitter": username, **job_data, "host_name": host_name}
+            for job_data in jobs_data
+        ]
+        api_path = "{}/api/jobs".format(self._server_url)
+        post_request = requests.post(api_path, data=json.dumps(jobs_data))
+        return post_request.json()
+
     def get_job_status(self, job_id):
         import requests
 
         api_path = "{}/api/jobs/{}".format(self._server_url, job_id)
         return requests.get(api_path).json()
 
+    def wait_for_job(self, job_id, timeout=None):
+        """Wait until job is finished.
+
+        Job status changes are received from server events stream instead
+        of polling of job status.
+
+        Args:
+            job_id (str): Job id.
+            timeout (Optional[float]): Timeout of connection to server.
+                Server sends keepalive message each 15 seconds.
+
+        Returns:
+            dict[str, Any]: Status of finished job. Empty dictionary is
+                returned if job is not in queue.
+        """
+        import requests
+
+        api_path = "{}/api/jobs/events".format(self._server_url)
+        with requests.get(
+            api_path,
+            params={"job_id": job_id},
+            stream=True,
+            timeout=timeout,
+        ) as response:
+            response.raise_for_status()
+            event_name = None
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("event:"):
+                    event_name = line[6:].strip()
+                    continue
+
+                if not line.startswith("data:"):
+                    continue
+
+                if event_name == "missing":
+                    return {}
+
+                job_status = json.loads(line[5:])
+                if job_status["done"] or job_status["state"] == "deleted":
+                    return job_status
+        return self.get_job_status(job_id)
+
     def cli(self, click_group):
         click_group.add_command(cli_main.to_click_obj())
 
@@ -160,10 +230,13 @@ class JobQueueAddon(AYONAddon):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(cls, port=None, host=None, db_path=None):
+        from ayon_core.lib.local_settings import get_ayon_appdirs
         from .job_server import main
 
-        return main(port, host)
+        if not db_path:
+            db_path = get_ayon_appdirs("job_queue", "jobs.db")
+        return main(port, host, db_path)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -222,8 +295,9 @@ def cli_main():
 )
 @click_wrap.option("--port", help="Server port")
 @click_wrap.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueAddon.start_server(port, host)
+@click_wrap.option("--db_path", help="Path to database file with jobs")
+def cli_start_server(port, host, db_path):
+    JobQueueAddon.start_server(port, host, db_path)
 
 
 @cli_main.command(
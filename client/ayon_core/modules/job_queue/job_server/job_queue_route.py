@@ -1,19 +1,78 @@
 import json
+import asyncio
 
-from aiohttp.web_response import Response
+from aiohttp.web_response import Response, StreamResponse
+
+
+class JobsFilter:
+    """Filter of jobs based on query of a request.
+
+    Each key can be used multiple times in query, e.g.
+        '?state=waiting&state=started&host_name=tvpaint'
+    """
+    def __init__(self, query):
+        self.job_ids = set(query.getall("job_id", []))
+        self.host_names = set(query.getall("host_name", []))
+        self.states = set(query.getall("state", []))
+        self.submitters = set(query.getall("submitter", []))
+
+    def match(self, job):
+        if self.job_ids and job.id not in self.job_ids:
+            return False
+        if self.host_names and job.host_name not in self.host_names:
+            return False
+        if self.states and job.state not in self.states:
+            return False
+        if self.submitters and job.submitter not in self.submitters:
+            return False
+        return True
+
+
+class JobsSubscriber:
+    """Pending status changes of jobs for single events stream.
+
+    Only last status of a job is kept so slow client does not cause
+    growing memory.
+    """
+    def __init__(self, jobs_filter):
+        self.jobs_filter = jobs_filter
+        self._changes = {}
+        self._event = asyncio.Event()
+
+    def add_change(self, job_id, status_body):
+        self._changes[job_id] = status_body
+        self._event.set()
+
+    async def wait_for_changes(self, timeout):
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._event.clear()
+        changes = list(self._changes.values())
+        self._changes.clear()
+        return changes
 
 
 class JobQueueResource:
+    # Comment sent to events stream to keep connection alive
+    keepalive_seconds = 15
+
     def __init__(self, job_queue, server_manager):
         self.server_manager = server_manager
 
         self._prefix = "/api"
 
         self._job_queue = job_queue
+        # Encoded status of jobs, invalidated when job changes
+        self._status_body_by_job_id = {}
+        self._subscribers = []
+        job_queue.add_listener(self._on_job_change)
 
         self.endpoint_defs = (
             ("POST", "/jobs", self.post_job),
             ("GET", "/jobs", self.get_jobs),
+            ("GET", "/jobs/events", self.stream_jobs),
             ("GET", "/jobs/{job_id}", self.get_job)
         )
 
@@ -26,37 +85,164 @@ class JobQueueResource:
                 methods, final_url, callback
             )
 
+    def _on_job_change(self, job):
+        self._status_body_by_job_id.pop(job.id, None)
+        if not self._subscribers:
+            return
+
+        status_body = self._get_status_body(job)
+        for subscriber in self._subscribers:
+            if subscriber.jobs_filter.match(job):
+                subscriber.add_change(job.id, status_body)
+
+    def _get_status_body(self, job):
+        status_body = self._status_body_by_job_id.get(job.id)
+        if status_body is None:
+            status_body = self.encode(job.status())
+            if not job.deleted:
+                self._status_body_by_job_id[job.id] = status_body
+        return status_body
+
     async def get_jobs(self, request):
-        jobs_data = []
-        for job in self._job_queue.get_jobs():
-            jobs_data.append(job.status())
-        return Response(status=200, body=self.encode(jobs_data))
+        """Statuses of jobs.
 
-    async def post_job(self, request):
-        data = await request.json()
-        host_name = data.get("host_name")
-        if not host_name:
+        Jobs can be filtered with 'host_name', 'state', 'submitter' and
+        'job_id' query keys and paginated with 'offset' and 'limit'. Total
+        count of filtered jobs is in 'X-Total-Count' header. All jobs are
+        returned when 'limit' is not passed.
+        """
+        try:
+            offset = max(int(request.query.get("offset", 0)), 0)
+            limit = int(request.query.get("limit", -1))
+        except ValueError:
             return Response(
-                status=400, message="Key \"host_name\" not filled."
+                status=400, text="Invalid \"offset\" or \"limit\"."
             )
 
-        job = self._job_queue.create_job(host_name, data)
-        return Response(status=201, text=job.id)
+        jobs_filter = JobsFilter(request.query)
+        jobs = [
+            job
+            for job in self._job_queue.get_jobs()
+            if jobs_filter.match(job)
+        ]
+        page_end = None
+        if limit >= 0:
+            page_end = offset + limit
+
+        body = b"[" + b",".join(
+            self._get_status_body(job)
+            for job in jobs[offset:page_end]
+        ) + b"]"
+        return Response(
+            status=200,
+            body=body,
+            content_type="application/json",
+            headers={"X-Total-Count": str(len(jobs))}
+        )
+
+    async def stream_jobs(self, request):
+        """Stream changes of jobs statuses as server-sent events.
+
+        Current statuses of matching jobs are sent first, then each change
+        of a job status is sent as 'job' event. Jobs are filtered same way
+        as in 'get_jobs'. Requested job ids which are not in queue are sent
+        as 'missing' event.
+        """
+        jobs_filter = JobsFilter(request.query)
+        response = StreamResponse(headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+        })
+        await response.prepare(request)
+
+        subscriber = JobsSubscriber(jobs_filter)
+        self._subscribers.append(subscriber)
+        try:
+            for job_id in jobs_filter.job_ids:
+                if self._job_queue.get_job(job_id) is None:
+                    await response.write(self._encode_event(
+                        "missing", self.encode({"id": job_id})
+                    ))
+
+            for job in tuple(self._job_queue.get_jobs()):
+                if jobs_filter.match(job):
+                    await response.write(self._encode_event(
+                        "job", self._get_status_body(job)
+                    ))
+
+            while True:
+                changes = await subscriber.wait_for_changes(
+                    self.keepalive_seconds
+                )
+                if not changes:
+                    await response.write(b": keepalive\n\n")
+                    continue
+
+                await response.write(b"".join(
+                    self._encode_event("job", status_body)
+                    for status_body in changes
+                ))
+
+        except ConnectionResetError:
+            pass
+
+        finally:
+            self._subscribers.remove(subscriber)
+        return response
+
+    async def post_job(self, request):
+        """Create job or multiple jobs.
+
+        Body can be a single job data or list of jobs data. Single job
+        returns job id as text, list of jobs returns json list of job ids.
+        """
+        data = await request.json()
+        is_batch = isinstance(data, list)
+        jobs_data = data if is_batch else [data]
+        jobs_info = []
+        for job_data in jobs_data:
+            host_name = None
+            if isinstance(job_data, dict):
+                host_name = job_data.get("host_name")
+            if not host_name:
+                return Response(
+                    status=400, text="Key \"host_name\" not filled."
+                )
+            jobs_info.append((host_name, job_data))
+
+        jobs = self._job_queue.create_jobs(jobs_info)
+        if not is_batch:
+            return Response(status=201, text=jobs[0].id)
+        return Response(
+            status=201,
+            body=self.encode([job.id for job in jobs]),
+            content_type="application/json"
+        )
 
     async def get_job(self, request):
         job_id = request.match_info["job_id"]
-        content = self._job_queue.get_job_status(job_id)
-        if content is None:
-            content = {}
+        job = self._job_queue.get_job(job_id)
+        if job is None:
+            body = self.encode({})
+        else:
+            body = self._get_status_body(job)
         return Response(
             status=200,
-            body=self.encode(content),
+            body=body,
             content_type="application/json"
         )
 
+    @staticmethod
+    def _encode_event(event_name, body):
+        return b"".join((
+            b"event: ", event_name.encode("utf-8"),
+            b"\ndata: ", body,
+            b"\n\n",
+        ))
+
     @classmethod
     def encode(cls, data):
         return json.dumps(
             data,
-            indent=4
+            separators=(",", ":")
         ).encode("utf-8")
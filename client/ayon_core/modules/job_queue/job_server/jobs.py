@@ -1,17 +1,49 @@
+import heapq
 import datetime
+import itertools
 import collections
 from uuid import uuid4
 
 
+def _to_timestamp(value):
+    if value is None:
+        return None
+    return value.timestamp()
+
+
+def _from_timestamp(value):
+    if value is None:
+        return None
+    return datetime.datetime.fromtimestamp(value)
+
+
 class Job:
     """Job related to specific host name.
 
     Data must contain everything needed to finish the job.
+
+    Args:
+        host_name (str): Host name which can process the job.
+        data (dict[str, Any]): Job data.
+        job_id (Optional[str]): Job id. New id is created if not passed.
+        created_time (Optional[datetime.datetime]): Time of job creation.
+        priority (Optional[int]): Jobs with higher priority are assigned
+            first.
+        max_attempts (Optional[int]): How many times job can be processed
+            before it is marked as errored.
     """
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
 
-    def __init__(self, host_name, data, job_id=None, created_time=None):
+    def __init__(
+        self,
+        host_name,
+        data,
+        job_id=None,
+        created_time=None,
+        priority=None,
+        max_attempts=None,
+    ):
         if job_id is None:
             job_id = str(uuid4())
         self._id = job_id
@@ -22,6 +54,10 @@ class Job:
         self._done_time = None
         self.host_name = host_name
         self.data = data
+        self.priority = priority or 0
+        self.max_attempts = max(max_attempts or 1, 1)
+        self._attempts = 0
+        self._available_time = None
         self._result_data = None
 
         self._started = False
@@ -48,13 +84,44 @@ class Job:
     def done(self):
         return self._done
 
-    def reset(self):
+    @property
+    def submitter(self):
+        """Name of user who submitted the job, if was passed in data."""
+        if isinstance(self.data, dict):
+            return self.data.get("submitter")
+        return None
+
+    @property
+    def created_time(self):
+        return self._created_time
+
+    @property
+    def attempts(self):
+        return self._attempts
+
+    @property
+    def available_time(self):
+        """Time when job can be assigned to a worker.
+
+        Returns:
+            Union[datetime.datetime, None]: Time when job can be processed
+                again after failed attempt.
+        """
+
+        return self._available_time
+
+    @property
+    def worker(self):
+        return self._worker
+
+    def reset(self, available_time=None):
         self._started = False
         self._started_time = None
         self._done = False
         self._done_time = None
         self._errored = False
         self._message = None
+        self._available_time = available_time
 
         self._worker = None
 
@@ -84,6 +151,7 @@ class Job:
     def set_started(self):
         self._started_time = datetime.datetime.now()
         self._started = True
+        self._attempts += 1
 
     def set_done(self, success=True, message=None, data=None):
         self._done = True
@@ -94,110 +162,367 @@ class Job:
         if self._worker is not None:
             self._worker.set_current_job(None)
 
+    @property
+    def state(self):
+        if self._deleted:
+            return "deleted"
+        if self._errored:
+            return "error"
+        if self._done:
+            return "done"
+        if self._started:
+            return "started"
+        return "waiting"
+
     def status(self):
         worker_id = None
         if self._worker is not None:
             worker_id = self._worker.id
         output = {
             "id": self.id,
+            "host_name": self.host_name,
+            "submitter": self.submitter,
             "worker_id": worker_id,
             "done": self._done
         }
         output["message"] = self._message or None
 
-        state = "waiting"
-        if self._deleted:
-            state = "deleted"
-        elif self._errored:
-            state = "error"
-        elif self._done:
-            state = "done"
-        elif self._started:
-            state = "started"
-
         output["result"] = self._result_data
 
-        output["state"] = state
+        output["state"] = self.state
+        output["priority"] = self.priority
+        output["attempts"] = self._attempts
 
         return output
 
+    def to_data(self):
+        """Serialize job to data which can be stored.
+
+        Assigned worker is not stored, job which was started is waiting
+        for a new worker when is recreated.
+
+        Returns:
+            dict[str, Any]: Job data.
+        """
+
+        return {
+            "id": self._id,
+            "host_name": self.host_name,
+            "data": self.data,
+            "priority": self.priority,
+            "max_attempts": self.max_attempts,
+            "attempts": self._attempts,
+            "created_time": _to_timestamp(self._created_time),
+            "started_time": _to_timestamp(self._started_time),
+            "done_time": _to_timestamp(self._done_time),
+            "available_time": _to_timestamp(self._available_time),
+            "done": self._done,
+            "errored": self._errored,
+            "message": self._message,
+            "result": self._result_data,
+        }
+
+    @classmethod
+    def from_data(cls, job_data):
+        """Recreate job from stored data.
+
+        Args:
+            job_data (dict[str, Any]): Data created with 'to_data'.
+
+        Returns:
+            Job: Recreated job.
+        """
+
+        job = cls(
+            job_data["host_name"],
+            job_data["data"],
+            job_id=job_data["id"],
+            created_time=_from_timestamp(job_data["created_time"]),
+            priority=job_data["priority"],
+            max_attempts=job_data["max_attempts"],
+        )
+        job._attempts = job_data["attempts"]
+        job._available_time = _from_timestamp(job_data["available_time"])
+        if job_data["done"]:
+            job._started_time = _from_timestamp(job_data["started_time"])
+            job._started = job._started_time is not None
+            job._done = True
+            job._done_time = _from_timestamp(job_data["done_time"])
+            job._errored = job_data["errored"]
+            job._message = job_data["message"]
+            job._result_data = job_data["result"]
+        return job
+
 
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
-    Also asign jobs to a worker.
+    Also asign jobs to a worker. Jobs are assigned by priority and then
+    by creation time. Idle workers are indexed by host name so assignment
+    does not have to go through all registered workers.
+
+    Args:
+        store (Optional[JobsStore]): Store where jobs are persisted. Jobs
+            are kept only in memory if not passed.
+        host_limits (Optional[dict[str, int]]): Maximum number of jobs
+            processed at the same time per host name.
     """
     old_jobs_check_minutes_interval = 30
-
-    def __init__(self):
+    # Delay before failed job is processed again, doubled on each attempt
+    retry_delay_seconds = 30
+    max_retry_delay_seconds = 600
+    # Time for which job waits for a worker of its host before it fails,
+    #   jobs restored from store are waiting since the queue was created
+    missing_worker_timeout_seconds = 300
+
+    def __init__(self, store=None, host_limits=None):
+        self._created_time = datetime.datetime.now()
         self._last_old_jobs_check = datetime.datetime.now()
+        self._store = store
+        self._host_limits = dict(host_limits or {})
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
-        )
+        # Heaps of '(-priority, created time, counter, job)'
+        self._job_queue_by_host_name = collections.defaultdict(list)
+        # Heap of '(available time, counter, job)' of jobs to retry
+        self._delayed_jobs = []
+        self._counter = itertools.count()
+        self._running_jobs_by_host_name = collections.Counter()
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        # Dictionaries are used as ordered sets
+        self._idle_workers_by_host_name = collections.defaultdict(dict)
+        self._assigned_workers = {}
+        self._listeners = []
+
+        if store is not None:
+            self._load_jobs()
+
+    def add_listener(self, callback):
+        """Register callback called when state of a job has changed.
+
+        Args:
+            callback (Callable[[Job], None]): Callback receiving changed job.
+        """
+
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def set_host_limit(self, host_name, limit):
+        """Change maximum number of running jobs for host name.
+
+        Args:
+            host_name (str): Host name.
+            limit (Union[int, None]): Maximum number of running jobs.
+                Number of jobs is not limited if is 'None'.
+        """
+
+        if limit is None:
+            self._host_limits.pop(host_name, None)
+        else:
+            self._host_limits[host_name] = limit
 
     def workers(self):
         """All currently registered workers."""
         return self._workers_by_id.values()
 
+    def assigned_workers(self):
+        """Workers with assigned job which was not sent to them yet."""
+        return tuple(self._assigned_workers.values())
+
     def add_worker(self, worker):
         host_name = worker.host_name
         print("Added new worker for \"{}\"".format(host_name))
         self._workers_by_id[worker.id] = worker
         self._workers_by_host_name[host_name].append(worker)
+        if worker.is_idle():
+            self._idle_workers_by_host_name[host_name][worker.id] = worker
 
     def get_worker(self, worker_id):
         return self._workers_by_id.get(worker_id)
 
     def remove_worker(self, worker):
-        # Look if worker had assigned job to do
-        job = worker.current_job
-        if job is not None and not job.done:
-            # Reset job
-            job.set_worker(None)
-            job.reset()
-            # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
-
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
         host_name = worker.host_name
         if worker in self._workers_by_host_name[host_name]:
             self._workers_by_host_name[host_name].remove(worker)
+        self._idle_workers_by_host_name[host_name].pop(worker.id, None)
+
+        # Look if worker had assigned job to do
+        job = worker.current_job
+        self._release_worker(worker)
+        if job is not None and not job.done:
+            # Reset job and add it back to queue, created time keeps
+            #   the job in front of newer jobs with same priority
+            job.reset()
+            self._queue_job(job)
+            self._jobs_changed([job])
 
         print("Removed worker for \"{}\"".format(host_name))
 
+    def _release_worker(self, worker):
+        job = worker.current_job
+        self._assigned_workers.pop(worker.id, None)
+        if job is not None:
+            self._running_jobs_by_host_name[worker.host_name] -= 1
+            job.set_worker(None)
+
+        if worker.id in self._workers_by_id:
+            self._idle_workers_by_host_name[worker.host_name][worker.id] = (
+                worker
+            )
+
     def assign_jobs(self):
         """Try to assign job for each idle worker.
 
-        Error all jobs without needed worker.
+        Error jobs which are waiting for a worker of their host longer
+        than 'missing_worker_timeout_seconds'.
         """
-        available_host_names = set()
-        for worker in self._workers_by_id.values():
-            host_name = worker.host_name
-            available_host_names.add(host_name)
-            if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
-                        break
+        self._queue_delayed_jobs()
 
+        changed_jobs = []
         for host_name in tuple(self._job_queue_by_host_name.keys()):
-            if host_name in available_host_names:
-                continue
+            jobs_heap = self._job_queue_by_host_name[host_name]
+            if not self._workers_by_host_name.get(host_name):
+                self._fail_jobs_without_worker(
+                    host_name, jobs_heap, changed_jobs
+                )
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
-            message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
-                if not job.deleted:
-                    job.set_done(False, message)
+            else:
+                self._assign_host_jobs(host_name, jobs_heap, changed_jobs)
+
+            if not jobs_heap:
+                self._job_queue_by_host_name.pop(host_name)
+
+        self._jobs_changed(changed_jobs)
         self._remove_old_jobs()
 
+    def _fail_jobs_without_worker(self, host_name, jobs_heap, changed_jobs):
+        now = datetime.datetime.now()
+        timeout = datetime.timedelta(
+            seconds=self.missing_worker_timeout_seconds
+        )
+        message = "Not available workers for \"{}\"".format(host_name)
+        waiting_jobs = []
+        for item in jobs_heap:
+            job = item[-1]
+            if job.deleted or job.done:
+                continue
+
+            waiting_since = max(job.created_time, self._created_time)
+            if now - waiting_since < timeout:
+                waiting_jobs.append(item)
+                continue
+            job.set_done(False, message)
+            changed_jobs.append(job)
+
+        if len(waiting_jobs) != len(jobs_heap):
+            heapq.heapify(waiting_jobs)
+            jobs_heap[:] = waiting_jobs
+
+    def _assign_host_jobs(self, host_name, jobs_heap, changed_jobs):
+        idle_workers = self._idle_workers_by_host_name[host_name]
+        limit = self._host_limits.get(host_name)
+        while jobs_heap and idle_workers:
+            if (
+                limit is not None
+                and self._running_jobs_by_host_name[host_name] >= limit
+            ):
+                break
+
+            job = heapq.heappop(jobs_heap)[-1]
+            if job.deleted or job.done or job.worker is not None:
+                continue
+
+            worker_id = next(iter(idle_workers))
+            worker = idle_workers.pop(worker_id)
+            worker.set_current_job(job)
+            self._assigned_workers[worker_id] = worker
+            self._running_jobs_by_host_name[host_name] += 1
+            changed_jobs.append(job)
+
+    def _queue_job(self, job):
+        available_time = job.available_time
+        if (
+            available_time is not None
+            and available_time > datetime.datetime.now()
+        ):
+            heapq.heappush(
+                self._delayed_jobs,
+                (available_time, next(self._counter), job)
+            )
+            return
+
+        heapq.heappush(
+            self._job_queue_by_host_name[job.host_name],
+            (-job.priority, job.created_time, next(self._counter), job)
+        )
+
+    def _queue_delayed_jobs(self):
+        now = datetime.datetime.now()
+        while self._delayed_jobs and self._delayed_jobs[0][0] <= now:
+            job = heapq.heappop(self._delayed_jobs)[-1]
+            if not job.deleted:
+                self._queue_job(job)
+
+    def job_sent(self, worker):
+        """Job assigned to worker was sent to the worker.
+
+        Args:
+            worker (Worker): Worker which received the job.
+        """
+
+        self._assigned_workers.pop(worker.id, None)
+        job = worker.current_job
+        worker.set_working()
+        if job is not None:
+            job.set_started()
+            self._jobs_changed([job])
+
+    def job_done(self, worker_id, job_id, success, message=None, data=None):
+        """Worker finished the job.
+
+        Failed job is queued again with delay if it did not reach maximum
+        number of attempts.
+
+        Args:
+            worker_id (str): Id of worker which processed the job.
+            job_id (str): Job id.
+            success (bool): Job was processed successfully.
+            message (Optional[str]): Message from worker.
+            data (Optional[Any]): Result data of the job.
+        """
+
+        # Ignore stale reports, e.g. when the job was already reassigned
+        #   to different worker or worker is already processing other job
+        worker = self._workers_by_id.get(worker_id)
+        if worker is None:
+            return
+        current_job = worker.current_job
+        if current_job is None or current_job.id != job_id:
+            return
+        self._release_worker(worker)
+
+        job = self._jobs_by_id.get(job_id)
+        if job is None or job.done:
+            return
+
+        if not success and job.attempts < job.max_attempts:
+            delay = min(
+                self.retry_delay_seconds * (2 ** (job.attempts - 1)),
+                self.max_retry_delay_seconds
+            )
+            job.reset(
+                datetime.datetime.now() + datetime.timedelta(seconds=delay)
+            )
+            self._queue_job(job)
+        else:
+            job.set_done(success, message, data)
+        self._jobs_changed([job])
+
     def get_jobs(self):
         return self._jobs_by_id.values()
 
@@ -207,21 +532,61 @@ class JobQueue:
 
     def create_job(self, host_name, job_data):
         """Create new job from passed data and add it to queue."""
-        job = Job(host_name, job_data)
-        self._jobs_by_id[job.id] = job
-        self._job_queue_by_host_name[host_name].append(job)
-        return job
+        return self.create_jobs([(host_name, job_data)])[0]
+
+    def create_jobs(self, jobs_info):
+        """Create multiple jobs at once.
+
+        Job data can contain 'priority' and 'max_attempts' keys.
+
+        Args:
+            jobs_info (Iterable[tuple[str, dict[str, Any]]]): Host name
+                and job data for each job.
+
+        Returns:
+            list[Job]: Created jobs.
+        """
+
+        jobs = []
+        for host_name, job_data in jobs_info:
+            job = Job(
+                host_name,
+                job_data,
+                priority=int(job_data.get("priority") or 0),
+                max_attempts=int(job_data.get("max_attempts") or 1),
+            )
+            self._jobs_by_id[job.id] = job
+            self._queue_job(job)
+            jobs.append(job)
+        self._jobs_changed(jobs)
+        return jobs
 
     def _remove_old_jobs(self):
         """Once in specific time look if should remove old finished jobs."""
-        delta = datetime.datetime.now() - self._last_old_jobs_check
-        if delta.seconds < self.old_jobs_check_minutes_interval:
+        now = datetime.datetime.now()
+        delta = now - self._last_old_jobs_check
+        interval = datetime.timedelta(
+            minutes=self.old_jobs_check_minutes_interval
+        )
+        if delta < interval:
             return
 
+        self._last_old_jobs_check = now
+        removed_jobs = []
         for job_id in tuple(self._jobs_by_id.keys()):
             job = self._jobs_by_id[job_id]
             if not job.keep_in_memory():
                 self._jobs_by_id.pop(job_id)
+                job.set_deleted()
+                removed_jobs.append(job)
+
+        if not removed_jobs:
+            return
+
+        if self._store is not None:
+            self._store.remove_jobs([job.id for job in removed_jobs])
+        # Listeners can release data of removed jobs
+        self._notify_listeners(removed_jobs)
 
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
@@ -229,8 +594,14 @@ class JobQueue:
         if job is None:
             return
 
+        worker = job.worker
+        if worker is not None:
+            self._release_worker(worker)
         job.set_deleted()
         self._jobs_by_id.pop(job.id)
+        if self._store is not None:
+            self._store.remove_jobs([job.id])
+        self._notify_listeners([job])
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
@@ -238,3 +609,29 @@ class JobQueue:
         if job is None:
             return {}
         return job.status()
+
+    def _load_jobs(self):
+        removed_ids = []
+        for job_data in self._store.get_jobs_data():
+            job = Job.from_data(job_data)
+            if not job.keep_in_memory():
+                removed_ids.append(job.id)
+                continue
+
+            self._jobs_by_id[job.id] = job
+            if not job.done:
+                self._queue_job(job)
+        self._store.remove_jobs(removed_ids)
+
+    def _jobs_changed(self, jobs):
+        if not jobs:
+            return
+
+        if self._store is not None:
+            self._store.save_jobs(jobs)
+        self._notify_listeners(jobs)
+
+    def _notify_listeners(self, jobs):
+        for callback in tuple(self._listeners):
+            for job in jobs:
+                callback(job)
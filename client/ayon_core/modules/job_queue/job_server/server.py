@@ -5,6 +5,7 @@ import logging
 from aiohttp import web
 
 from .jobs import JobQueue
+from .store import JobsStore
 from .job_queue_route import JobQueueResource
 from .workers_rpc_route import WorkerRpc
 
@@ -13,9 +14,10 @@ log = logging.getLogger(__name__)
 
 class WebServerManager:
     """Manger that care about web server thread."""
-    def __init__(self, port, host, loop=None):
+    def __init__(self, port, host, loop=None, db_path=None):
         self.port = port
         self.host = host
+        self.db_path = db_path
         self.app = web.Application()
         if loop is None:
             loop = asyncio.new_event_loop()
@@ -71,7 +73,10 @@ class WebServerThread(threading.Thread):
         self.runner = None
         self.site = None
 
-        job_queue = JobQueue()
+        self.jobs_store = None
+        if manager.db_path:
+            self.jobs_store = JobsStore(manager.db_path)
+        job_queue = JobQueue(self.jobs_store)
         self.job_queue_route = JobQueueResource(job_queue, manager)
         self.workers_route = WorkerRpc(job_queue, manager, loop=loop)
 
@@ -140,6 +145,8 @@ class WebServerThread(threading.Thread):
         await self.runner.cleanup()
 
         print("Runner stopped")
+        if self.jobs_store is not None:
+            self.jobs_store.close()
         tasks = [
             task
             for task in asyncio.all_tasks()
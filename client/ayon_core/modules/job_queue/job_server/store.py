@@ -0,0 +1,106 @@
+import os
+import json
+import sqlite3
+
+
+class JobsStore:
+    """Sqlite storage of jobs so the queue survives restart of the server.
+
+    Database is using WAL journal so writes of job state changes don't
+    block reading and multiple changes are written in single transaction.
+
+    Args:
+        path (str): Path to database file.
+    """
+
+    def __init__(self, path):
+        dirpath = os.path.dirname(path)
+        if dirpath:
+            os.makedirs(dirpath, exist_ok=True)
+
+        self._path = path
+        # Store is created in main thread but used in server thread
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY,"
+                " host_name TEXT NOT NULL,"
+                " state TEXT NOT NULL,"
+                " done_time REAL,"
+                " job_data TEXT NOT NULL"
+                ")"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state)"
+            )
+
+    @property
+    def path(self):
+        return self._path
+
+    def save_jobs(self, jobs):
+        """Store current state of jobs.
+
+        Args:
+            jobs (Iterable[Job]): Jobs to store.
+        """
+
+        rows = []
+        for job in jobs:
+            job_data = job.to_data()
+            rows.append((
+                job.id,
+                job.host_name,
+                job.state,
+                job_data["done_time"],
+                json.dumps(job_data, separators=(",", ":")),
+            ))
+
+        if not rows:
+            return
+
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO jobs"
+                " (id, host_name, state, done_time, job_data)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET"
+                " state = excluded.state,"
+                " done_time = excluded.done_time,"
+                " job_data = excluded.job_data",
+                rows
+            )
+
+    def remove_jobs(self, job_ids):
+        """Remove jobs from store.
+
+        Args:
+            job_ids (Iterable[str]): Ids of jobs to remove.
+        """
+
+        rows = [(job_id, ) for job_id in job_ids]
+        if not rows:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM jobs WHERE id = ?", rows
+            )
+
+    def get_jobs_data(self):
+        """Data of all stored jobs.
+
+        Returns:
+            list[dict[str, Any]]: Jobs data created by 'Job.to_data'.
+        """
+
+        # Update of existing row keeps rowid so jobs are in creation order
+        cursor = self._connection.execute(
+            "SELECT job_data FROM jobs ORDER BY rowid"
+        )
+        return [json.loads(row[0]) for row in cursor]
+
+    def close(self):
+        self._connection.close()
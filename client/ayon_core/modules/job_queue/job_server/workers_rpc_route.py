@@ -17,6 +17,9 @@ class WorkerRpc(JsonRpc):
         self._manager = manager
 
         self._stopped = False
+        # Event is created in server loop, see '_rpc_loop'
+        self._jobs_changed = None
+        self._job_queue.add_listener(self._on_job_change)
 
         # Register methods
         self.add_methods(
@@ -33,40 +36,49 @@ class WorkerRpc(JsonRpc):
     async def register_worker(self, request, host_name):
         worker = Worker(host_name, request.http_request)
         self._job_queue.add_worker(worker)
+        self._wake_up()
         return worker.id
 
+    def _on_job_change(self, job):
+        self._wake_up()
+
+    def _wake_up(self):
+        if self._jobs_changed is not None:
+            self._jobs_changed.set()
+
     async def _rpc_loop(self):
+        self._jobs_changed = asyncio.Event()
         while self.loop.is_running():
             if self._stopped:
                 break
 
+            self._jobs_changed.clear()
             for worker in tuple(self._job_queue.workers()):
                 if not worker.connection_is_alive():
                     self._job_queue.remove_worker(worker)
             self._job_queue.assign_jobs()
 
             await self.send_jobs()
-            await asyncio.sleep(5)
+            # Wait for change of jobs or workers, check state of worker
+            #   connections at least each 5 seconds
+            try:
+                await asyncio.wait_for(self._jobs_changed.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                pass
 
     async def job_done(self, worker_id, job_id, success, message, data):
-        worker = self._job_queue.get_worker(worker_id)
-        if worker is not None:
-            worker.set_current_job(None)
-
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
+        self._job_queue.job_done(worker_id, job_id, success, message, data)
         return True
 
     async def send_jobs(self):
         invalid_workers = []
-        for worker in self._job_queue.workers():
-            if worker.job_assigned() and not worker.is_working():
-                try:
-                    await worker.send_job()
+        for worker in self._job_queue.assigned_workers():
+            try:
+                if await worker.send_job():
+                    self._job_queue.job_sent(worker)
 
-                except ConnectionResetError:
-                    invalid_workers.append(worker)
+            except ConnectionResetError:
+                invalid_workers.append(worker)
 
         for worker in invalid_workers:
             self._job_queue.remove_worker(worker)
@@ -190,6 +190,8 @@ def prepare_failed_creator_operation_info(
 
 
 _EMPTY_VALUE = object()
+# Values of these types can be changed in place without setting them
+_MUTABLE_TYPES = (dict, list, set)
 
 
 class TrackChangesItem(object):
@@ -563,6 +565,11 @@ class AttributeValues(object):
             if value is not None:
                 self._data[attr_def.key] = value
 
+        # Keys of which values may differ from origin data
+        self._changed_keys = self._get_changed_keys(
+            set(self._origin_data.keys()) | set(self._attr_defs_by_key)
+        )
+
     def __setitem__(self, key, value):
         if key not in self._attr_defs_by_key:
             raise KeyError("Key \"{}\" was not found.".format(key))
@@ -571,6 +578,7 @@ class AttributeValues(object):
         if old_value == value:
             return
         self._data[key] = value
+        self._changed_keys.add(key)
 
     def __getitem__(self, key):
         if key not in self._attr_defs_by_key:
@@ -602,6 +610,7 @@ class AttributeValues(object):
 
     def pop(self, key, default=None):
         value = self._data.pop(key, default)
+        self._changed_keys.add(key)
         # Remove attribute definition if is 'UnknownDef'
         # - gives option to get rid of unknown values
         attr_def = self._attr_defs_by_key.get(key)
@@ -611,10 +620,58 @@ class AttributeValues(object):
         return value
 
     def reset_values(self):
+        self._changed_keys.update(self._data)
         self._data = {}
 
+    def has_changes(self):
+        """Values changed from origin data.
+
+        Only values which were set, or which can be changed in place, are
+        compared with origin data.
+
+        Returns:
+            bool: Values changed.
+        """
+
+        return bool(self._get_changed_keys(self._get_candidate_keys()))
+
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self._data)
+        # Copy only changed values
+        origin_data = dict(self._origin_data)
+        for key in self._get_changed_keys(self._get_candidate_keys()):
+            value = self._get_value_to_store(key)
+            if value is _EMPTY_VALUE:
+                origin_data.pop(key, None)
+            else:
+                origin_data[key] = copy.deepcopy(value)
+        self._origin_data = origin_data
+        self._changed_keys = set()
+
+    def _get_value_to_store(self, key):
+        if key in self._data:
+            return self._data[key]
+        attr_def = self._attr_defs_by_key.get(key)
+        if attr_def is not None:
+            return attr_def.default
+        return _EMPTY_VALUE
+
+    def _get_candidate_keys(self):
+        keys = set(self._changed_keys)
+        for key, value in self._data.items():
+            if isinstance(value, _MUTABLE_TYPES):
+                keys.add(key)
+        return keys
+
+    def _get_changed_keys(self, keys):
+        origin_data = self._origin_data
+        return {
+            key
+            for key in keys
+            if (
+                origin_data.get(key, _EMPTY_VALUE)
+                != self._get_value_to_store(key)
+            )
+        }
 
     @property
     def attr_defs(self):
@@ -747,6 +804,7 @@ class PublishAttributes:
         if key in self._missing_plugins:
             self._missing_plugins.remove(key)
             removed_item = self._data.pop(key)
+            self._changed_keys.add(key)
             return removed_item.data_to_store()
 
         value_item = self._data[key]
@@ -762,8 +820,53 @@ class PublishAttributes:
         for name in self._plugin_names_order:
             yield name
 
+    def has_changes(self):
+        """Values of any plugin changed from origin data.
+
+        Returns:
+            bool: Values changed.
+        """
+
+        return bool(self._get_changed_keys(self._get_candidate_keys()))
+
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self.data_to_store())
+        # Copy only changed values
+        origin_data = dict(self._origin_data)
+        for key in self._get_changed_keys(self._get_candidate_keys()):
+            value_item = self._data.get(key)
+            if value_item is None:
+                origin_data.pop(key, None)
+            else:
+                origin_data[key] = copy.deepcopy(value_item.data_to_store())
+        self._origin_data = origin_data
+        self._changed_keys = set()
+
+        for value_item in self._data.values():
+            value_item.mark_as_stored()
+
+    def _get_candidate_keys(self):
+        keys = set(self._changed_keys)
+        for key, value_item in self._data.items():
+            if value_item.has_changes():
+                keys.add(key)
+        return keys
+
+    def _get_changed_keys(self, keys):
+        changed_keys = set()
+        for key in keys:
+            value_item = self._data.get(key)
+            value = _EMPTY_VALUE
+            if value_item is not None:
+                value = value_item.data_to_store()
+            if self._origin_data.get(key, _EMPTY_VALUE) != value:
+                changed_keys.add(key)
+        return changed_keys
+
+    def _reset_changed_keys(self):
+        # Converted or missing plugin values may differ from origin data
+        self._changed_keys = self._get_changed_keys(
+            set(self._origin_data) | set(self._data)
+        )
 
     def data_to_store(self):
         """Convert attribute values to "data to store"."""
@@ -812,6 +915,7 @@ class PublishAttributes:
                 self._data[key] = PublishAttributeValues(
                     self, [], value, value
                 )
+        self._reset_changed_keys()
 
     def serialize_attributes(self):
         return {
@@ -848,6 +952,7 @@ class PublishAttributes:
                 self._data[key] = PublishAttributeValues(
                     self, [], value, value
                 )
+        self._reset_changed_keys()
 
 
 class CreatedInstance:
@@ -982,6 +1087,9 @@ class CreatedInstance:
         if not self._data.get("instance_id"):
             self._data["instance_id"] = str(uuid4())
 
+        # Keys of which values may differ from origin data
+        self._reset_changed_keys()
+
         self._asset_is_valid = self.has_set_asset
         self._task_is_valid = self.has_set_task
 
@@ -1006,6 +1114,7 @@ class CreatedInstance:
         # Validate immutable keys
         if key not in self.__immutable_keys:
             self._data[key] = value
+            self._changed_keys.add(key)
 
         elif value != self._data.get(key):
             # Raise exception if key is immutable and value has changed
@@ -1020,6 +1129,7 @@ class CreatedInstance:
             raise ImmutableKeyError(key)
 
         self._data.pop(key, *args, **kwargs)
+        self._changed_keys.add(key)
 
     def keys(self):
         return self._data.keys()
@@ -1112,28 +1222,73 @@ class CreatedInstance:
         return self._transient_data
 
     def changes(self):
-        """Calculate and return changes."""
+        """Calculate and return changes.
+
+        Use 'has_changes' to check if there are any changes, which does
+        not create copy of data.
+        """
 
         return TrackChangesItem(self.origin_data, self.data_to_store())
 
+    def has_changes(self):
+        """Instance data changed from origin data.
+
+        Changed keys are tracked on write so only these and values which
+        can be changed in place are compared with origin data.
+
+        Returns:
+            bool: Instance data changed.
+        """
+
+        return (
+            bool(self._get_changed_keys(self._get_candidate_keys()))
+            or self.creator_attributes.has_changes()
+            or self.publish_attributes.has_changes()
+        )
+
     def mark_as_stored(self):
         """Should be called when instance data are stored.
 
         Origin data are replaced by current data so changes are cleared.
         """
 
-        orig_keys = set(self._orig_data.keys())
+        # Copy only changed values
+        orig_data = dict(self._orig_data)
+        for key in self._get_changed_keys(self._get_candidate_keys()):
+            value = self._data.get(key, _EMPTY_VALUE)
+            if value is _EMPTY_VALUE:
+                orig_data.pop(key, None)
+            else:
+                orig_data[key] = copy.deepcopy(value)
+        self._orig_data = orig_data
+        self._changed_keys = set()
+
+        self.creator_attributes.mark_as_stored()
+        self.publish_attributes.mark_as_stored()
+
+    def _get_candidate_keys(self):
+        keys = set(self._changed_keys)
         for key, value in self._data.items():
-            orig_keys.discard(key)
+            if isinstance(value, _MUTABLE_TYPES):
+                keys.add(key)
+        return keys
+
+    def _get_changed_keys(self, keys):
+        changed_keys = set()
+        for key in keys:
             if key in ("creator_attributes", "publish_attributes"):
                 continue
-            self._orig_data[key] = copy.deepcopy(value)
-
-        for key in orig_keys:
-            self._orig_data.pop(key)
+            if (
+                self._orig_data.get(key, _EMPTY_VALUE)
+                != self._data.get(key, _EMPTY_VALUE)
+            ):
+                changed_keys.add(key)
+        return changed_keys
 
-        self.creator_attributes.mark_as_stored()
-        self.publish_attributes.mark_as_stored()
+    def _reset_changed_keys(self):
+        self._changed_keys = self._get_changed_keys(
+            set(self._orig_data) | set(self._data)
+        )
 
     @property
     def creator_attributes(self):
@@ -1277,6 +1432,7 @@ class CreatedInstance:
             creator_attr_defs=creator_attr_defs
         )
         obj._orig_data = serialized_data["orig_data"]
+        obj._reset_changed_keys()
         obj.publish_attributes.deserialize_attributes(publish_attributes)
 
         return obj
@@ -2305,6 +2461,10 @@ class CreateContext:
         """Save instance specific values."""
         instances_by_identifier = collections.defaultdict(list)
         for instance in self._instances_by_id.values():
+            # Skip unchanged instances without calculating changes
+            if not instance.has_changes():
+                continue
+
             instance_changes = instance.changes()
             if not instance_changes:
                 continue
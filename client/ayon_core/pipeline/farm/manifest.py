@@ -0,0 +1,98 @@
+"""Manifests of rendered files written by farm render tasks.
+
+Render tasks write names of files they rendered to a manifest directory
+next to the rendered files, so publishing does not have to list or stat
+render output directories on network storage.
+
+Manifest layout:
+    <output dir>/.ayon_manifest/<job id>.<task id>.txt
+
+Each manifest file contains one file name (relative to output dir) per
+line. Format must be kept in sync with 'GlobalJobPreLoad.py' of Deadline
+repository plugins.
+"""
+import os
+
+MANIFEST_DIRNAME = ".ayon_manifest"
+MANIFEST_EXT = ".txt"
+
+
+def get_manifest_dir(output_dir):
+    """Path to manifest directory of render output directory.
+
+    Args:
+        output_dir (str): Render output directory.
+
+    Returns:
+        str: Path to manifest directory.
+    """
+    return os.path.join(output_dir, MANIFEST_DIRNAME)
+
+
+def get_manifest_files(output_dir, job_ids=None):
+    """Names of rendered files stored in manifests of output directory.
+
+    Args:
+        output_dir (str): Render output directory.
+        job_ids (Optional[Iterable[str]]): Use only manifests of these jobs.
+            All manifests are used if not passed.
+
+    Returns:
+        Union[set[str], None]: File names or None if there is no manifest.
+    """
+    manifest_dir = get_manifest_dir(output_dir)
+    if job_ids is not None:
+        job_ids = set(job_ids)
+
+    filenames = None
+    try:
+        entries = list(os.scandir(manifest_dir))
+    except OSError:
+        return None
+
+    for entry in entries:
+        name, ext = os.path.splitext(entry.name)
+        if ext != MANIFEST_EXT:
+            continue
+        job_id = name.split(".", 1)[0]
+        if job_ids is not None and job_id not in job_ids:
+            continue
+
+        try:
+            with open(entry.path, "r") as stream:
+                content = stream.read()
+        except OSError:
+            continue
+
+        if filenames is None:
+            filenames = set()
+        filenames.update(line for line in content.splitlines() if line)
+    return filenames
+
+
+def get_existing_files(output_dir, expected_files=None, job_ids=None):
+    """Names of existing files in render output directory.
+
+    Manifests of render jobs are used when they contain all expected
+    files. Otherwise, e.g. when files were not rendered by job with
+    manifest support or were copied to the directory, the directory is
+    listed in single 'os.scandir' pass.
+
+    Args:
+        output_dir (str): Render output directory.
+        expected_files (Optional[Iterable[str]]): Names of expected files.
+        job_ids (Optional[Iterable[str]]): Use only manifests of these jobs.
+
+    Returns:
+        set[str]: Names of existing files.
+    """
+    if expected_files is not None:
+        manifest_files = get_manifest_files(output_dir, job_ids)
+        if (
+            manifest_files is not None
+            and manifest_files.issuperset(expected_files)
+        ):
+            return manifest_files
+
+    with os.scandir(output_dir) as entries:
+        return {entry.name for entry in entries}
@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
 import re
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_aov_patterns(aov_patterns):
+    return tuple(re.compile(pattern) for pattern in aov_patterns)
 
 
 def match_aov_pattern(host_name, aov_patterns, render_file_name):
@@ -10,6 +16,8 @@ def match_aov_pattern(host_name, aov_patterns, render_file_name):
     grabbing the render filename string  from the collection
     that we have grabbed from `exp_files`.
 
+    Patterns are compiled only once per set of patterns.
+
     Args:
         host_name (str): Host name.
         aov_patterns (dict):  AOV patterns from AOV filters.
@@ -21,4 +29,7 @@ def match_aov_pattern(host_name, aov_patterns, render_file_name):
     aov_pattern = aov_patterns.get(host_name, [])
     if not aov_pattern:
         return False
-    return any(re.match(p, render_file_name) for p in aov_pattern)
+    return any(
+        pattern.match(render_file_name)
+        for pattern in _compile_aov_patterns(tuple(aov_pattern))
+    )
@@ -19,6 +19,7 @@ from ayon_core.client import (
 from ayon_core.lib import Logger
 from ayon_core.pipeline.publish import KnownPublishError
 from ayon_core.pipeline.farm.patterning import match_aov_pattern
+from ayon_core.pipeline.farm.sequences import assemble_sequences
 
 
 @attr.s
@@ -322,13 +323,13 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
     """
     representations = []
     host_name = os.environ.get("AYON_HOST_NAME", "")
-    collections, remainders = clique.assemble(exp_files)
+    sequences, remainders = assemble_sequences(exp_files)
 
     log = Logger.get_logger("farm_publishing")
 
     # create representation for every collected sequence
-    for collection in collections:
-        ext = collection.tail.lstrip(".")
+    for sequence in sequences:
+        ext = sequence.tail.lstrip(".")
         preview = False
         # TODO 'useSequenceForReview' is temporary solution which does
         #   not work for 100% of cases. We must be able to tell what
@@ -343,14 +344,14 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
                 )
                 preview = True
             else:
-                render_file_name = list(collection)[0]
+                render_file_name = sequence.files[0]
                 # if filtered aov name is found in filename, toggle it for
                 # preview video rendering
                 preview = match_aov_pattern(
                     host_name, aov_filter, render_file_name
                 )
 
-        staging = os.path.dirname(list(collection)[0])
+        staging = os.path.dirname(sequence.files[0])
         success, rootless_staging_dir = (
             anatomy.find_root_template_from_path(staging)
         )
@@ -371,7 +372,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
         rep = {
             "name": ext,
             "ext": ext,
-            "files": [os.path.basename(f) for f in list(collection)],
+            "files": [os.path.basename(f) for f in sequence.files],
             "frameStart": frame_start,
             "frameEnd": int(skeleton_data.get("frameEndHandle")),
             # If expectedFile are absolute, we need only filenames
@@ -552,10 +553,10 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
     instances = []
     # go through AOVs in expected files
     for aov, files in exp_files[0].items():
-        cols, rem = clique.assemble(files)
+        sequences, rem = assemble_sequences(files)
         # we shouldn't have any reminders. And if we do, it should
         # be just one item for single frame renders.
-        if not cols and rem:
+        if not sequences and rem:
             if len(rem) != 1:
                 raise ValueError("Found multiple non related files "
                                  "to render, don't know what to do "
@@ -565,10 +566,10 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
         else:
             # but we really expect only one collection.
             # Nothing else make sense.
-            if len(cols) != 1:
+            if len(sequences) != 1:
                 raise ValueError("Only one image sequence type is expected.")  # noqa: E501
-            ext = cols[0].tail.lstrip(".")
-            col = list(cols[0])
+            ext = sequences[0].tail.lstrip(".")
+            col = sequences[0].files
 
         # create product name `<product type><Task><Product name>`
         # TODO refactor/remove me
@@ -853,15 +854,15 @@ def prepare_cache_representations(skeleton_data, exp_files, anatomy):
 
     """
     representations = []
-    collections, remainders = clique.assemble(exp_files)
+    sequences, _ = assemble_sequences(exp_files)
 
     log = Logger.get_logger("farm_publishing")
 
     # create representation for every collected sequence
-    for collection in collections:
-        ext = collection.tail.lstrip(".")
+    for sequence in sequences:
+        ext = sequence.tail.lstrip(".")
 
-        staging = os.path.dirname(list(collection)[0])
+        staging = os.path.dirname(sequence.files[0])
         success, rootless_staging_dir = (
             anatomy.find_root_template_from_path(staging)
         )
@@ -877,7 +878,7 @@ def prepare_cache_representations(skeleton_data, exp_files, anatomy):
         rep = {
             "name": ext,
             "ext": ext,
-            "files": [os.path.basename(f) for f in list(collection)],
+            "files": [os.path.basename(f) for f in sequence.files],
             "frameStart": frame_start,
             "frameEnd": int(skeleton_data.get("frameEndHandle")),
             # If expectedFile are absolute, we need only filenames
@@ -918,10 +919,10 @@ def create_instances_for_cache(instance, skeleton):
     instances = []
     # go through AOVs in expected files
     for _, files in exp_files[0].items():
-        cols, rem = clique.assemble(files)
+        sequences, rem = assemble_sequences(files)
         # we shouldn't have any reminders. And if we do, it should
         # be just one item for single frame renders.
-        if not cols and rem:
+        if not sequences and rem:
             if len(rem) != 1:
                 raise ValueError("Found multiple non related files "
                                  "to render, don't know what to do "
@@ -931,10 +932,10 @@ def create_instances_for_cache(instance, skeleton):
         else:
             # but we really expect only one collection.
             # Nothing else make sense.
-            if len(cols) != 1:
+            if len(sequences) != 1:
                 raise ValueError("Only one image sequence type is expected.")  # noqa: E501
-            ext = cols[0].tail.lstrip(".")
-            col = list(cols[0])
+            ext = sequences[0].tail.lstrip(".")
+            col = sequences[0].files
 
         if isinstance(col, (list, tuple)):
             staging = os.path.dirname(col[0])
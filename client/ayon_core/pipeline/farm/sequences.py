@@ -0,0 +1,117 @@
+import re
+import collections
+
+import clique
+
+_DIGITS_REGEX = re.compile(clique.DIGITS_PATTERN)
+
+
+class FilesSequence:
+    """Sequence of files assembled from expected files.
+
+    Args:
+        collection (clique.Collection): Collection of the files.
+        files (list[str]): Files of the collection ordered by frame.
+    """
+
+    def __init__(self, collection, files):
+        self.collection = collection
+        self.files = files
+
+    @property
+    def head(self):
+        return self.collection.head
+
+    @property
+    def tail(self):
+        return self.collection.tail
+
+
+def assemble_sequences(paths):
+    """Assemble file paths into sequences.
+
+    Result is same as from 'clique.assemble' with default arguments, but
+    paths are parsed only once and membership of files in collections is
+    resolved using sets. That matters for expected files of renders with
+    many AOVs and frames, where each number in path (e.g. version or
+    resolution) creates a single item candidate collection.
+
+    Args:
+        paths (Iterable[str]): File paths.
+
+    Returns:
+        tuple[list[FilesSequence], list[str]]: Sequences and paths which
+            are not part of any sequence.
+    """
+    indexes_by_key = collections.defaultdict(set)
+    remainder = []
+    for path in paths:
+        matched = False
+        for match in _DIGITS_REGEX.finditer(path):
+            index = match.group("index")
+            padding = len(index) if match.group("padding") else 0
+            key = (
+                path[:match.start("index")],
+                path[match.end("index"):],
+                padding
+            )
+            indexes_by_key[key].add(int(index))
+            matched = True
+
+        if not matched:
+            remainder.append(path)
+
+    # Merge unpadded indexes to padded collections with same head and
+    #   tail, like 'clique.assemble' does
+    merge_candidates = collections.defaultdict(list)
+    for key in indexes_by_key:
+        head, tail, padding = key
+        if padding == 0:
+            merge_candidates[(head, tail)].append(key)
+
+    fully_merged = set()
+    for (head, tail, padding), indexes in indexes_by_key.items():
+        if padding == 0:
+            continue
+
+        for candidate_key in merge_candidates.get((head, tail), []):
+            candidate_indexes = indexes_by_key[candidate_key]
+            merged_index_count = 0
+            for index in candidate_indexes:
+                if len(str(abs(index))) == padding:
+                    indexes.add(index)
+                    merged_index_count += 1
+
+            if merged_index_count == len(candidate_indexes):
+                fully_merged.add(candidate_key)
+
+    # Collection objects are created only for sequences, most of keys
+    #   have only single index
+    sequences = []
+    filtered_out = []
+    members = set()
+    for key, indexes in indexes_by_key.items():
+        if key in fully_merged:
+            continue
+
+        head, tail, padding = key
+        files = [
+            "{}{:0{}d}{}".format(head, index, padding, tail)
+            for index in sorted(indexes)
+        ]
+        if len(files) < 2:
+            filtered_out.extend(files)
+            continue
+
+        collection = clique.Collection(head, tail, padding, indexes)
+        sequences.append(FilesSequence(collection, files))
+        members.update(files)
+
+    remainder_set = set(remainder)
+    for path in filtered_out:
+        if path in remainder_set or path in members:
+            continue
+        remainder_set.add(path)
+        remainder.append(path)
+
+    return sequences, remainder
@@ -18,12 +18,12 @@ from ayon_core.client import (
     get_last_version_by_subset_id,
     get_hero_version_by_subset_id,
     get_version_by_name,
-    get_last_versions,
     get_representations,
     get_representation_by_id,
     get_representation_by_name,
     get_representation_parents
 )
+from ayon_core.client import entities_v4
 from ayon_core.lib import (
     StringTemplate,
     TemplateUnsolved,
@@ -838,55 +838,59 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
+    # Query only few fields without conversion to v3 documents
+    #   - there can be thousands of containers in scene
+    repre_entities = entities_v4.get_representations(
         project_name,
         representation_ids=repre_ids,
-        fields=["_id", "parent"]
+        fields={"id", "versionId"}
     )
     # Store representations by stringified representation id
-    repre_docs_by_str_id = {}
-    repre_docs_by_version_id = collections.defaultdict(list)
-    for repre_doc in repre_docs:
-        repre_id = str(repre_doc["_id"])
-        version_id = repre_doc["parent"]
-        repre_docs_by_str_id[repre_id] = repre_doc
-        repre_docs_by_version_id[version_id].append(repre_doc)
-
-    # Query version docs to get it's subset ids
+    repre_entities_by_str_id = {}
+    repre_entities_by_version_id = collections.defaultdict(list)
+    for repre_entity in repre_entities:
+        repre_id = str(repre_entity["id"])
+        version_id = repre_entity["versionId"]
+        repre_entities_by_str_id[repre_id] = repre_entity
+        repre_entities_by_version_id[version_id].append(repre_entity)
+
+    # Query version entities to get it's product ids
     # - also query hero version to be able identify if representation
     #   belongs to existing version
-    version_docs = get_versions(
+    version_entities = entities_v4.get_versions(
         project_name,
-        version_ids=repre_docs_by_version_id.keys(),
+        version_ids=repre_entities_by_version_id.keys(),
         hero=True,
-        fields=["_id", "parent", "type"]
+        active=None,
+        fields={"id", "productId", "version"}
     )
     verisons_by_id = {}
-    versions_by_subset_id = collections.defaultdict(list)
+    versions_by_product_id = collections.defaultdict(list)
     hero_version_ids = set()
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
+    for version_entity in version_entities:
+        version_id = version_entity["id"]
         # Store versions by their ids
-        verisons_by_id[version_id] = version_doc
-        # There's no need to query subsets for hero versions
+        verisons_by_id[version_id] = version_entity
+        # There's no need to query products for hero versions
         #   - they are considered as latest?
-        if version_doc["type"] == "hero_version":
+        if version_entity["version"] < 0:
             hero_version_ids.add(version_id)
             continue
-        subset_id = version_doc["parent"]
-        versions_by_subset_id[subset_id].append(version_doc)
+        product_id = version_entity["productId"]
+        versions_by_product_id[product_id].append(version_entity)
 
-    last_versions = get_last_versions(
+    last_versions = entities_v4.get_last_versions(
         project_name,
-        subset_ids=versions_by_subset_id.keys(),
-        fields=["_id"]
+        product_ids=versions_by_product_id.keys(),
+        active=None,
+        fields={"id"}
     )
     # Figure out which versions are outdated
     outdated_version_ids = set()
-    for subset_id, last_version_doc in last_versions.items():
-        for version_doc in versions_by_subset_id[subset_id]:
-            version_id = version_doc["_id"]
-            if version_id != last_version_doc["_id"]:
+    for product_id, last_version_entity in last_versions.items():
+        for version_entity in versions_by_product_id[product_id]:
+            version_id = version_entity["id"]
+            if version_id != last_version_entity["id"]:
                 outdated_version_ids.add(version_id)
 
     # Based on all collected data figure out which containers are outdated
@@ -898,8 +902,8 @@ def filter_containers(containers, project_name):
             invalid_containers.append(container)
             continue
 
-        repre_doc = repre_docs_by_str_id.get(repre_id)
-        if not repre_doc:
+        repre_entity = repre_entities_by_str_id.get(repre_id)
+        if not repre_entity:
             log.debug((
                 "Container '{}' has an invalid representation."
                 " It is missing in the database."
@@ -907,7 +911,7 @@ def filter_containers(containers, project_name):
             not_found_containers.append(container)
             continue
 
-        version_id = repre_doc["parent"]
+        version_id = repre_entity["versionId"]
         if version_id in outdated_version_ids:
             outdated_containers.append(container)
 
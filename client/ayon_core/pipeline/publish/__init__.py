@@ -44,6 +44,12 @@ from .lib import (
     get_publish_instance_families,
 )
 
+from .worker import (
+    PublishWorker,
+    submit_publish_request,
+    get_publish_request_result,
+)
+
 from .abstract_expected_files import ExpectedFiles
 from .abstract_collect_render import (
     RenderInstance,
@@ -92,6 +98,10 @@ __all__ = (
     "get_publish_instance_label",
     "get_publish_instance_families",
 
+    "PublishWorker",
+    "submit_publish_request",
+    "get_publish_request_result",
+
     "ExpectedFiles",
 
     "RenderInstance",
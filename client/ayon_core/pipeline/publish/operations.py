@@ -0,0 +1,175 @@
+"""Entity operations of whole publish committed in few large requests.
+
+Integrators which defer commit of their entity operations add them to
+batch stored on publish context, together with file transactions of the
+instance. Batch is committed by 'CommitPublishOperations' plugin after
+integration of all instances.
+
+Operations are committed in order in which they were added. Operations of
+single instance are never split into multiple requests, so product,
+version and representations of an instance are created in one
+transaction. File transactions are finalized when operations of the
+instance are committed and rolled back if they failed.
+"""
+
+import collections
+
+from ayon_core.lib import Logger
+from ayon_core.client.operations import OperationsSession
+
+from .publish_plugins import KnownPublishError
+
+PUBLISH_OPERATIONS_BATCH_KEY = "publishOperationsBatch"
+
+_BatchItem = collections.namedtuple(
+    "_BatchItem", ["label", "operations", "file_transactions"]
+)
+
+
+class PublishOperationsBatch:
+    """Operations of multiple instances committed together.
+
+    Args:
+        max_operations_per_request (Optional[int]): Operations of instances
+            are sent in requests with up to this count of operations. All
+            operations are sent in single request if not set.
+    """
+
+    def __init__(self, max_operations_per_request=None):
+        self._max_operations_per_request = max_operations_per_request
+        self._items = []
+        self._log = None
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    def add(self, label, op_session, file_transactions=None):
+        """Add operations of an instance.
+
+        Args:
+            label (str): Label of instance used in report.
+            op_session (OperationsSession): Session with operations.
+            file_transactions (Optional[FileTransaction]): Processed file
+                transactions which are finalized or rolled back based on
+                result of operations commit.
+        """
+
+        self._items.append(
+            _BatchItem(label, op_session.operations, file_transactions)
+        )
+
+    def commit(self):
+        """Commit operations of all instances.
+
+        Raises:
+            KnownPublishError: When commit of operations failed. Files of
+                instances which were not committed are rolled back.
+        """
+
+        items, self._items = self._items, []
+        batches = self._split_to_batches(items)
+        for idx, batch in enumerate(batches):
+            op_session = OperationsSession()
+            for item in batch:
+                op_session.extend(item.operations)
+
+            try:
+                op_session.commit()
+
+            except Exception as exc:
+                failed_items = [
+                    item
+                    for failed_batch in batches[idx:]
+                    for item in failed_batch
+                ]
+                committed_labels = [
+                    item.label
+                    for committed_batch in batches[:idx]
+                    for item in committed_batch
+                ]
+                self._rollback_items(failed_items)
+                raise KnownPublishError((
+                    "Failed to commit published entities. {}\n"
+                    "Committed instances: {}\n"
+                    "Rolled back instances: {}"
+                ).format(
+                    exc,
+                    ", ".join(committed_labels) or "< None >",
+                    ", ".join(item.label for item in failed_items)
+                ))
+
+            for item in batch:
+                if item.file_transactions is not None:
+                    item.file_transactions.finalize()
+
+        if items:
+            self.log.info(
+                "Committed entities of {} instances in {} batches".format(
+                    len(items), len(batches)
+                )
+            )
+
+    def rollback(self):
+        """Discard operations and rollback files of all instances.
+
+        Should be used when integration failed and operations of other
+        instances should not be committed.
+        """
+
+        items, self._items = self._items, []
+        self._rollback_items(items)
+
+    def _rollback_items(self, items):
+        for item in items:
+            if item.file_transactions is not None:
+                item.file_transactions.rollback()
+
+        if items:
+            self.log.warning("Rolled back files of instances: {}".format(
+                ", ".join(item.label for item in items)
+            ))
+
+    def _split_to_batches(self, items):
+        max_count = self._max_operations_per_request
+        batches = []
+        batch = []
+        batch_count = 0
+        for item in items:
+            count = len(item.operations)
+            if batch and max_count and batch_count + count > max_count:
+                batches.append(batch)
+                batch = []
+                batch_count = 0
+            batch.append(item)
+            batch_count += count
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+
+def get_publish_operations_batch(context, max_operations_per_request=None):
+    """Operations batch of publish context.
+
+    Batch is created if context does not have one.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+        max_operations_per_request (Optional[int]): Used when batch is
+            created.
+
+    Returns:
+        PublishOperationsBatch: Operations batch of the publish.
+    """
+
+    batch = context.data.get(PUBLISH_OPERATIONS_BATCH_KEY)
+    if batch is None:
+        batch = PublishOperationsBatch(max_operations_per_request)
+        context.data[PUBLISH_OPERATIONS_BATCH_KEY] = batch
+    return batch
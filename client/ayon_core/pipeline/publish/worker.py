@@ -0,0 +1,341 @@
+"""Long running worker processing publish requests.
+
+Worker keeps addons, discovered plugins and application environments
+in memory, so each publish request does not have to start a new process.
+
+Requests are json files in a queue directory. Each request is claimed by
+moving it to 'processing' subfolder and result with timing information
+is stored to 'done' subfolder when the request is processed.
+
+Request data:
+    {
+        "paths": ["/path/to/metadata.json"],
+        "targets": ["farm"],
+        "env": {"AYON_PROJECT_NAME": "project", ...}
+    }
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import traceback
+
+from ayon_core.lib import Logger
+
+PENDING_DIRNAME = "pending"
+PROCESSING_DIRNAME = "processing"
+DONE_DIRNAME = "done"
+
+# Environment keys used by older jobs
+_OLD_ENV_KEYS = (
+    ("AVALON_PROJECT", "AYON_PROJECT_NAME"),
+    ("AVALON_ASSET", "AYON_FOLDER_PATH"),
+    ("AVALON_TASK", "AYON_TASK_NAME"),
+    ("AVALON_WORKDIR", "AYON_WORKDIR"),
+    ("AVALON_APP_NAME", "AYON_APP_NAME"),
+    ("AVALON_APP", "AYON_HOST_NAME"),
+)
+
+
+def _write_json_atomic(path, data):
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "w") as stream:
+        json.dump(data, stream, indent=4)
+    os.replace(tmp_path, path)
+
+
+def submit_publish_request(queue_dir, paths, targets=None, env=None):
+    """Add publish request to queue of publish worker.
+
+    Args:
+        queue_dir (str): Queue directory of publish worker.
+        paths (list[str]): Paths to publish metadata json files.
+        targets (Optional[list[str]]): Pyblish targets. 'farm' is used
+            if not passed.
+        env (Optional[dict[str, str]]): Environment variables used during
+            publishing of the request.
+
+    Returns:
+        str: Request id. Result is stored to 'done/<request id>.json'.
+    """
+
+    if not paths:
+        raise ValueError("No publish paths specified")
+
+    # Time prefix keeps order of requests in queue
+    request_id = "{}-{}".format(int(time.time() * 1000), uuid.uuid4().hex)
+    pending_dir = os.path.join(queue_dir, PENDING_DIRNAME)
+    os.makedirs(pending_dir, exist_ok=True)
+    _write_json_atomic(
+        os.path.join(pending_dir, request_id + ".json"),
+        {
+            "paths": list(paths),
+            "targets": list(targets or []),
+            "env": dict(env or {}),
+            "submitted_at": time.time(),
+        }
+    )
+    return request_id
+
+
+def get_publish_request_result(queue_dir, request_id):
+    """Result of processed publish request.
+
+    Args:
+        queue_dir (str): Queue directory of publish worker.
+        request_id (str): Request id.
+
+    Returns:
+        Union[dict[str, Any], None]: Result data or None if the request
+            was not processed yet.
+    """
+
+    path = os.path.join(queue_dir, DONE_DIRNAME, request_id + ".json")
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as stream:
+        return json.load(stream)
+
+
+class PublishWorker:
+    """Process publish requests from queue directory in single process.
+
+    Publish plugins are discovered once per project because settings are
+    applied to plugins during discovery. Application environments are
+    cached per context. Each request is published with new pyblish context
+    and environment variables are restored after each request.
+
+    Args:
+        queue_dir (str): Directory with queue of publish requests.
+        poll_interval (Optional[float]): Seconds between checks of new
+            requests.
+    """
+
+    def __init__(self, queue_dir, poll_interval=1.0):
+        self._queue_dir = queue_dir
+        self._poll_interval = poll_interval
+        self._worker_id = "{}-{}".format(socket.gethostname(), os.getpid())
+        self._log = Logger.get_logger(self.__class__.__name__)
+
+        self._installed = False
+        self._plugins_by_project = {}
+        self._app_env_by_context = {}
+
+    def run(self, max_requests=None, idle_timeout=None):
+        """Process requests until limits are reached.
+
+        Args:
+            max_requests (Optional[int]): Stop after processing this amount
+                of requests.
+            idle_timeout (Optional[float]): Stop when there was no request
+                for this amount of seconds.
+
+        Returns:
+            int: Number of processed requests.
+        """
+
+        self._install()
+        for dirname in (PENDING_DIRNAME, PROCESSING_DIRNAME, DONE_DIRNAME):
+            os.makedirs(os.path.join(self._queue_dir, dirname), exist_ok=True)
+
+        processed = 0
+        last_request_time = time.time()
+        while max_requests is None or processed < max_requests:
+            request_path = self._claim_next_request()
+            if request_path is None:
+                if (
+                    idle_timeout is not None
+                    and time.time() - last_request_time > idle_timeout
+                ):
+                    break
+                time.sleep(self._poll_interval)
+                continue
+
+            self._process_request_file(request_path)
+            processed += 1
+            last_request_time = time.time()
+        return processed
+
+    def _install(self):
+        if self._installed:
+            return
+
+        import pyblish.api
+
+        from ayon_core.addon import AddonsManager
+        from ayon_core.pipeline import install_ayon_plugins
+
+        install_ayon_plugins()
+
+        manager = AddonsManager()
+        for path in manager.collect_plugin_paths()["publish"]:
+            pyblish.api.register_plugin_path(path)
+
+        pyblish.api.register_host("shell")
+        self._installed = True
+
+    def _claim_next_request(self):
+        pending_dir = os.path.join(self._queue_dir, PENDING_DIRNAME)
+        processing_dir = os.path.join(self._queue_dir, PROCESSING_DIRNAME)
+        filenames = sorted(
+            filename
+            for filename in os.listdir(pending_dir)
+            if filename.endswith(".json")
+        )
+        for filename in filenames:
+            src_path = os.path.join(pending_dir, filename)
+            dst_path = os.path.join(processing_dir, filename)
+            # Rename is atomic, only one worker can claim the request
+            try:
+                os.rename(src_path, dst_path)
+            except OSError:
+                continue
+            return dst_path
+        return None
+
+    def _process_request_file(self, request_path):
+        filename = os.path.basename(request_path)
+        request_id = os.path.splitext(filename)[0]
+        start_time = time.time()
+        result = {
+            "id": request_id,
+            "worker": self._worker_id,
+            "success": False,
+            "error": None,
+            "started_at": start_time,
+        }
+        try:
+            with open(request_path, "r") as stream:
+                request = json.load(stream)
+            self._log.info("Processing publish request {}".format(request_id))
+            result.update(self.process_request(
+                request["paths"],
+                request.get("targets"),
+                request.get("env"),
+            ))
+
+        except Exception:
+            result["error"] = traceback.format_exc()
+
+        end_time = time.time()
+        result["finished_at"] = end_time
+        result["duration"] = end_time - start_time
+        self._log.info("Publish request {} {} in {:.2f}s".format(
+            request_id,
+            "finished" if result["success"] else "failed",
+            result["duration"]
+        ))
+
+        _write_json_atomic(
+            os.path.join(self._queue_dir, DONE_DIRNAME, filename),
+            result
+        )
+        os.remove(request_path)
+
+    def process_request(self, paths, targets=None, env=None):
+        """Publish single request.
+
+        Environment variables are restored after publishing.
+
+        Args:
+            paths (list[str]): Paths to publish metadata json files.
+            targets (Optional[list[str]]): Pyblish targets.
+            env (Optional[dict[str, str]]): Environment variables used
+                during publishing.
+
+        Returns:
+            dict[str, Any]: Result with 'success', 'error' and 'timings'.
+        """
+
+        if not any(paths):
+            raise RuntimeError("No publish paths specified")
+
+        env_backup = dict(os.environ)
+        try:
+            return self._process_request(paths, targets, env)
+        finally:
+            os.environ.clear()
+            os.environ.update(env_backup)
+
+    def _process_request(self, paths, targets, env):
+        import pyblish.api
+        import pyblish.util
+
+        timings = {}
+        start_time = time.time()
+        os.environ.update(env or {})
+        for src_key, dst_key in _OLD_ENV_KEYS:
+            if src_key in os.environ and dst_key not in os.environ:
+                os.environ[dst_key] = os.environ[src_key]
+            os.environ.pop(src_key, None)
+
+        os.environ.update(self._get_app_environments())
+        os.environ["AYON_PUBLISH_DATA"] = os.pathsep.join(paths)
+        os.environ["HEADLESS_PUBLISH"] = "true"
+        timings["environment"] = time.time() - start_time
+
+        start_time = time.time()
+        plugins = self._get_plugins()
+        timings["discover"] = time.time() - start_time
+
+        start_time = time.time()
+        error_format = (
+            "Failed {plugin.__name__}: {error} -- {error.traceback}"
+        )
+        context = pyblish.api.Context()
+        error = None
+        for result in pyblish.util.publish_iter(
+            context=context,
+            plugins=plugins,
+            targets=list(targets or ["farm"]),
+        ):
+            if result["error"]:
+                error = error_format.format(**result)
+                self._log.error(error)
+                break
+        timings["publish"] = time.time() - start_time
+
+        return {
+            "success": error is None,
+            "error": error,
+            "timings": timings,
+        }
+
+    def _get_app_environments(self):
+        from ayon_core.lib.applications import (
+            get_app_environments_for_context,
+            LaunchTypes,
+        )
+        from ayon_core.pipeline import get_global_context
+
+        app_full_name = os.getenv("AYON_APP_NAME")
+        if not app_full_name:
+            return {}
+
+        context = get_global_context()
+        key = (
+            context["project_name"],
+            context["folder_path"],
+            context["task_name"],
+            app_full_name,
+        )
+        env = self._app_env_by_context.get(key)
+        if env is None:
+            env = get_app_environments_for_context(
+                *key, launch_type=LaunchTypes.farm_publish
+            )
+            self._app_env_by_context[key] = env
+        return env
+
+    def _get_plugins(self):
+        import pyblish.api
+
+        # Settings are applied to plugins on discovery based on project
+        project_name = os.getenv("AYON_PROJECT_NAME")
+        plugins = self._plugins_by_project.get(project_name)
+        if plugins is None:
+            plugins = pyblish.api.discover()
+            self._plugins_by_project[project_name] = plugins
+        return plugins
@@ -14,6 +14,7 @@ import pyblish.api
 
 from ayon_core.pipeline import KnownPublishError
 from ayon_core.pipeline.publish.lib import add_repre_files_for_cleanup
+from ayon_core.pipeline.farm.manifest import get_manifest_dir
 
 
 class CollectRenderedFiles(pyblish.api.ContextPlugin):
@@ -57,6 +58,14 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
             self.log.debug("Filling stagingDir with root to: %s",
                            data_object["stagingDir"])
 
+    def _add_manifest_for_cleanup(self, repre_data):
+        """Remove manifests of rendered files written by render tasks."""
+        staging_dir = repre_data.get("stagingDir")
+        if staging_dir and not repre_data.get("stagingDir_persistent"):
+            self._context.data["cleanupFullPaths"].append(
+                get_manifest_dir(staging_dir)
+            )
+
     def _process_path(self, data, anatomy):
         """Process data of a single JSON publish metadata file.
 
@@ -126,6 +135,7 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
 
                 if not staging_dir_persistent:
                     add_repre_files_for_cleanup(instance, repre_data)
+                    self._add_manifest_for_cleanup(repre_data)
 
             instance.data["representations"] = representations
 
@@ -0,0 +1,32 @@
+"""Commit entity operations deferred by integrators.
+
+Requires:
+    context -> publishOperationsBatch (PublishOperationsBatch)
+
+"""
+import pyblish.api
+
+from ayon_core.pipeline.publish.operations import (
+    PUBLISH_OPERATIONS_BATCH_KEY,
+)
+
+
+class CommitPublishOperations(pyblish.api.ContextPlugin):
+    """Commit entity operations of all integrated instances.
+
+    Operations are added by 'IntegrateAsset' when it has enabled
+    'defer_entity_commit'. Plugin must run before integrators which
+    expect that published entities exist on server (thumbnails, hero
+    versions, input links).
+    """
+
+    order = pyblish.api.IntegratorOrder + 0.005
+    label = "Commit Published Entities"
+
+    def process(self, context):
+        operations_batch = context.data.get(PUBLISH_OPERATIONS_BATCH_KEY)
+        if not operations_batch:
+            self.log.debug("No deferred entity operations to commit.")
+            return
+
+        operations_batch.commit()
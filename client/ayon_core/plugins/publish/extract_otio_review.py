@@ -15,6 +15,8 @@ Provides:
 """
 
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import clique
 from pyblish import api
@@ -53,6 +55,8 @@ class ExtractOTIOReview(publish.Extractor):
     to_width = 1280
     to_height = 720
     output_ext = ".jpg"
+    # Maximum number of ffmpeg processes rendering segments at once
+    max_parallel_renders = 4
 
     def process(self, instance):
         # Not all hosts can import these modules.
@@ -81,6 +85,9 @@ class ExtractOTIOReview(publish.Extractor):
             "resolutionWidth") or self.to_width
         self.to_height = instance.data.get(
             "resolutionHeight") or self.to_height
+        # segments are rendered after output frames of all are known
+        self.render_commands = list()
+        self.gap_segments = list()
 
         # skip instance if no reviewable data available
         if (not isinstance(otio_review_clips[0], otio.schema.Clip)) \
@@ -218,6 +225,8 @@ class ExtractOTIOReview(publish.Extractor):
                 # generate used frames
                 self._generate_used_frames(duration)
 
+        self._render_segments()
+
         # creating and registering representation
         representation = self._create_representation(start, duration)
         instance.data["representations"].append(representation)
@@ -330,10 +339,13 @@ class ExtractOTIOReview(publish.Extractor):
     def _render_seqment(self, sequence=None,
                         video=None, gap=None, end_offset=None):
         """
-        Render seqment into image sequence frames.
+        Prepare rendering of seqment into image sequence frames.
 
         Using ffmpeg to convert compatible video and image source
-        to defined image sequence format.
+        to defined image sequence format. Output frames are defined
+        when segment is added so segments are rendered later in
+        '_render_segments' in any order. Gaps are filled with copies
+        of single black frame.
 
         Args:
             sequence (list): input dir path string, collection object in list
@@ -357,9 +369,11 @@ class ExtractOTIOReview(publish.Extractor):
         command = get_ffmpeg_tool_args("ffmpeg")
 
         input_extension = None
+        frames_count = None
         if sequence:
             input_dir, collection = sequence
             in_frame_start = min(collection.indexes)
+            frames_count = len(collection.indexes)
 
             # converting image sequence to image sequence
             input_file = collection.format("{head}{padding}{tail}")
@@ -377,6 +391,7 @@ class ExtractOTIOReview(publish.Extractor):
             frame_start = otio_range.start_time.value
             input_fps = otio_range.start_time.rate
             frame_duration = otio_range.duration.value
+            frames_count = int(round(frame_duration))
             sec_start = frames_to_seconds(frame_start, input_fps)
             sec_duration = frames_to_seconds(
                 frame_duration, input_fps
@@ -391,21 +406,18 @@ class ExtractOTIOReview(publish.Extractor):
             ])
 
         elif gap:
-            sec_duration = frames_to_seconds(gap, self.actual_fps)
-
-            # form command for rendering gap files
-            command.extend([
-                "-t", str(sec_duration),
-                "-r", str(self.actual_fps),
-                "-f", "lavfi",
-                "-i", "color=c=black:s={}x{}".format(
-                    self.to_width, self.to_height
-                ),
-                "-tune", "stillimage"
-            ])
+            self.gap_segments.append((
+                out_frame_start,
+                int(gap),
+                self.to_width,
+                self.to_height
+            ))
+            return
 
-        # add output attributes
+        # add output attributes, number of output frames is limited so
+        #   segments rendered in parallel don't write the same frames
         command.extend([
+            "-frames:v", str(frames_count),
             "-start_number", str(out_frame_start)
         ])
 
@@ -421,13 +433,92 @@ class ExtractOTIOReview(publish.Extractor):
         # add output path at the end
         command.append(output_path)
 
-        # execute
+        self.render_commands.append(command)
+
+    def _render_segments(self):
+        """Render all prepared segments.
+
+        Segments are writing different frames of output sequence so
+        they are rendered in parallel with limited number of ffmpeg
+        processes.
+        """
+        black_frames_dir = os.path.join(self.staging_dir, "black_frames")
+        black_frame_commands = {}
+        for _, _, width, height in self.gap_segments:
+            resolution = (width, height)
+            if resolution in black_frame_commands:
+                continue
+            black_frame_path = os.path.join(
+                black_frames_dir,
+                "black_{}x{}{}".format(width, height, self.output_ext)
+            )
+            command = get_ffmpeg_tool_args("ffmpeg")
+            command.extend([
+                "-f", "lavfi",
+                "-i", "color=c=black:s={}x{}".format(width, height),
+                "-frames:v", "1",
+                black_frame_path
+            ])
+            black_frame_commands[resolution] = (command, black_frame_path)
+
+        if black_frame_commands:
+            os.makedirs(black_frames_dir, exist_ok=True)
+            self._run_ffmpeg_commands([
+                command
+                for command, _ in black_frame_commands.values()
+            ])
+
+        self._run_ffmpeg_commands(self.render_commands)
+
+        # Gaps are filled after rendering of segments and frames rendered
+        #   by segments are kept
+        for out_frame_start, gap, width, height in self.gap_segments:
+            _, black_frame_path = black_frame_commands[(width, height)]
+            for frame in range(out_frame_start, out_frame_start + gap):
+                self._link_frame(black_frame_path, frame)
+
+        if black_frame_commands:
+            shutil.rmtree(black_frames_dir)
+
+    def _run_ffmpeg_commands(self, commands):
+        if not commands:
+            return
+        max_workers = max(1, min(self.max_parallel_renders, len(commands)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume results so errors are raised
+            for _ in executor.map(self._run_ffmpeg, commands):
+                pass
+
+    def _run_ffmpeg(self, command):
         self.log.debug("Executing: {}".format(" ".join(command)))
         output = run_subprocess(
             command, logger=self.log
         )
         self.log.debug("Output: {}".format(output))
 
+    def _link_frame(self, src_path, frame):
+        """Create output frame from existing file.
+
+        Hardlink is used if possible, file is copied otherwise. Existing
+        output frame is not replaced.
+
+        Args:
+            src_path (str): Path to source file.
+            frame (int): Output frame number.
+        """
+        output_path = os.path.join(
+            self.staging_dir,
+            "{}{:0{}d}{}".format(
+                self.temp_file_head, frame, self.padding, self.output_ext
+            )
+        )
+        if os.path.exists(output_path):
+            return
+        try:
+            os.link(src_path, output_path)
+        except OSError:
+            shutil.copyfile(src_path, output_path)
+
     def _generate_used_frames(self, duration, end_offset=None):
         """
         Generating used frames into plugin argument `used_frames`.
@@ -19,7 +19,7 @@ from ayon_core.client.operations import (
 )
 
 from ayon_core.client import (
-    get_representations,
+    entities_v4,
     get_subset_by_name,
     get_version_by_name,
 )
@@ -31,6 +31,10 @@ from ayon_core.lib.file_transaction import (
 from ayon_core.pipeline.publish import (
     KnownPublishError,
     get_publish_template_name,
+    get_publish_instance_label,
+)
+from ayon_core.pipeline.publish.operations import (
+    get_publish_operations_batch,
 )
 
 log = logging.getLogger(__name__)
@@ -163,6 +167,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "output"
     ]
 
+    # Add entity operations to batch of whole publish which is committed
+    #   by 'CommitPublishOperations' after integration of all instances
+    defer_entity_commit = False
+    max_operations_per_request = 1000
+
     def process(self, instance):
 
         # Instance should be integrated on a farm
@@ -186,15 +195,25 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["productType"]))
             return
 
+        operations_batch = None
+        if self.defer_entity_commit:
+            operations_batch = get_publish_operations_batch(
+                instance.context, self.max_operations_per_request
+            )
+
         file_transactions = FileTransaction(log=self.log,
                                             # Enforce unique transfers
                                             allow_queue_replacements=False)
         try:
-            self.register(instance, file_transactions, filtered_repres)
+            self.register(
+                instance, file_transactions, filtered_repres, operations_batch
+            )
         except DuplicateDestinationError as exc:
             # Raise DuplicateDestinationError as KnownPublishError
             # and rollback the transactions
             file_transactions.rollback()
+            if operations_batch is not None:
+                operations_batch.rollback()
             six.reraise(KnownPublishError,
                         KnownPublishError(exc),
                         sys.exc_info()[2])
@@ -202,9 +221,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             # clean destination
             # todo: preferably we'd also rollback *any* changes to the database
             file_transactions.rollback()
+            if operations_batch is not None:
+                operations_batch.rollback()
             self.log.critical("Error when registering", exc_info=True)
             six.reraise(*sys.exc_info())
 
+        # Deferred file transactions are finalized after commit of entities
+        if operations_batch is not None:
+            return
+
         # Finalizing can't rollback safely so no use for moving it to
         # the try, except.
         file_transactions.finalize()
@@ -237,7 +262,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         return filtered_repres
 
-    def register(self, instance, file_transactions, filtered_repres):
+    def register(
+        self,
+        instance,
+        file_transactions,
+        filtered_repres,
+        operations_batch=None
+    ):
         project_name = instance.context.data["projectName"]
 
         instance_stagingdir = instance.data.get("stagingDir")
@@ -268,11 +299,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         # Get existing representations (if any)
         existing_repres_by_name = {
-            repre_doc["name"].lower(): repre_doc
-            for repre_doc in get_representations(
+            repre_entity["name"].lower(): {
+                "_id": repre_entity["id"],
+                "name": repre_entity["name"],
+            }
+            for repre_entity in entities_v4.get_representations(
                 project_name,
                 version_ids=[version["_id"]],
-                fields=["_id", "name"]
+                fields={"id", "name"}
             )
         }
 
@@ -316,11 +350,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Transaction to reduce the chances of another publish trying to
         # publish to the same version number since that chance can greatly
         # increase if the file transaction takes a long time.
-        op_session.commit()
+        # - deferred operations are committed with all other instances
+        if operations_batch is None:
+            op_session.commit()
 
-        self.log.info((
-            "Product '{}' version {} written to database.."
-        ).format(subset["name"], version["name"]))
+            self.log.info((
+                "Product '{}' version {} written to database.."
+            ).format(subset["name"], version["name"]))
 
         # Process all file transfers of all integrations now
         self.log.debug("Integrating source files to destination ...")
@@ -396,7 +432,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                     )
 
         self.log.debug("{}".format(op_session.to_data()))
-        op_session.commit()
+        if operations_batch is None:
+            op_session.commit()
+        else:
+            operations_batch.add(
+                get_publish_instance_label(instance),
+                op_session,
+                file_transactions
+            )
 
         # Backwards compatibility used in hero integration.
         # todo: can we avoid the need to store this?
@@ -1,6 +1,7 @@
 """Backend models that can be used in controllers."""
 
 from .cache import CacheItem, NestedCacheItem
+from .query_broker import EntityQueryBroker, get_entity_query_broker
 from .projects import (
     ProjectItem,
     ProjectsModel,
@@ -12,7 +13,7 @@ from .hierarchy import (
     HierarchyModel,
     HIERARCHY_MODEL_SENDER,
 )
-from .thumbnails import ThumbnailsModel
+from .thumbnails import ThumbnailsModel, THUMBNAILS_MODEL_SENDER
 from .selection import HierarchyExpectedSelection
 
 
@@ -20,6 +21,9 @@ __all__ = (
     "CacheItem",
     "NestedCacheItem",
 
+    "EntityQueryBroker",
+    "get_entity_query_broker",
+
     "ProjectItem",
     "ProjectsModel",
     "PROJECTS_MODEL_SENDER",
@@ -30,6 +34,7 @@ __all__ = (
     "HIERARCHY_MODEL_SENDER",
 
     "ThumbnailsModel",
+    "THUMBNAILS_MODEL_SENDER",
 
     "HierarchyExpectedSelection",
 )
@@ -1,16 +1,293 @@
+import sys
 import time
+import types
+import weakref
+import threading
 import collections
 
-InitInfo = collections.namedtuple(
-    "InitInfo",
-    ["default_factory", "lifetime"]
-)
+from ayon_core.lib import Logger
 
 
 def _default_factory_func():
     return None
 
 
+def estimate_size(value, max_depth=8):
+    """Approximate size of value in memory in bytes.
+
+    Size of containers contains size of their items and size of objects
+    contains size of their '__dict__'. Each object is counted only once
+    even if is referenced multiple times.
+
+    Args:
+        value (Any): Value to estimate.
+        max_depth (int): Maximum depth of nested items that are counted.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+
+    size = 0
+    seen_ids = set()
+    queue = collections.deque([(value, 0)])
+    while queue:
+        item, depth = queue.popleft()
+        item_id = id(item)
+        if item_id in seen_ids:
+            continue
+        seen_ids.add(item_id)
+        try:
+            size += sys.getsizeof(item)
+        except TypeError:
+            continue
+
+        if depth >= max_depth:
+            continue
+        depth += 1
+        if isinstance(item, dict):
+            for key, sub_item in item.items():
+                queue.append((key, depth))
+                queue.append((sub_item, depth))
+
+        elif isinstance(
+            item, (list, tuple, set, frozenset, collections.deque)
+        ):
+            for sub_item in item:
+                queue.append((sub_item, depth))
+
+        elif (
+            hasattr(item, "__dict__")
+            and not isinstance(item, (type, types.ModuleType))
+        ):
+            queue.append((item.__dict__, depth))
+    return size
+
+
+class InitInfo:
+    """Information shared by nested cache items of one cache.
+
+    Args:
+        default_factory (Optional[callable]): Function that returns default
+            value of cache items.
+        lifetime (Optional[int]): Lifetime of the cache data in seconds.
+        tracker (Optional[_CacheTracker]): Tracker of cache items.
+    """
+
+    def __init__(self, default_factory, lifetime, tracker=None):
+        if tracker is None:
+            tracker = _CacheTracker()
+        self.default_factory = default_factory
+        self.lifetime = lifetime
+        self.tracker = tracker
+
+
+class _CacheTracker:
+    """Track cache items of a cache in order of their usage.
+
+    Used to evict least recently used cache items when cache has set
+    maximum count of items or maximum size, and to collect statistics.
+
+    Args:
+        max_entries (Optional[int]): Maximum count of cache items.
+        max_bytes (Optional[int]): Maximum approximate size of cached data.
+        size_estimator (Optional[callable]): Function returning approximate
+            size of cached data in bytes.
+        on_evict (Optional[callable]): Called with keys and data of cache
+            item evicted because of limits.
+        on_expire (Optional[callable]): Called with keys and data of
+            invalid cache item removed by 'clear_invalid'.
+    """
+
+    def __init__(
+        self,
+        max_entries=None,
+        max_bytes=None,
+        size_estimator=None,
+        on_evict=None,
+        on_expire=None,
+    ):
+        if size_estimator is None:
+            size_estimator = estimate_size
+        self.lock = threading.RLock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._size_estimator = size_estimator
+        self._on_evict = on_evict
+        self._on_expire = on_expire
+        # Cache item id -> (cache item, parent, keys)
+        self._items = collections.OrderedDict()
+        # Keys and data of expired items waiting for 'on_expire' callback
+        self._expired = []
+        self._sizes = {}
+        self._total_size = 0
+        self._stats = collections.Counter()
+
+    def add(self, item, parent, keys):
+        with self.lock:
+            self._items[id(item)] = (item, parent, keys)
+
+    def touch(self, item):
+        with self.lock:
+            if id(item) in self._items:
+                self._items.move_to_end(id(item))
+
+    def count_validity(self, is_valid):
+        self._stats["hits" if is_valid else "misses"] += 1
+
+    def remove(self, item, expired=False):
+        with self.lock:
+            item_info = self._items.pop(id(item), None)
+            if item_info is None:
+                return
+            self._total_size -= self._sizes.pop(id(item), 0)
+            if expired:
+                self._stats["expired"] += 1
+                if self._on_expire is not None:
+                    self._expired.append((item_info[2], item.get_data()))
+
+    def process_expired(self):
+        """Call 'on_expire' callback for expired items."""
+
+        with self.lock:
+            expired, self._expired = self._expired, []
+        self._call_callback(self._on_expire, expired)
+
+    def clear(self):
+        with self.lock:
+            self._items.clear()
+            self._sizes.clear()
+            self._total_size = 0
+            self._expired = []
+
+    def item_updated(self, item):
+        with self.lock:
+            item_id = id(item)
+            # Item was already removed from cache
+            if item_id not in self._items:
+                return
+            self._items.move_to_end(item_id)
+            if self.max_bytes is not None:
+                size = self._size_estimator(item.get_data())
+                self._total_size += size - self._sizes.get(item_id, 0)
+                self._sizes[item_id] = size
+            self._evict(item_id)
+
+    def get_stats(self):
+        with self.lock:
+            output = {
+                "entries": len(self._items),
+                "bytes": None,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "expired": 0,
+            }
+            if self.max_bytes is not None:
+                output["bytes"] = self._total_size
+            output.update(self._stats)
+        return output
+
+    def _is_over_limit(self):
+        if (
+            self.max_entries is not None
+            and len(self._items) > self.max_entries
+        ):
+            return True
+        return (
+            self.max_bytes is not None
+            and self._total_size > self.max_bytes
+        )
+
+    def _evict(self, keep_item_id):
+        evicted = []
+        while len(self._items) > 1 and self._is_over_limit():
+            item_id = next(iter(self._items))
+            # Never evict item which was just updated
+            if item_id == keep_item_id:
+                self._items.move_to_end(item_id)
+                item_id = next(iter(self._items))
+
+            item, parent, keys = self._items.pop(item_id)
+            self._total_size -= self._sizes.pop(item_id, 0)
+            parent._remove_evicted_item(keys[-1], item)
+            self._stats["evictions"] += 1
+            evicted.append((keys, item.get_data()))
+
+        self._call_callback(self._on_evict, evicted)
+
+    def _call_callback(self, callback, items):
+        if callback is None:
+            return
+        for keys, data in items:
+            try:
+                callback(keys, data)
+            except Exception:
+                Logger.get_logger(self.__class__.__name__).warning(
+                    "Failed to process removed cache item", exc_info=True
+                )
+
+
+class _CacheCleaner:
+    """Clear invalid items of caches in background thread.
+
+    Caches are stored as weak references, so cleaner does not keep them
+    in memory.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._thread = None
+        # Cache -> [interval, time of next cleanup]
+        self._caches = weakref.WeakKeyDictionary()
+
+    def register(self, cache, interval):
+        with self._lock:
+            self._caches[cache] = [interval, time.time() + interval]
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="CacheCleaner", daemon=True
+                )
+                self._thread.start()
+        self._wake_event.set()
+
+    def unregister(self, cache):
+        with self._lock:
+            self._caches.pop(cache, None)
+
+    def _run(self):
+        while True:
+            now = time.time()
+            caches = []
+            next_cleanup = now + 60
+            with self._lock:
+                for cache, info in self._caches.items():
+                    interval, cleanup_time = info
+                    if cleanup_time <= now:
+                        caches.append(cache)
+                        cleanup_time = now + interval
+                        info[1] = cleanup_time
+                    next_cleanup = min(next_cleanup, cleanup_time)
+
+            for cache in caches:
+                try:
+                    cache.clear_invalid()
+                except Exception:
+                    Logger.get_logger(self.__class__.__name__).warning(
+                        "Failed to clear invalid cache items", exc_info=True
+                    )
+            # Release reference to caches before waiting
+            caches = None
+
+            self._wake_event.wait(max(0.0, next_cleanup - time.time()))
+            self._wake_event.clear()
+
+
+_cache_cleaner = _CacheCleaner()
+
+
 class CacheItem:
     """Simple cache item with lifetime and default value.
 
@@ -18,9 +295,11 @@ class CacheItem:
         default_factory (Optional[callable]): Function that returns default
             value used on init and on reset.
         lifetime (Optional[int]): Lifetime of the cache data in seconds.
+        _tracker (Optional[_CacheTracker]): Private argument. Tracker of
+            parent nested cache.
     """
 
-    def __init__(self, default_factory=None, lifetime=None):
+    def __init__(self, default_factory=None, lifetime=None, _tracker=None):
         if lifetime is None:
             lifetime = 120
         self._lifetime = lifetime
@@ -29,6 +308,7 @@ class CacheItem:
             default_factory = _default_factory_func
         self._default_factory = default_factory
         self._data = default_factory()
+        self._tracker = _tracker
 
     @property
     def is_valid(self):
@@ -39,9 +319,13 @@ class CacheItem:
         """
 
         if self._last_update is None:
-            return False
+            is_valid = False
+        else:
+            is_valid = (time.time() - self._last_update) < self._lifetime
 
-        return (time.time() - self._last_update) < self._lifetime
+        if self._tracker is not None:
+            self._tracker.count_validity(is_valid)
+        return is_valid
 
     def set_lifetime(self, lifetime):
         """Change lifetime of cache item.
@@ -62,6 +346,8 @@ class CacheItem:
 
         self._last_update = None
         self._data = self._default_factory()
+        if self._tracker is not None:
+            self._tracker.item_updated(self)
 
     def get_data(self):
         """Receive cached data.
@@ -75,11 +361,18 @@ class CacheItem:
     def update_data(self, data):
         self._data = data
         self._last_update = time.time()
+        if self._tracker is not None:
+            self._tracker.item_updated(self)
 
 
 class NestedCacheItem:
     """Helper for cached items stored in nested structure.
 
+    Cache can be limited by count of cache items and by approximate size of
+    cached data. Least recently used cache items are evicted when a limit
+    is exceeded. Invalid cache items can be cleared periodically in
+    background thread.
+
     Example:
         >>> cache = NestedCacheItem(levels=2, default_factory=lambda: 0)
         >>> cache["a"]["b"].is_valid
@@ -100,20 +393,55 @@ class NestedCacheItem:
         default_factory (Optional[callable]): Function that returns default
             value used on init and on reset.
         lifetime (Optional[int]): Lifetime of the cache data in seconds.
+        max_entries (Optional[int]): Maximum count of cache items.
+        max_bytes (Optional[int]): Maximum approximate size of cached data
+            in bytes.
+        size_estimator (Optional[callable]): Function returning approximate
+            size of cached data in bytes. 'estimate_size' is used if not
+            passed.
+        on_evict (Optional[callable]): Called with tuple of keys and data
+            of cache item evicted because of limits.
+        on_expire (Optional[callable]): Called with tuple of keys and data
+            of invalid cache item removed by 'clear_invalid'. Callback is
+            called from thread of background cleanup when
+            'cleanup_interval' is set.
+        cleanup_interval (Optional[float]): Interval in seconds in which
+            invalid items are cleared in background thread.
         _init_info (Optional[InitInfo]): Private argument. Init info for
             nested cache where created from parent item.
+        _keys (Optional[tuple[str, ...]]): Private argument. Keys of parent
+            items.
     """
 
     def __init__(
-        self, levels=1, default_factory=None, lifetime=None, _init_info=None
+        self,
+        levels=1,
+        default_factory=None,
+        lifetime=None,
+        max_entries=None,
+        max_bytes=None,
+        size_estimator=None,
+        on_evict=None,
+        on_expire=None,
+        cleanup_interval=None,
+        _init_info=None,
+        _keys=None,
     ):
         if levels < 1:
             raise ValueError("Nested levels must be greater than 0")
         self._data_by_key = {}
         if _init_info is None:
-            _init_info = InitInfo(default_factory, lifetime)
+            tracker = _CacheTracker(
+                max_entries, max_bytes, size_estimator, on_evict, on_expire
+            )
+            _init_info = InitInfo(default_factory, lifetime, tracker)
+        if _keys is None:
+            _keys = tuple()
         self._init_info = _init_info
         self._levels = levels
+        self._keys = _keys
+        if cleanup_interval:
+            self.set_cleanup_interval(cleanup_interval)
 
     def __getitem__(self, key):
         """Get cached data.
@@ -125,18 +453,27 @@ class NestedCacheItem:
             Union[NestedCacheItem, CacheItem]: Cache item.
         """
 
-        cache = self._data_by_key.get(key)
-        if cache is None:
+        tracker = self._init_info.tracker
+        with tracker.lock:
+            cache = self._data_by_key.get(key)
+            if cache is not None:
+                if self._levels == 1:
+                    tracker.touch(cache)
+                return cache
+
             if self._levels > 1:
                 cache = NestedCacheItem(
                     levels=self._levels - 1,
-                    _init_info=self._init_info
+                    _init_info=self._init_info,
+                    _keys=self._keys + (key, )
                 )
             else:
                 cache = CacheItem(
                     self._init_info.default_factory,
-                    self._init_info.lifetime
+                    self._init_info.lifetime,
+                    _tracker=tracker
                 )
+                tracker.add(cache, self, self._keys + (key, ))
             self._data_by_key[key] = cache
         return cache
 
@@ -183,27 +520,40 @@ class NestedCacheItem:
             key (str): Key of the cache item.
         """
 
-        self._data_by_key.pop(key, None)
+        with self._init_info.tracker.lock:
+            cache = self._data_by_key.pop(key, None)
+            if cache is not None:
+                self._untrack(cache)
 
     def clear_invalid(self):
         """Clear all invalid cache items.
 
+        Callback 'on_expire' is called for removed items when called on
+        root cache.
+
         Note:
             To clear all cache items use 'reset'.
         """
 
+        tracker = self._init_info.tracker
         changed = {}
         children_are_nested = self._levels > 1
-        for key, cache in tuple(self._data_by_key.items()):
-            if children_are_nested:
-                output = cache.clear_invalid()
-                if output:
-                    changed[key] = output
-                if not cache.cached_count():
-                    self._data_by_key.pop(key)
-            elif not cache.is_valid:
-                changed[key] = cache.get_data()
-                self._data_by_key.pop(key)
+        with tracker.lock:
+            for key, cache in tuple(self._data_by_key.items()):
+                if children_are_nested:
+                    output = cache.clear_invalid()
+                    if output:
+                        changed[key] = output
+                    if not cache.cached_count():
+                        self._data_by_key.pop(key, None)
+                # Validity check of cleanup is not counted in statistics
+                elif not self._is_item_valid(cache):
+                    changed[key] = cache.get_data()
+                    self._data_by_key.pop(key, None)
+                    tracker.remove(cache, expired=True)
+
+        if not self._keys:
+            tracker.process_expired()
         return changed
 
     def reset(self):
@@ -213,7 +563,14 @@ class NestedCacheItem:
             To clear only invalid cache items use 'clear_invalid'.
         """
 
-        self._data_by_key = {}
+        tracker = self._init_info.tracker
+        with tracker.lock:
+            if not self._keys:
+                tracker.clear()
+            else:
+                for cache in self._data_by_key.values():
+                    self._untrack(cache)
+            self._data_by_key = {}
 
     def set_lifetime(self, lifetime):
         """Change lifetime of all children cache items.
@@ -226,6 +583,32 @@ class NestedCacheItem:
         for cache in self._data_by_key.values():
             cache.set_lifetime(lifetime)
 
+    def set_cleanup_interval(self, interval):
+        """Clear invalid cache items periodically in background thread.
+
+        Args:
+            interval (Union[float, None]): Interval in seconds. Periodic
+                cleanup is disabled if is 'None'.
+        """
+
+        if interval:
+            _cache_cleaner.register(self, interval)
+        else:
+            _cache_cleaner.unregister(self)
+
+    def get_stats(self):
+        """Statistics of whole cache for debugging.
+
+        Returns:
+            dict[str, Any]: Count of cache items in 'entries', approximate
+                size of data in 'bytes' (only if 'max_bytes' is set),
+                limits, validity 'hits' and 'misses', count of items
+                removed because of limits in 'evictions' and count of
+                invalid items removed in 'expired'.
+        """
+
+        return self._init_info.tracker.get_stats()
+
     @property
     def is_valid(self):
         """Raise reasonable error when called on wront level.
@@ -237,3 +620,23 @@ class NestedCacheItem:
         raise AttributeError((
             "{} does not support 'is_valid'. Lower nested level by '{}'"
         ).format(self.__class__.__name__, self._levels))
+
+    def _remove_evicted_item(self, key, cache):
+        if self._data_by_key.get(key) is cache:
+            self._data_by_key.pop(key)
+
+    def _untrack(self, cache):
+        tracker = self._init_info.tracker
+        queue = collections.deque([cache])
+        while queue:
+            item = queue.popleft()
+            if isinstance(item, NestedCacheItem):
+                queue.extend(item._data_by_key.values())
+            else:
+                tracker.remove(item)
+
+    @staticmethod
+    def _is_item_valid(cache):
+        if cache._last_update is None:
+            return False
+        return (time.time() - cache._last_update) < cache._lifetime
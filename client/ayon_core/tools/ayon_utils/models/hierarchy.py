@@ -1,15 +1,24 @@
+import os
+import json
+import time
+import hashlib
 import collections
 import contextlib
 from abc import ABCMeta, abstractmethod
 
+import arrow
 import ayon_api
 import six
 
+from ayon_core.lib import Logger
+from ayon_core.lib.local_settings import get_ayon_appdirs
 from ayon_core.style import get_default_entity_icon_color
 
 from .cache import NestedCacheItem
+from .query_broker import get_entity_query_broker
 
 HIERARCHY_MODEL_SENDER = "hierarchy.model"
+FOLDER_ITEM_FIELDS = {"id", "name", "label", "parentId", "path", "folderType"}
 
 
 @six.add_metaclass(ABCMeta)
@@ -216,6 +225,95 @@ def _get_folder_item_from_entity(entity):
     )
 
 
+class FoldersSnapshotCache:
+    """Folder items of projects stored on disk.
+
+    Snapshot contains folder items with a watermark. Watermark is server
+    time when the snapshot was up to date, so only changes after the
+    watermark must be applied to the snapshot. Snapshot also contains
+    time of last full query of folders, so the snapshot can be discarded
+    when it is too old.
+
+    Snapshots are stored per server url to local app data directory.
+    """
+
+    def __init__(self):
+        self._cache_dir = None
+
+    def get_cache_dir(self):
+        if self._cache_dir is None:
+            server_url = ayon_api.get_base_url()
+            server_hash = hashlib.sha1(
+                server_url.encode("utf-8")
+            ).hexdigest()
+            self._cache_dir = get_ayon_appdirs("hierarchy", server_hash)
+        return self._cache_dir
+
+    def get_snapshot_path(self, project_name):
+        return os.path.join(self.get_cache_dir(), project_name + ".json")
+
+    def load(self, project_name):
+        """Load snapshot of project.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            tuple[Union[str, None], Union[dict[str, FolderItem], None], float]:
+                Watermark, folder items by id and time of last full
+                query, or 'None' values and '0' if snapshot is not
+                available.
+        """
+
+        path = self.get_snapshot_path(project_name)
+        if not os.path.exists(path):
+            return None, None, 0
+
+        with open(path, "r") as stream:
+            data = json.load(stream)
+        folder_items = {
+            item_data["entity_id"]: FolderItem.from_data(item_data)
+            for item_data in data["folders"]
+        }
+        # Snapshots created before full query time was stored are
+        #   treated as outdated
+        full_query_time = data.get("full_query_time") or 0
+        return data["watermark"], folder_items, full_query_time
+
+    def save(self, project_name, watermark, folder_items, full_query_time):
+        """Store snapshot of project.
+
+        Args:
+            project_name (str): Project name.
+            watermark (str): Server time when folder items were up to date.
+            folder_items (dict[str, FolderItem]): Folder items by id.
+            full_query_time (float): Time when all folders were queried
+                last time.
+        """
+
+        path = self.get_snapshot_path(project_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {
+            "watermark": watermark,
+            "full_query_time": full_query_time,
+            "folders": [
+                folder_item.to_data()
+                for folder_item in folder_items.values()
+            ]
+        }
+        # Write to temp file first so other processes never read
+        #   partially written snapshot
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "w") as stream:
+            json.dump(data, stream)
+        os.replace(tmp_path, path)
+
+    def remove(self, project_name):
+        path = self.get_snapshot_path(project_name)
+        if os.path.exists(path):
+            os.remove(path)
+
+
 class HierarchyModel(object):
     """Model for project hierarchy items.
 
@@ -223,8 +321,23 @@ class HierarchyModel(object):
     folder or project. Tasks can have as parent only folder.
     """
     lifetime = 60  # A minute
+    # Time subtracted from watermark of folders snapshot (in seconds)
+    # - changes from that time are applied again to cover time
+    #   difference of client and server
+    watermark_offset = 60
+    # Full refresh is used if there are more changed folders
+    max_incremental_changes = 1000
+    # Maximum time since last full refresh of folders (in seconds)
+    # - incremental update relies on server events which may be removed
+    #   or some changes may not create events, so the folders are
+    #   queried again once in a while
+    max_incremental_age = 24 * 60 * 60
 
     def __init__(self, controller):
+        self._log = None
+        self._folders_snapshot_cache = FoldersSnapshotCache()
+        self._folders_watermarks = {}
+        self._folders_full_query_times = {}
         self._folders_items = NestedCacheItem(
             levels=1, default_factory=dict, lifetime=self.lifetime)
         self._folders_by_id = NestedCacheItem(
@@ -239,12 +352,21 @@ class HierarchyModel(object):
         self._tasks_refreshing = set()
         self._controller = controller
 
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
     def reset(self):
+        self._folders_watermarks = {}
+        self._folders_full_query_times = {}
         self._folders_items.reset()
         self._folders_by_id.reset()
 
         self._task_items.reset()
         self._tasks_by_id.reset()
+        get_entity_query_broker().reset()
 
     def refresh_project(self, project_name):
         """Force to refresh folder items for a project.
@@ -294,16 +416,14 @@ class HierarchyModel(object):
                 folder_id: cache_data.get(folder_id)
                 for folder_id in folder_ids
             }
-        folders = ayon_api.get_folders(
-            project_name,
-            folder_ids=folder_ids,
-            fields=["id", "name", "label", "parentId", "path", "folderType"]
+        folders_by_id = get_entity_query_broker().get_entities(
+            project_name, "folder", folder_ids, FOLDER_ITEM_FIELDS
         )
         # Make sure all folder ids are in output
         output = {folder_id: None for folder_id in folder_ids}
         output.update({
-            folder["id"]: _get_folder_item_from_entity(folder)
-            for folder in folders
+            folder_id: _get_folder_item_from_entity(folder)
+            for folder_id, folder in folders_by_id.items()
         })
         return output
 
@@ -335,7 +455,7 @@ class HierarchyModel(object):
         folders = ayon_api.get_folders(
             project_name,
             folder_paths=folder_paths,
-            fields=["id", "name", "label", "parentId", "path", "folderType"]
+            fields=FOLDER_ITEM_FIELDS
         )
         # Make sure all folder ids are in output
         for folder in folders:
@@ -506,6 +626,204 @@ class HierarchyModel(object):
             self._folders_items[project_name].update_data(folder_items)
 
     def _query_folders(self, project_name):
+        """Query folder items of a project.
+
+        Folder items are updated incrementally from previous state stored
+        in memory or on disk. Full hierarchy is queried if there is no
+        previous state or if incremental update is not possible.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            dict[str, FolderItem]: Folder items by id.
+        """
+
+        watermark = self._folders_watermarks.get(project_name)
+        full_query_time = self._folders_full_query_times.get(project_name, 0)
+        folder_items = None
+        if watermark is not None:
+            folder_items = dict(self._folders_items[project_name].get_data())
+        else:
+            try:
+                watermark, folder_items, full_query_time = (
+                    self._folders_snapshot_cache.load(project_name)
+                )
+            except Exception:
+                self.log.warning(
+                    "Failed to load folders snapshot of project '{}'".format(
+                        project_name
+                    ),
+                    exc_info=True
+                )
+
+        new_watermark = self._get_new_watermark()
+        updated = False
+        if (
+            folder_items is not None
+            and time.time() - full_query_time > self.max_incremental_age
+        ):
+            self.log.debug(
+                "Folders of project '{}' were not fully queried for too"
+                " long, skipping incremental update.".format(project_name)
+            )
+            folder_items = None
+
+        if folder_items is not None:
+            try:
+                updated = self._update_folder_items(
+                    project_name, folder_items, watermark
+                )
+            except Exception:
+                self.log.warning(
+                    "Incremental update of folders failed.", exc_info=True
+                )
+
+        if not updated:
+            full_query_time = time.time()
+            folder_items = self._query_folders_hierarchy(project_name)
+
+        self._folders_watermarks[project_name] = new_watermark
+        self._folders_full_query_times[project_name] = full_query_time
+        try:
+            self._folders_snapshot_cache.save(
+                project_name, new_watermark, folder_items, full_query_time
+            )
+        except Exception:
+            self.log.warning(
+                "Failed to store folders snapshot of project '{}'".format(
+                    project_name
+                ),
+                exc_info=True
+            )
+        return folder_items
+
+    def _get_new_watermark(self):
+        return (
+            arrow.utcnow().shift(seconds=-self.watermark_offset).isoformat()
+        )
+
+    def _update_folder_items(self, project_name, folder_items, watermark):
+        """Apply changes of folders after watermark to folder items.
+
+        Changed folders are found using server events. Only changed folders
+        are queried and paths of their children are updated.
+
+        Args:
+            project_name (str): Project name.
+            folder_items (dict[str, FolderItem]): Folder items to update.
+            watermark (str): Server time since when changes are applied.
+
+        Returns:
+            bool: Folder items were updated, full refresh is needed
+                if 'False' is returned.
+        """
+
+        changed_ids = set()
+        removed_ids = set()
+        for event in ayon_api.get_events(
+            topics=["entity.folder.*"],
+            project_names=[project_name],
+            newer_than=watermark,
+            fields={"topic", "summary"},
+        ):
+            summary = event["summary"]
+            if isinstance(summary, six.string_types):
+                summary = json.loads(summary)
+            folder_id = (summary or {}).get("entityId")
+            if not folder_id:
+                return False
+
+            if event["topic"] == "entity.folder.deleted":
+                removed_ids.add(folder_id)
+                changed_ids.discard(folder_id)
+            else:
+                changed_ids.add(folder_id)
+                removed_ids.discard(folder_id)
+
+            if (
+                len(changed_ids) + len(removed_ids)
+                > self.max_incremental_changes
+            ):
+                return False
+
+        if not changed_ids and not removed_ids:
+            return True
+
+        children_ids_by_parent_id = collections.defaultdict(set)
+        for folder_item in folder_items.values():
+            children_ids_by_parent_id[folder_item.parent_id].add(
+                folder_item.entity_id
+            )
+
+        # Removed folder removes also all its children
+        removed_queue = collections.deque(removed_ids)
+        while removed_queue:
+            folder_id = removed_queue.popleft()
+            folder_items.pop(folder_id, None)
+            removed_queue.extend(children_ids_by_parent_id.pop(folder_id, []))
+
+        if not changed_ids:
+            return True
+
+        # Folders which are not returned e.g. were deactivated
+        missing_ids = set(changed_ids)
+        moved_ids = set()
+        for folder in ayon_api.get_folders(
+            project_name,
+            folder_ids=changed_ids,
+            fields=FOLDER_ITEM_FIELDS,
+        ):
+            folder_item = _get_folder_item_from_entity(folder)
+            folder_id = folder_item.entity_id
+            missing_ids.discard(folder_id)
+            old_item = folder_items.get(folder_id)
+            if old_item is None:
+                # Parent of created folder must be already known
+                if (
+                    folder_item.parent_id is not None
+                    and folder_item.parent_id not in folder_items
+                    and folder_item.parent_id not in changed_ids
+                ):
+                    return False
+            else:
+                if old_item.path != folder_item.path:
+                    moved_ids.add(folder_id)
+                if old_item.parent_id != folder_item.parent_id:
+                    children_ids_by_parent_id[old_item.parent_id].discard(
+                        folder_id
+                    )
+            children_ids_by_parent_id[folder_item.parent_id].add(folder_id)
+            folder_items[folder_id] = folder_item
+
+        for folder_id in missing_ids:
+            removed_queue.append(folder_id)
+        while removed_queue:
+            folder_id = removed_queue.popleft()
+            folder_items.pop(folder_id, None)
+            removed_queue.extend(children_ids_by_parent_id.pop(folder_id, []))
+
+        # Update paths of children of renamed or moved folders
+        path_queue = collections.deque(moved_ids)
+        while path_queue:
+            parent_id = path_queue.popleft()
+            parent_item = folder_items.get(parent_id)
+            if parent_item is None:
+                continue
+            for folder_id in children_ids_by_parent_id.get(parent_id, []):
+                folder_item = folder_items.get(folder_id)
+                if folder_item is None:
+                    continue
+                # Create new item, the old one may be used by UI
+                item_data = folder_item.to_data()
+                item_data["path"] = "/".join(
+                    [parent_item.path, folder_item.name]
+                )
+                folder_items[folder_id] = FolderItem.from_data(item_data)
+                path_queue.append(folder_id)
+        return True
+
+    def _query_folders_hierarchy(self, project_name):
         hierarchy = ayon_api.get_folders_hierarchy(project_name)
 
         folder_items = {}
@@ -521,9 +839,10 @@ class HierarchyModel(object):
         if not project_name or not folder_ids:
             return
         project_cache = self._folders_by_id[project_name]
-        folders = ayon_api.get_folders(project_name, folder_ids=folder_ids)
-        for folder in folders:
-            folder_id = folder["id"]
+        folders_by_id = get_entity_query_broker().get_entities(
+            project_name, "folder", folder_ids
+        )
+        for folder_id, folder in folders_by_id.items():
             project_cache[folder_id].update_data(folder)
 
     def _query_task_entities(self, project_name, task_ids):
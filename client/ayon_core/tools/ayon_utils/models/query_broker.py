@@ -0,0 +1,352 @@
+"""Shared broker coalescing entity queries of tools.
+
+Tools running in one process (e.g. in tray) often query the same entities
+at the same time, for example when selection changes. The broker collects
+ids requested for the same project, entity type and fields during short
+interval and queries them in single request. Queried entities are cached
+so following requests don't query server at all.
+
+Entities returned by broker are shared between all callers and must not
+be modified.
+"""
+
+import time
+import threading
+import collections
+
+import ayon_api
+
+from ayon_core.lib import Logger
+
+from .cache import NestedCacheItem
+
+_QUERY_FUNC_BY_ENTITY_TYPE = {
+    "folder": ("get_folders", "folder_ids"),
+    "task": ("get_tasks", "task_ids"),
+    "product": ("get_products", "product_ids"),
+    "version": ("get_versions", "version_ids"),
+    "representation": ("get_representations", "representation_ids"),
+}
+
+
+class _QueryBatch:
+    """Ids which are queried in one request.
+
+    Args:
+        generation (int): Generation of broker cache when batch was created.
+    """
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.entity_ids = set()
+        self.entities = {}
+        self.error = None
+        self.done_event = threading.Event()
+
+
+class EntityQueryBroker:
+    """Query entities by ids with coalescing of concurrent requests.
+
+    Missing ids requested during 'coalesce_interval' for the same project,
+    entity type and fields are queried together. Request waits for other
+    requests only if other requests are running at the same time. Ids
+    which are already being queried are not requested again, caller waits
+    for result of the running query instead.
+
+    Args:
+        lifetime (Optional[int]): Lifetime of cached entities in seconds.
+        coalesce_interval (Optional[float]): How long in seconds first
+            request waits for other requests before query is sent.
+    """
+
+    lifetime = 60
+    coalesce_interval = 0.01
+    # Maximum count of cached entities of each entity type and fields
+    max_cached_entities = 10000
+
+    def __init__(self, lifetime=None, coalesce_interval=None):
+        if lifetime is None:
+            lifetime = self.lifetime
+        if coalesce_interval is None:
+            coalesce_interval = self.coalesce_interval
+        self._lifetime = lifetime
+        self._coalesce_interval = coalesce_interval
+        self._log = None
+
+        self._lock = threading.Lock()
+        # Cache by entity type and fields, nested by project name
+        #   and entity id
+        self._caches = {}
+        # Batches waiting for coalesce interval by query key
+        self._open_batches = {}
+        # Batches in progress by query key and entity id
+        self._batches_by_id = collections.defaultdict(dict)
+        # Results of batches created before last reset are not cached
+        self._generation = 0
+        # Count of requests being processed at the moment
+        self._active_requests = 0
+        self._stats = collections.Counter()
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    def get_entities(
+        self, project_name, entity_type, entity_ids, fields=None
+    ):
+        """Get entities by ids.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type. Supported types are 'folder',
+                'task', 'product', 'version' and 'representation'.
+            entity_ids (Iterable[str]): Entity ids.
+            fields (Optional[Iterable[str]]): Fields to query. All fields
+                are queried if not passed.
+
+        Returns:
+            dict[str, dict[str, Any]]: Entities by id. Entities which
+                were not found are not in output.
+        """
+
+        if entity_type not in _QUERY_FUNC_BY_ENTITY_TYPE:
+            raise ValueError(
+                "Unsupported entity type '{}'".format(entity_type)
+            )
+
+        entity_ids = set(entity_ids)
+        entity_ids.discard(None)
+        if not project_name or not entity_ids:
+            return {}
+
+        if fields is not None:
+            fields = frozenset(fields) | {"id"}
+        query_key = (project_name, entity_type, fields)
+
+        with self._lock:
+            self._active_requests += 1
+        try:
+            return self._get_entities(query_key, entity_ids)
+        finally:
+            with self._lock:
+                self._active_requests -= 1
+
+    def _get_entities(self, query_key, entity_ids):
+        project_name, entity_type, fields = query_key
+        output = {}
+        batches = set()
+        new_batch = None
+        with self._lock:
+            project_cache = self._get_cache(entity_type, fields)[project_name]
+            batches_by_id = self._batches_by_id[query_key]
+            missing_ids = set()
+            for entity_id in entity_ids:
+                cache = project_cache[entity_id]
+                if cache.is_valid:
+                    self._stats["hits"] += 1
+                    entity = cache.get_data()
+                    if entity is not None:
+                        output[entity_id] = entity
+                    continue
+
+                self._stats["misses"] += 1
+                batch = batches_by_id.get(entity_id)
+                if batch is None:
+                    missing_ids.add(entity_id)
+                else:
+                    self._stats["coalesced"] += 1
+                    batches.add(batch)
+
+            if missing_ids:
+                batch = self._open_batches.get(query_key)
+                if batch is None:
+                    batch = new_batch = _QueryBatch(self._generation)
+                    self._open_batches[query_key] = batch
+                else:
+                    self._stats["coalesced"] += len(missing_ids)
+                batch.entity_ids |= missing_ids
+                for entity_id in missing_ids:
+                    batches_by_id[entity_id] = batch
+                batches.add(batch)
+
+        if new_batch is not None:
+            self._process_batch(query_key, new_batch)
+
+        for batch in batches:
+            batch.done_event.wait()
+            if batch.error is not None:
+                raise batch.error
+
+            for entity_id in entity_ids & batch.entity_ids:
+                entity = batch.entities.get(entity_id)
+                if entity is not None:
+                    output[entity_id] = entity
+        return output
+
+    def get_entity(self, project_name, entity_type, entity_id, fields=None):
+        """Get entity by id.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type.
+            entity_id (str): Entity id.
+            fields (Optional[Iterable[str]]): Fields to query.
+
+        Returns:
+            Union[dict[str, Any], None]: Entity or None if was not found.
+        """
+
+        return self.get_entities(
+            project_name, entity_type, [entity_id], fields
+        ).get(entity_id)
+
+    def clear_project(self, project_name):
+        """Clear cached entities of a project.
+
+        Args:
+            project_name (str): Project name.
+        """
+
+        with self._lock:
+            for cache in self._caches.values():
+                cache.clear_key(project_name)
+
+    def reset(self):
+        """Clear all cached entities.
+
+        Results of queries which are running are not cached and new
+        requests don't wait for them.
+        """
+
+        with self._lock:
+            self._caches = {}
+            self._open_batches = {}
+            self._batches_by_id = collections.defaultdict(dict)
+            self._generation += 1
+
+    def get_stats(self):
+        """Statistics of requests since creation or last reset.
+
+        Returns:
+            dict[str, int]: Cache 'hits' and 'misses' per requested entity,
+                'coalesced' entities which were queried by other request,
+                'queries' sent to server, 'queried' entity ids and
+                statistics of 'caches' by entity type and fields.
+        """
+
+        with self._lock:
+            output = {
+                "hits": 0,
+                "misses": 0,
+                "coalesced": 0,
+                "queries": 0,
+                "queried": 0,
+            }
+            output.update(self._stats)
+            output["caches"] = {
+                "{}: {}".format(
+                    entity_type,
+                    "all" if fields is None else ", ".join(sorted(fields))
+                ): cache.get_stats()
+                for (entity_type, fields), cache in self._caches.items()
+            }
+        return output
+
+    def reset_stats(self):
+        """Reset statistics of requests."""
+
+        with self._lock:
+            self._stats.clear()
+
+    def _get_cache(self, entity_type, fields):
+        key = (entity_type, fields)
+        cache = self._caches.get(key)
+        if cache is None:
+            cache = NestedCacheItem(
+                levels=2,
+                lifetime=self._lifetime,
+                max_entries=self.max_cached_entities,
+                cleanup_interval=self._lifetime,
+            )
+            self._caches[key] = cache
+        return cache
+
+    def _process_batch(self, query_key, batch):
+        # Wait for other requests only if there are any, so single request
+        #   (e.g. from UI thread) is not delayed
+        with self._lock:
+            wait_for_requests = self._active_requests > 1
+        if wait_for_requests and self._coalesce_interval:
+            time.sleep(self._coalesce_interval)
+
+        with self._lock:
+            # New requests create new batch from now on
+            if self._open_batches.get(query_key) is batch:
+                self._open_batches.pop(query_key)
+            entity_ids = set(batch.entity_ids)
+            self._stats["queries"] += 1
+            self._stats["queried"] += len(entity_ids)
+
+        project_name, entity_type, fields = query_key
+        entities = None
+        try:
+            entities = self._query_entities(
+                project_name, entity_type, entity_ids, fields
+            )
+        except Exception as exc:
+            self.log.warning(
+                "Failed to query {} entities".format(entity_type),
+                exc_info=True
+            )
+            batch.error = exc
+
+        with self._lock:
+            batches_by_id = self._batches_by_id[query_key]
+            for entity_id in entity_ids:
+                if batches_by_id.get(entity_id) is batch:
+                    batches_by_id.pop(entity_id)
+
+            if entities is not None:
+                batch.entities = entities
+
+            if (
+                entities is not None
+                and batch.generation == self._generation
+            ):
+                project_cache = (
+                    self._get_cache(entity_type, fields)[project_name]
+                )
+                for entity_id in entity_ids:
+                    project_cache[entity_id] = entities.get(entity_id)
+        batch.done_event.set()
+
+    def _query_entities(self, project_name, entity_type, entity_ids, fields):
+        func_name, ids_arg = _QUERY_FUNC_BY_ENTITY_TYPE[entity_type]
+        func = getattr(ayon_api, func_name)
+        if fields is not None:
+            fields = set(fields)
+        kwargs = {ids_arg: entity_ids, "fields": fields}
+        return {
+            entity["id"]: entity
+            for entity in func(project_name, **kwargs)
+        }
+
+
+class _GlobalCache:
+    broker = None
+    lock = threading.Lock()
+
+
+def get_entity_query_broker():
+    """Entity query broker shared by all tools in the process.
+
+    Returns:
+        EntityQueryBroker: Shared broker.
+    """
+
+    with _GlobalCache.lock:
+        if _GlobalCache.broker is None:
+            _GlobalCache.broker = EntityQueryBroker()
+        return _GlobalCache.broker
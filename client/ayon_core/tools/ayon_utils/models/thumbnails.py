@@ -1,16 +1,43 @@
+import time
+import threading
 import collections
+from concurrent.futures import ThreadPoolExecutor
 
 import ayon_api
 
+from ayon_core.lib import Logger
 from ayon_core.client.thumbnails import AYONThumbnailCache
 
 from .cache import NestedCacheItem
+from .query_broker import get_entity_query_broker
+
+THUMBNAILS_MODEL_SENDER = "thumbnails.model"
 
 
 class ThumbnailsModel:
+    """Model for thumbnails of folders and versions.
+
+    Thumbnails can be downloaded synchronously using 'get_thumbnail_path'
+    or prefetched in background threads using 'prefetch_thumbnails'.
+    Prefetched thumbnails are reported with 'thumbnails.ready' event which
+    is emitted by 'emit_ready_thumbnails' so the event is always triggered
+    in the thread which calls the method (usually main/UI thread).
+
+    Args:
+        controller (Optional[Any]): Controller with 'emit_event' method.
+            Prefetch does not emit events if controller is not passed.
+    """
+
     entity_cache_lifetime = 240  # In seconds
+    # Amount of threads downloading thumbnails at the same time
+    # - keep it lower than connection pool size of 'ayon_api' connection
+    prefetch_workers = 4
+    # Failed prefetch of thumbnail is not tried again for this time
+    failed_prefetch_lifetime = 60  # In seconds
 
-    def __init__(self):
+    def __init__(self, controller=None):
+        self._log = None
+        self._controller = controller
         self._thumbnail_cache = AYONThumbnailCache()
         self._paths_cache = collections.defaultdict(dict)
         self._folders_cache = NestedCacheItem(
@@ -18,14 +45,123 @@ class ThumbnailsModel:
         self._versions_cache = NestedCacheItem(
             levels=2, lifetime=self.entity_cache_lifetime)
 
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_executor = None
+        # Prefetches started before last reset are ignored
+        self._prefetch_generation = 0
+        self._futures_by_key = {}
+        self._failed_prefetch_times = {}
+        self._ready_queue = collections.deque()
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
     def reset(self):
+        with self._prefetch_lock:
+            executor = self._prefetch_executor
+            futures = list(self._futures_by_key.values())
+            self._prefetch_executor = None
+            self._prefetch_generation += 1
+            self._futures_by_key = {}
+            self._failed_prefetch_times = {}
+            self._ready_queue.clear()
+
+        for future in futures:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
         self._paths_cache = collections.defaultdict(dict)
         self._folders_cache.reset()
         self._versions_cache.reset()
+        get_entity_query_broker().reset()
 
     def get_thumbnail_path(self, project_name, thumbnail_id):
         return self._get_thumbnail_path(project_name, thumbnail_id)
 
+    def prefetch_thumbnails(self, project_name, thumbnail_ids):
+        """Download thumbnails in background.
+
+        Thumbnails which are already available or are being downloaded are
+        skipped. Each thumbnail id is downloaded only once even if is
+        requested multiple times. Thumbnails which failed to download are
+        not tried again for 'failed_prefetch_lifetime' seconds.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+
+        Returns:
+            dict[str, Union[str, None]]: Paths of thumbnails which were
+                already available by thumbnail id.
+        """
+
+        output = {}
+        if not project_name:
+            return output
+
+        project_cache = self._paths_cache[project_name]
+        now = time.monotonic()
+        with self._prefetch_lock:
+            for thumbnail_id in set(thumbnail_ids):
+                if not thumbnail_id:
+                    continue
+
+                if thumbnail_id in project_cache:
+                    output[thumbnail_id] = project_cache[thumbnail_id]
+                    continue
+
+                key = (project_name, thumbnail_id)
+                if key in self._futures_by_key:
+                    continue
+
+                failed_time = self._failed_prefetch_times.get(key)
+                if failed_time is not None:
+                    if now - failed_time < self.failed_prefetch_lifetime:
+                        continue
+                    self._failed_prefetch_times.pop(key)
+
+                executor = self._get_prefetch_executor()
+                self._futures_by_key[key] = executor.submit(
+                    self._prefetch_thumbnail,
+                    project_name,
+                    thumbnail_id,
+                    self._prefetch_generation
+                )
+        return output
+
+    def emit_ready_thumbnails(self):
+        """Emit events for prefetched thumbnails.
+
+        Event 'thumbnails.ready' is emitted for each project with data
+        'project_name' and 'thumbnail_paths' (path by thumbnail id).
+
+        Returns:
+            bool: There are still thumbnails being prefetched.
+        """
+
+        paths_by_project = collections.defaultdict(dict)
+        while self._ready_queue:
+            project_name, thumbnail_id, path = self._ready_queue.popleft()
+            paths_by_project[project_name][thumbnail_id] = path
+
+        if self._controller is not None:
+            for project_name, thumbnail_paths in paths_by_project.items():
+                self._controller.emit_event(
+                    "thumbnails.ready",
+                    {
+                        "project_name": project_name,
+                        "thumbnail_paths": thumbnail_paths,
+                    },
+                    THUMBNAILS_MODEL_SENDER
+                )
+
+        with self._prefetch_lock:
+            return bool(self._futures_by_key or self._ready_queue)
+
     def get_folder_thumbnail_ids(self, project_name, folder_ids):
         project_cache = self._folders_cache[project_name]
         output = {}
@@ -58,6 +194,40 @@ class ThumbnailsModel:
             output[version_id] = cache.get_data()
         return output
 
+    def _get_prefetch_executor(self):
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=self.prefetch_workers,
+                thread_name_prefix="ThumbnailsPrefetch"
+            )
+        return self._prefetch_executor
+
+    def _prefetch_thumbnail(self, project_name, thumbnail_id, generation):
+        key = (project_name, thumbnail_id)
+        filepath = None
+        failed = False
+        try:
+            filepath = self._download_thumbnail(project_name, thumbnail_id)
+        except Exception:
+            failed = True
+            self.log.warning(
+                "Failed to download thumbnail '{}'".format(thumbnail_id),
+                exc_info=True
+            )
+
+        with self._prefetch_lock:
+            if generation != self._prefetch_generation:
+                return filepath
+            # Failed download is not cached so it is tried again on next
+            #   request after a while
+            if failed:
+                self._failed_prefetch_times[key] = time.monotonic()
+            else:
+                self._paths_cache[project_name][thumbnail_id] = filepath
+            self._ready_queue.append((project_name, thumbnail_id, filepath))
+            self._futures_by_key.pop(key, None)
+        return filepath
+
     def _get_thumbnail_path(self, project_name, thumbnail_id):
         if not thumbnail_id:
             return None
@@ -66,11 +236,21 @@ class ThumbnailsModel:
         if thumbnail_id in project_cache:
             return project_cache[thumbnail_id]
 
+        # Wait for prefetch to finish instead of downloading it twice
+        with self._prefetch_lock:
+            future = self._futures_by_key.get((project_name, thumbnail_id))
+        if future is not None:
+            return future.result()
+
+        filepath = self._download_thumbnail(project_name, thumbnail_id)
+        project_cache[thumbnail_id] = filepath
+        return filepath
+
+    def _download_thumbnail(self, project_name, thumbnail_id):
         filepath = self._thumbnail_cache.get_thumbnail_filepath(
             project_name, thumbnail_id
         )
         if filepath is not None:
-            project_cache[thumbnail_id] = filepath
             return filepath
 
         # 'ayon_api' had a bug, public function
@@ -88,31 +268,26 @@ class ThumbnailsModel:
                 result.content,
                 result.content_type
             )
-        project_cache[thumbnail_id] = filepath
         return filepath
 
     def _query_folder_thumbnail_ids(self, project_name, folder_ids):
         if not project_name or not folder_ids:
             return
 
-        folders = ayon_api.get_folders(
-            project_name,
-            folder_ids=folder_ids,
-            fields=["id", "thumbnailId"]
+        folders_by_id = get_entity_query_broker().get_entities(
+            project_name, "folder", folder_ids, {"id", "thumbnailId"}
         )
         project_cache = self._folders_cache[project_name]
-        for folder in folders:
-            project_cache[folder["id"]] = folder["thumbnailId"]
+        for folder_id, folder in folders_by_id.items():
+            project_cache[folder_id] = folder["thumbnailId"]
 
     def _query_version_thumbnail_ids(self, project_name, version_ids):
         if not project_name or not version_ids:
             return
 
-        versions = ayon_api.get_versions(
-            project_name,
-            version_ids=version_ids,
-            fields=["id", "thumbnailId"]
+        versions_by_id = get_entity_query_broker().get_entities(
+            project_name, "version", version_ids, {"id", "thumbnailId"}
         )
         project_cache = self._versions_cache[project_name]
-        for version in versions:
-            project_cache[version["id"]] = version["thumbnailId"]
+        for version_id, version in versions_by_id.items():
+            project_cache[version_id] = version["thumbnailId"]
@@ -48,6 +48,9 @@ class ProductItem:
         folder_id (str): Folder id.
         folder_label (str): Folder label.
         version_items (dict[str, VersionItem]): Version items by id.
+        versions_loaded (Optional[bool]): All versions of product are
+            in 'version_items'. Only last versions are available if
+            is 'False'.
     """
 
     def __init__(
@@ -62,6 +65,7 @@ class ProductItem:
         folder_id,
         folder_label,
         version_items,
+        versions_loaded=True,
     ):
         self.product_id = product_id
         self.product_type = product_type
@@ -73,6 +77,7 @@ class ProductItem:
         self.folder_id = folder_id
         self.folder_label = folder_label
         self.version_items = version_items
+        self.versions_loaded = versions_loaded
 
     def to_data(self):
         return {
@@ -89,6 +94,7 @@ class ProductItem:
                 version_id: version_item.to_data()
                 for version_id, version_item in self.version_items.items()
             },
+            "versions_loaded": self.versions_loaded,
         }
 
     @classmethod
@@ -500,6 +506,13 @@ class FrontendLoaderController(_BaseLoaderController):
                 "sender": sender
             }
 
+        Event "products.refresh.progress" is triggered after each queried
+        page of products with additional key "product_count" containing
+        number of already processed products.
+
+        Product items contain only last versions, use
+        'load_product_versions' to get all versions of a product.
+
         Args:
             project_name (str): Project name.
             folder_ids (Iterable[str]): Folder ids.
@@ -511,6 +524,75 @@ class FrontendLoaderController(_BaseLoaderController):
 
         pass
 
+    @abstractmethod
+    def start_product_items_refresh(
+        self, project_name, folder_ids, sender=None
+    ):
+        """Start refresh of product items which can query in a thread.
+
+        Alternative to 'get_product_items' for UI which doesn't want to
+        block main thread. Returned refresh contains product items of
+        folders which are cached in 'cached_product_items'. Pages of other
+        product items are queried by 'iter_pages' method of the refresh,
+        which can run in another thread. Each page must be passed to
+        'store_product_items_page' and the refresh must be finished with
+        'finish_product_items_refresh' in main thread.
+
+        Triggers the same events as 'get_product_items', all of them in
+        main thread.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+            sender (Optional[str]): Sender who requested the items.
+
+        Returns:
+            ProductItemsRefresh: Refresh of product items.
+        """
+
+        pass
+
+    @abstractmethod
+    def store_product_items_page(self, refresh, product_items_by_id):
+        """Store page of product items queried by refresh.
+
+        Args:
+            refresh (ProductItemsRefresh): Refresh which queried the page.
+            product_items_by_id (dict[str, ProductItem]): Product items by
+                product id.
+
+        Returns:
+            list[ProductItem]: Stored product items.
+        """
+
+        pass
+
+    @abstractmethod
+    def finish_product_items_refresh(self, refresh, failed=False):
+        """Finish refresh of product items.
+
+        Args:
+            refresh (ProductItemsRefresh): Refresh to finish.
+            failed (Optional[bool]): Query of product items failed.
+        """
+
+        pass
+
+    @abstractmethod
+    def load_product_versions(self, project_name, product_ids):
+        """Make sure product items contain all versions.
+
+        Product items for folders are created only with last versions.
+        All versions are loaded with this method when needed, e.g. when
+        version is being changed in UI.
+
+        Args:
+            project_name (str): Project name.
+            product_ids (Iterable[str]): Product ids.
+        """
+
+        pass
+
     @abstractmethod
     def get_product_item(self, project_name, product_id):
         """Receive single product item.
@@ -627,6 +709,37 @@ class FrontendLoaderController(_BaseLoaderController):
 
         pass
 
+    @abstractmethod
+    def prefetch_thumbnails(self, project_name, thumbnail_ids):
+        """Download thumbnails in background.
+
+        Thumbnails that are not available yet are downloaded in background
+        threads. Event 'thumbnails.ready' is emitted, once they're
+        downloaded, from 'emit_ready_thumbnails'.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+
+        Returns:
+            dict[str, Union[str, None]]: Paths of already available
+                thumbnails by thumbnail id.
+        """
+
+        pass
+
+    @abstractmethod
+    def emit_ready_thumbnails(self):
+        """Emit 'thumbnails.ready' events for prefetched thumbnails.
+
+        Should be called from main thread.
+
+        Returns:
+            bool: Some thumbnails are still being downloaded.
+        """
+
+        pass
+
     # Selection model wrapper calls
     @abstractmethod
     def get_selected_project_name(self):
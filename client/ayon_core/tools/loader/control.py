@@ -112,7 +112,7 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         self._hierarchy_model = HierarchyModel(self)
         self._products_model = ProductsModel(self)
         self._loader_actions_model = LoaderActionsModel(self)
-        self._thumbnails_model = ThumbnailsModel()
+        self._thumbnails_model = ThumbnailsModel(self)
         self._site_sync_model = SiteSyncModel(self)
 
     @property
@@ -187,6 +187,24 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         return self._products_model.get_product_items(
             project_name, folder_ids, sender)
 
+    def start_product_items_refresh(
+        self, project_name, folder_ids, sender=None
+    ):
+        return self._products_model.start_product_items_refresh(
+            project_name, folder_ids, sender
+        )
+
+    def store_product_items_page(self, refresh, product_items_by_id):
+        return self._products_model.store_product_items_page(
+            refresh, product_items_by_id
+        )
+
+    def finish_product_items_refresh(self, refresh, failed=False):
+        self._products_model.finish_product_items_refresh(refresh, failed)
+
+    def load_product_versions(self, project_name, product_ids):
+        self._products_model.load_product_versions(project_name, product_ids)
+
     def get_product_item(self, project_name, product_id):
         return self._products_model.get_product_item(
             project_name, product_id
@@ -224,6 +242,14 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
             project_name, thumbnail_id
         )
 
+    def prefetch_thumbnails(self, project_name, thumbnail_ids):
+        return self._thumbnails_model.prefetch_thumbnails(
+            project_name, thumbnail_ids
+        )
+
+    def emit_ready_thumbnails(self):
+        return self._thumbnails_model.emit_ready_thumbnails()
+
     def change_products_group(self, project_name, product_ids, group_name):
         self._products_model.change_products_group(
             project_name, product_ids, group_name
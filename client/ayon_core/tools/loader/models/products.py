@@ -1,5 +1,4 @@
 import collections
-import contextlib
 
 import arrow
 import ayon_api
@@ -73,6 +72,7 @@ def product_item_from_entity(
     product_type_items_by_name,
     folder_label,
     product_in_scene,
+    versions_loaded=True,
 ):
     product_attribs = product_entity["attrib"]
     group = product_attribs.get("productGroup")
@@ -109,6 +109,7 @@ def product_item_from_entity(
         folder_id=product_entity["folderId"],
         folder_label=folder_label,
         version_items=version_items,
+        versions_loaded=versions_loaded,
     )
 
 
@@ -134,6 +135,77 @@ def create_default_product_type_item(product_type):
     return ProductTypeItem(product_type, icon, True)
 
 
+class ProductItemsRefresh:
+    """Refresh of product items of folders.
+
+    Created by 'ProductsModel.start_product_items_refresh' in main thread.
+    Pages of product items are queried with 'iter_pages' which uses only
+    server api, does not use controller nor caches of the model and does
+    not emit events, so it can run in another thread. Each queried page
+    must be passed to 'ProductsModel.store_product_items_page' and the
+    refresh must be finished with 'ProductsModel.finish_product_items_refresh'
+    in main thread.
+
+    Args:
+        model (ProductsModel): Model which created the refresh.
+        project_name (str): Project name.
+        folder_ids (set[str]): Ids of folders which are queried.
+        sender (Union[str, None]): Who triggered the refresh.
+        cached_product_items (list[ProductItem]): Product items of
+            requested folders which were available in cache.
+        folder_items (dict[str, FolderItem]): Folder items by id.
+        product_type_items (list[ProductTypeItem]): Product type items.
+        loaded_product_ids (set[str]): Ids of products loaded in host.
+    """
+
+    def __init__(
+        self,
+        model,
+        project_name,
+        folder_ids,
+        sender,
+        cached_product_items,
+        folder_items,
+        product_type_items,
+        loaded_product_ids,
+    ):
+        self.project_name = project_name
+        self.folder_ids = folder_ids
+        self.sender = sender
+        self.cached_product_items = cached_product_items
+        self.product_count = 0
+        self.items_by_folder_id = {
+            folder_id: {}
+            for folder_id in folder_ids
+        }
+        self._model = model
+        self._folder_items = folder_items
+        self._product_type_items = product_type_items
+        self._loaded_product_ids = loaded_product_ids
+
+    def iter_pages(self):
+        """Query product items in pages.
+
+        Can be called from another thread.
+
+        Yields:
+            dict[str, ProductItem]: Product items by product id.
+        """
+
+        if not self.folder_ids:
+            return
+        for product_items_by_id in (
+            self._model._iter_last_version_product_items(
+                self.project_name,
+                self.folder_ids,
+                self._folder_items,
+                self._product_type_items,
+                self._loaded_product_ids,
+            )
+        ):
+            yield product_items_by_id
+
+
 class ProductsModel:
     """Model for products, version and representation.
 
@@ -146,6 +218,14 @@ class ProductsModel:
     """
 
     lifetime = 60  # In seconds (minute by default)
+    # Approximate maximum size of cached product and representation items
+    #   of all projects
+    cache_max_bytes = 512 * 1024 * 1024
+    # Interval in seconds in which outdated cache items are removed
+    cache_cleanup_interval = 300
+    # Amount of products processed at once when products of folders are
+    #   refreshed
+    products_page_size = 500
 
     def __init__(self, controller):
         self._controller = controller
@@ -155,14 +235,29 @@ class ProductsModel:
         self._product_item_by_id = collections.defaultdict(dict)
         self._version_item_by_id = collections.defaultdict(dict)
         self._product_folder_ids_mapping = collections.defaultdict(dict)
+        # Product items of expired folder caches removed in cleanup thread,
+        #   mapping is cleaned up on main thread
+        self._expired_product_items = collections.deque()
 
         # Cache helpers
         self._product_type_items_cache = NestedCacheItem(
             levels=1, default_factory=list, lifetime=self.lifetime)
         self._product_items_cache = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
+            levels=2,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_bytes=self.cache_max_bytes,
+            on_evict=self._on_product_items_evict,
+            on_expire=self._on_product_items_expire,
+            cleanup_interval=self.cache_cleanup_interval,
+        )
         self._repre_items_cache = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
+            levels=2,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_bytes=self.cache_max_bytes,
+            cleanup_interval=self.cache_cleanup_interval,
+        )
 
     def reset(self):
         """Reset model with all cached data."""
@@ -170,6 +265,7 @@ class ProductsModel:
         self._product_item_by_id.clear()
         self._version_item_by_id.clear()
         self._product_folder_ids_mapping.clear()
+        self._expired_product_items.clear()
 
         self._product_type_items_cache.reset()
         self._product_items_cache.reset()
@@ -215,23 +311,198 @@ class ProductsModel:
         if not project_name or not folder_ids:
             return []
 
-        project_cache = self._product_items_cache[project_name]
-        output = []
+        refresh = self.start_product_items_refresh(
+            project_name, folder_ids, sender
+        )
+        output = list(refresh.cached_product_items)
+        if not refresh.folder_ids:
+            return output
+
+        failed = True
+        try:
+            for product_items_by_id in refresh.iter_pages():
+                output.extend(
+                    self.store_product_items_page(
+                        refresh, product_items_by_id
+                    )
+                )
+            failed = False
+        finally:
+            self.finish_product_items_refresh(refresh, failed)
+        return output
+
+    def start_product_items_refresh(self, project_name, folder_ids, sender):
+        """Prepare refresh of product items which can query in thread.
+
+        Product items of folders with valid cache are available in
+        'cached_product_items' of the refresh and only other folders are
+        queried. Event "products.refresh.started" is emitted if there are
+        folders to query.
+
+        Must be called from main thread.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+            sender (Union[str, None]): Who triggered the refresh.
+
+        Returns:
+            ProductItemsRefresh: Refresh of product items.
+        """
+
+        self._clear_expired_product_items()
+
+        cached_product_items = []
         folder_ids_to_update = set()
-        for folder_id in folder_ids:
-            cache = project_cache[folder_id]
-            if cache.is_valid:
-                output.extend(cache.get_data().values())
-            else:
-                folder_ids_to_update.add(folder_id)
+        if project_name:
+            project_cache = self._product_items_cache[project_name]
+            for folder_id in folder_ids:
+                cache = project_cache[folder_id]
+                if cache.is_valid:
+                    cached_product_items.extend(cache.get_data().values())
+                else:
+                    folder_ids_to_update.add(folder_id)
+
+        folder_items = {}
+        product_type_items = []
+        loaded_product_ids = set()
+        if folder_ids_to_update:
+            folder_items = self._controller.get_folder_items(project_name)
+            product_type_items = self.get_product_type_items(project_name)
+            loaded_product_ids = self._controller.get_loaded_product_ids()
 
-        self._refresh_product_items(
-            project_name, folder_ids_to_update, sender)
+            self._clear_product_version_items(
+                project_name, folder_ids_to_update
+            )
+            project_mapping = self._product_folder_ids_mapping[project_name]
+            for folder_id in folder_ids_to_update:
+                project_mapping[folder_id] = set()
 
-        for folder_id in folder_ids_to_update:
-            cache = project_cache[folder_id]
-            output.extend(cache.get_data().values())
-        return output
+            self._emit_products_refresh_event(
+                "products.refresh.started",
+                project_name,
+                folder_ids_to_update,
+                sender
+            )
+
+        return ProductItemsRefresh(
+            self,
+            project_name,
+            folder_ids_to_update,
+            sender,
+            cached_product_items,
+            folder_items,
+            product_type_items,
+            loaded_product_ids,
+        )
+
+    def store_product_items_page(self, refresh, product_items_by_id):
+        """Store page of product items queried by refresh.
+
+        Event "products.refresh.progress" is emitted.
+
+        Must be called from main thread.
+
+        Args:
+            refresh (ProductItemsRefresh): Refresh which queried the page.
+            product_items_by_id (dict[str, ProductItem]): Product items
+                by product id.
+
+        Returns:
+            list[ProductItem]: Stored product items.
+        """
+
+        project_name = refresh.project_name
+        project_mapping = self._product_folder_ids_mapping[project_name]
+        product_item_by_id = self._product_item_by_id[project_name]
+        version_item_by_id = self._version_item_by_id[project_name]
+        for product_id, product_item in product_items_by_id.items():
+            folder_id = product_item.folder_id
+            refresh.items_by_folder_id[folder_id][product_id] = product_item
+
+            project_mapping[folder_id].add(product_id)
+            product_item_by_id[product_id] = product_item
+            for version_id, version_item in (
+                product_item.version_items.items()
+            ):
+                version_item_by_id[version_id] = version_item
+
+        refresh.product_count += len(product_items_by_id)
+        self._emit_products_refresh_event(
+            "products.refresh.progress",
+            project_name,
+            refresh.folder_ids,
+            refresh.sender,
+            product_count=refresh.product_count,
+        )
+        return list(product_items_by_id.values())
+
+    def finish_product_items_refresh(self, refresh, failed=False):
+        """Finish refresh of product items.
+
+        Queried product items are stored to cache and event
+        "products.refresh.finished" is emitted.
+
+        Must be called from main thread.
+
+        Args:
+            refresh (ProductItemsRefresh): Refresh to finish.
+            failed (Optional[bool]): Query of product items failed. Cache
+                is not updated.
+        """
+
+        if not refresh.folder_ids:
+            return
+
+        if not failed:
+            project_cache = self._product_items_cache[refresh.project_name]
+            for folder_id, product_items in (
+                refresh.items_by_folder_id.items()
+            ):
+                project_cache[folder_id].update_data(product_items)
+
+        self._emit_products_refresh_event(
+            "products.refresh.finished",
+            refresh.project_name,
+            refresh.folder_ids,
+            refresh.sender
+        )
+
+    def load_product_versions(self, project_name, product_ids):
+        """Query all versions of product items which have only last versions.
+
+        Args:
+            project_name (str): Project name.
+            product_ids (Iterable[str]): Product ids.
+        """
+
+        if not project_name or not product_ids:
+            return
+
+        product_items_by_id = {
+            product_id: product_item
+            for product_id, product_item in self._get_product_items_by_id(
+                project_name, product_ids
+            ).items()
+            if not product_item.versions_loaded
+        }
+        if not product_items_by_id:
+            return
+
+        version_item_by_id = self._version_item_by_id[project_name]
+        versions = ayon_api.get_versions(
+            project_name, product_ids=set(product_items_by_id)
+        )
+        for version in versions:
+            version_item = version_item_from_entity(version)
+            product_item = product_items_by_id[version_item.product_id]
+            product_item.version_items[version_item.version_id] = (
+                version_item
+            )
+            version_item_by_id[version_item.version_id] = version_item
+
+        for product_item in product_items_by_id.values():
+            product_item.versions_loaded = True
 
     def get_product_item(self, project_name, product_id):
         """Get product item based on passed product id.
@@ -452,6 +723,8 @@ class ProductsModel:
         versions,
         folder_items=None,
         product_type_items=None,
+        versions_loaded=True,
+        loaded_product_ids=None,
     ):
         if folder_items is None:
             folder_items = self._controller.get_folder_items(project_name)
@@ -459,7 +732,8 @@ class ProductsModel:
         if product_type_items is None:
             product_type_items = self.get_product_type_items(project_name)
 
-        loaded_product_ids = self._controller.get_loaded_product_ids()
+        if loaded_product_ids is None:
+            loaded_product_ids = self._controller.get_loaded_product_ids()
 
         versions_by_product_id = collections.defaultdict(list)
         for version in versions:
@@ -484,6 +758,7 @@ class ProductsModel:
                 product_type_items_by_name,
                 folder_item.label,
                 product_id in loaded_product_ids,
+                versions_loaded,
             )
             output[product_id] = product_item
         return output
@@ -534,6 +809,87 @@ class ProductsModel:
             project_name, products, versions, folder_items=folder_items
         )
 
+    def _iter_last_version_product_items(
+        self,
+        project_name,
+        folder_ids,
+        folder_items,
+        product_type_items,
+        loaded_product_ids,
+    ):
+        """Query product items of folders in pages.
+
+        Product items contain only last version and hero version to avoid
+        querying all versions of all products at once.
+
+        Does not use controller nor caches so it can run in another thread.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids under which are products.
+            folder_items (Dict[str, FolderItem]): Prepared folder items
+                from controller.
+            product_type_items (list[ProductTypeItem]): Product type items.
+            loaded_product_ids (set[str]): Ids of products loaded in host.
+
+        Yields:
+            dict[str, ProductItem]: Product items by product id.
+        """
+
+        products = []
+        for product in ayon_api.get_products(
+            project_name, folder_ids=folder_ids
+        ):
+            products.append(product)
+            if len(products) < self.products_page_size:
+                continue
+            yield self._create_last_version_product_items(
+                project_name,
+                products,
+                folder_items,
+                product_type_items,
+                loaded_product_ids
+            )
+            products = []
+
+        if products:
+            yield self._create_last_version_product_items(
+                project_name,
+                products,
+                folder_items,
+                product_type_items,
+                loaded_product_ids
+            )
+
+    def _create_last_version_product_items(
+        self,
+        project_name,
+        products,
+        folder_items,
+        product_type_items,
+        loaded_product_ids,
+    ):
+        product_ids = {product["id"] for product in products}
+        versions = [
+            version
+            for version in ayon_api.get_last_versions(
+                project_name, product_ids
+            ).values()
+            if version
+        ]
+        versions.extend(ayon_api.get_hero_versions(
+            project_name, product_ids=product_ids
+        ))
+        return self._create_product_items(
+            project_name,
+            products,
+            versions,
+            folder_items=folder_items,
+            product_type_items=product_type_items,
+            versions_loaded=False,
+            loaded_product_ids=loaded_product_ids,
+        )
+
     def _query_version_items_by_ids(self, project_name, version_ids):
         versions = list(ayon_api.get_versions(
             project_name, version_ids=version_ids
@@ -581,83 +937,80 @@ class ProductsModel:
                 for version_item in product_item.version_items.values():
                     version_item_by_id.pop(version_item.version_id, None)
 
-    def _refresh_product_items(self, project_name, folder_ids, sender):
-        """Refresh product items and store them in cache.
+    def _clear_cached_product_items(
+        self, project_name, folder_id, product_items
+    ):
+        """Clear product and version items of removed folder cache.
+
+        Only items which are still the same objects are removed, so items
+        of refresh which started after the cache was removed are kept.
 
         Args:
             project_name (str): Name of project.
-            folder_ids (Iterable[str]): Folder ids which are being refreshed.
-            sender (Union[str, None]): Who triggered the refresh.
+            folder_id (str): Folder id.
+            product_items (dict[str, ProductItem]): Removed product items.
         """
 
-        if not project_name or not folder_ids:
+        if not product_items:
             return
-
-        self._clear_product_version_items(project_name, folder_ids)
-
-        project_mapping = self._product_folder_ids_mapping[project_name]
+        product_ids = self._product_folder_ids_mapping[project_name].get(
+            folder_id
+        )
         product_item_by_id = self._product_item_by_id[project_name]
         version_item_by_id = self._version_item_by_id[project_name]
-
-        for folder_id in folder_ids:
-            project_mapping[folder_id] = set()
-
-        with self._product_refresh_event_manager(
-            project_name, folder_ids, sender
-        ):
-            folder_items = self._controller.get_folder_items(project_name)
-            items_by_folder_id = {
-                folder_id: {}
-                for folder_id in folder_ids
-            }
-            product_items_by_id = self._query_product_items_by_ids(
-                project_name,
-                folder_ids=folder_ids,
-                folder_items=folder_items
+        for product_id, product_item in product_items.items():
+            if product_item_by_id.get(product_id) is not product_item:
+                continue
+            product_item_by_id.pop(product_id)
+            if product_ids:
+                product_ids.discard(product_id)
+            for version_id in product_item.version_items:
+                version_item_by_id.pop(version_id, None)
+
+    def _clear_expired_product_items(self):
+        while self._expired_product_items:
+            keys, product_items = self._expired_product_items.popleft()
+            project_name, folder_id = keys
+            self._clear_cached_product_items(
+                project_name, folder_id, product_items
             )
-            for product_id, product_item in product_items_by_id.items():
-                folder_id = product_item.folder_id
-                items_by_folder_id[product_item.folder_id][product_id] = (
-                    product_item
-                )
 
-                project_mapping[folder_id].add(product_id)
-                product_item_by_id[product_id] = product_item
-                for version_id, version_item in (
-                    product_item.version_items.items()
-                ):
-                    version_item_by_id[version_id] = version_item
+    def _on_product_items_evict(self, keys, product_items):
+        """Clear product and version items of evicted folder cache.
 
-            project_cache = self._product_items_cache[project_name]
-            for folder_id, product_items in items_by_folder_id.items():
-                project_cache[folder_id].update_data(product_items)
+        Args:
+            keys (tuple[str, str]): Project name and folder id.
+            product_items (dict[str, ProductItem]): Evicted product items.
+        """
 
-    @contextlib.contextmanager
-    def _product_refresh_event_manager(
-        self, project_name, folder_ids, sender
-    ):
-        self._controller.emit_event(
-            "products.refresh.started",
-            {
-                "project_name": project_name,
-                "folder_ids": folder_ids,
-                "sender": sender,
-            },
-            PRODUCTS_MODEL_SENDER
+        project_name, folder_id = keys
+        self._clear_cached_product_items(
+            project_name, folder_id, product_items
         )
-        try:
-            yield
 
-        finally:
-            self._controller.emit_event(
-                "products.refresh.finished",
-                {
-                    "project_name": project_name,
-                    "folder_ids": folder_ids,
-                    "sender": sender,
-                },
-                PRODUCTS_MODEL_SENDER
-            )
+    def _on_product_items_expire(self, keys, product_items):
+        """Queue product items of expired folder cache for cleanup.
+
+        Called from cache cleanup thread, items are removed from mapping
+        on next refresh of product items on main thread.
+
+        Args:
+            keys (tuple[str, str]): Project name and folder id.
+            product_items (dict[str, ProductItem]): Expired product items.
+        """
+
+        self._expired_product_items.append((keys, product_items))
+
+    def _emit_products_refresh_event(
+        self, topic, project_name, folder_ids, sender, **kwargs
+    ):
+        data = {
+            "project_name": project_name,
+            "folder_ids": folder_ids,
+            "sender": sender,
+        }
+        data.update(kwargs)
+        self._controller.emit_event(topic, data, PRODUCTS_MODEL_SENDER)
 
     def refresh_representation_items(
         self, project_name, version_ids, sender
@@ -1,3 +1,4 @@
+import uuid
 import collections
 
 import qtawesome
@@ -36,6 +37,46 @@ SYNC_ACTIVE_SITE_AVAILABILITY = QtCore.Qt.UserRole + 25
 SYNC_REMOTE_SITE_AVAILABILITY = QtCore.Qt.UserRole + 26
 
 
+class ProductItemsPagesThread(QtCore.QThread):
+    """Query pages of product items of a refresh.
+
+    Pages are sent with 'page_received' signal which is (with default
+    connection) received in main thread.
+    """
+
+    page_received = QtCore.Signal(str, object)
+    refresh_finished = QtCore.Signal(str)
+
+    def __init__(self, thread_id, refresh):
+        super(ProductItemsPagesThread, self).__init__()
+        self._id = thread_id
+        self._refresh = refresh
+        self._exception = None
+        self.finished.connect(self._on_finish_callback)
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def refresh(self):
+        return self._refresh
+
+    @property
+    def failed(self):
+        return self._exception is not None
+
+    def run(self):
+        try:
+            for product_items_by_id in self._refresh.iter_pages():
+                self.page_received.emit(self._id, product_items_by_id)
+        except Exception as exc:
+            self._exception = exc
+
+    def _on_finish_callback(self):
+        self.refresh_finished.emit(self._id)
+
+
 class ProductsModel(QtGui.QStandardItemModel):
     refreshed = QtCore.Signal()
     version_changed = QtCore.Signal()
@@ -86,6 +127,9 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._items_by_id = {}
         self._group_items_by_name = {}
         self._merged_items_by_id = {}
+        # Product ids by merge path (group name and product name)
+        self._product_ids_by_path = {}
+        self._product_types_by_group_name = {}
 
         # product item objects (they have version information)
         self._product_items_by_id = {}
@@ -97,6 +141,9 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._last_project_name = None
         self._last_folder_ids = []
 
+        self._refresh_threads = {}
+        self._current_refresh_thread = None
+
     def get_product_item_indexes(self):
         return [
             item.index()
@@ -115,6 +162,22 @@ class ProductsModel(QtGui.QStandardItemModel):
 
         return self._product_items_by_id.get(product_id)
 
+    def load_product_versions(self, product_id):
+        """Make sure all versions of product are available.
+
+        Product items have only last versions after refresh.
+
+        Args:
+            product_id (str): Product id.
+        """
+
+        product_item = self._product_items_by_id.get(product_id)
+        if product_item is None or product_item.versions_loaded:
+            return
+        self._controller.load_product_versions(
+            self._last_project_name, [product_id]
+        )
+
     def set_enable_grouping(self, enable_grouping):
         if enable_grouping is self._grouping_enabled:
             return
@@ -247,6 +310,8 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._items_by_id = {}
         self._group_items_by_name = {}
         self._merged_items_by_id = {}
+        self._product_ids_by_path = {}
+        self._product_types_by_group_name = {}
         self._product_items_by_id = {}
         self._reset_merge_color = True
 
@@ -271,7 +336,7 @@ class ProductsModel(QtGui.QStandardItemModel):
             self._group_items_by_name[group_name] = model_item
         return model_item
 
-    def _get_merged_model_item(self, path, count, hex_color):
+    def _get_merged_model_item(self, path, product_name, count, hex_color):
         model_item = self._merged_items_by_id.get(path)
         if model_item is None:
             model_item = QtGui.QStandardItem()
@@ -280,7 +345,7 @@ class ProductsModel(QtGui.QStandardItemModel):
             model_item.setEditable(False)
             model_item.setColumnCount(self.columnCount())
             self._merged_items_by_id[path] = model_item
-        label = "{} ({})".format(path, count)
+        label = "{} ({})".format(product_name, count)
         model_item.setData(label, QtCore.Qt.DisplayRole)
         return model_item
 
@@ -309,7 +374,7 @@ class ProductsModel(QtGui.QStandardItemModel):
         model_item.setData(
             version_item.thumbnail_id, VERSION_THUMBNAIL_ID_ROLE)
 
-        # TODO call site sync methods for all versions at once
+        # Values are cached by '_prefetch_versions_data'
         project_name = self._last_project_name
         version_id = version_item.version_id
         repre_count = self._controller.get_versions_representation_count(
@@ -364,126 +429,235 @@ class ProductsModel(QtGui.QStandardItemModel):
         return self._last_project_name
 
     def refresh(self, project_name, folder_ids):
-        self._clear()
-
         self._last_project_name = project_name
         self._last_folder_ids = folder_ids
 
-        active_site_icon_def = self._controller.get_active_site_icon_def(
-            project_name
-        )
-        remote_site_icon_def = self._controller.get_remote_site_icon_def(
-            project_name
-        )
-        active_site_icon = get_qt_icon(active_site_icon_def)
-        remote_site_icon = get_qt_icon(remote_site_icon_def)
+        # Finish previous refresh which is still running, its result
+        #   is not used
+        if self._current_refresh_thread is not None:
+            self._controller.finish_product_items_refresh(
+                self._current_refresh_thread.refresh, True
+            )
+            self._current_refresh_thread = None
 
-        product_items = self._controller.get_product_items(
+        # Controller is used only in main thread, the refresh thread only
+        #   queries pages of product items which are added to model
+        #   as they come
+        refresh = self._controller.start_product_items_refresh(
             project_name,
             folder_ids,
             sender=PRODUCTS_MODEL_SENDER_NAME
         )
-        product_items_by_id = {
-            product_item.product_id: product_item
+        self._clear()
+        self._add_product_items(refresh.cached_product_items)
+        if not refresh.folder_ids:
+            self._current_refresh_thread = None
+            self.refreshed.emit()
+            return
+
+        thread = ProductItemsPagesThread(uuid.uuid4().hex, refresh)
+        self._current_refresh_thread = thread
+        self._refresh_threads[thread.id] = thread
+        thread.page_received.connect(self._on_page_received)
+        thread.refresh_finished.connect(self._on_refresh_thread)
+        thread.start()
+
+    def _is_current_thread(self, thread_id):
+        return (
+            self._current_refresh_thread is not None
+            and thread_id == self._current_refresh_thread.id
+        )
+
+    def _on_page_received(self, thread_id, product_items_by_id):
+        """Add queried page of product items to the model.
+
+        Pages of outdated threads are ignored.
+
+        Args:
+            thread_id (str): Thread id.
+            product_items_by_id (dict[str, ProductItem]): Product items.
+        """
+
+        if not self._is_current_thread(thread_id):
+            return
+        refresh = self._current_refresh_thread.refresh
+        product_items = self._controller.store_product_items_page(
+            refresh, product_items_by_id
+        )
+        self._add_product_items(product_items)
+
+    def _on_refresh_thread(self, thread_id):
+        """Callback when refresh thread is finished.
+
+        Only result of last started thread is used.
+
+        Args:
+            thread_id (str): Thread id.
+        """
+
+        thread = self._refresh_threads.pop(thread_id)
+        if not self._is_current_thread(thread_id):
+            return
+
+        self._current_refresh_thread = None
+        self._controller.finish_product_items_refresh(
+            thread.refresh, thread.failed
+        )
+        self.refreshed.emit()
+
+    def _prefetch_versions_data(self, product_items):
+        """Query representation count and site sync availability at once.
+
+        Items are then filled from cache of controller.
+        """
+
+        last_version_ids = {
+            max(product_item.version_items.values()).version_id
             for product_item in product_items
         }
+        if not last_version_ids:
+            return
+        project_name = self._last_project_name
+        self._controller.get_versions_representation_count(
+            project_name, last_version_ids
+        )
+        self._controller.get_version_sync_availability(
+            project_name, last_version_ids
+        )
 
-        # Prepare product groups
-        product_name_matches_by_group = collections.defaultdict(dict)
-        for product_item in product_items_by_id.values():
-            group_name = None
-            if self._grouping_enabled:
-                group_name = product_item.group_name
+    def _add_product_items(self, product_items):
+        """Add product items to the model.
 
-            product_name = product_item.product_name
-            group = product_name_matches_by_group[group_name]
-            if product_name not in group:
-                group[product_name] = [product_item]
-                continue
-            group[product_name].append(product_item)
+        Items can be added multiple times after model was cleared, e.g. per
+        queried page. Products with the same name in the same group are
+        merged even if they were added in different calls.
+
+        Args:
+            product_items (Iterable[ProductItem]): Product items to add.
+        """
+
+        product_items = [
+            product_item
+            for product_item in product_items
+            if product_item.product_id not in self._items_by_id
+        ]
+        if not product_items:
+            return
+
+        self._prefetch_versions_data(product_items)
 
-        group_names = set(product_name_matches_by_group.keys())
+        project_name = self._last_project_name
+        active_site_icon_def = self._controller.get_active_site_icon_def(
+            project_name
+        )
+        remote_site_icon_def = self._controller.get_remote_site_icon_def(
+            project_name
+        )
+        active_site_icon = get_qt_icon(active_site_icon_def)
+        remote_site_icon = get_qt_icon(remote_site_icon_def)
 
         root_item = self.invisibleRootItem()
-        new_root_items = []
-        merged_paths = set()
-        for group_name in group_names:
-            key_parts = []
-            if group_name:
-                key_parts.append(group_name)
-
-            groups = product_name_matches_by_group[group_name]
-            merged_product_items = {}
-            top_items = []
-            group_product_types = set()
-            for product_name, product_items in groups.items():
-                group_product_types |= {p.product_type for p in product_items}
-                if len(product_items) == 1:
-                    top_items.append(product_items[0])
-                else:
-                    path = "/".join(key_parts + [product_name])
-                    merged_paths.add(path)
-                    merged_product_items[path] = (
-                        product_name,
-                        product_items,
-                    )
-
-            parent_item = None
+        # New items by group name, 'None' is root
+        new_items_by_group = collections.defaultdict(list)
+        changed_paths = set()
+        changed_group_names = set()
+        for product_item in product_items:
+            group_name = None
+            if self._grouping_enabled:
+                group_name = product_item.group_name or None
+
             if group_name:
-                parent_item = self._get_group_model_item(group_name)
-                parent_item.setData(
-                    "|".join(group_product_types), PRODUCT_TYPE_ROLE)
-
-            new_items = []
-            if parent_item is not None and parent_item.row() < 0:
-                new_root_items.append(parent_item)
-
-            for product_item in top_items:
-                item = self._get_product_model_item(
-                    product_item,
-                    active_site_icon,
-                    remote_site_icon,
+                product_types = self._product_types_by_group_name.setdefault(
+                    group_name, set()
                 )
-                new_items.append(item)
+                if product_item.product_type not in product_types:
+                    product_types.add(product_item.product_type)
+                    changed_group_names.add(group_name)
+
+            product_name = product_item.product_name
+            path = product_name
+            if group_name:
+                path = "/".join([group_name, product_name])
+
+            item = self._get_product_model_item(
+                product_item,
+                active_site_icon,
+                remote_site_icon,
+            )
+            product_ids = self._product_ids_by_path.setdefault(path, [])
+            product_ids.append(product_item.product_id)
+            if len(product_ids) == 1:
+                new_items_by_group[group_name].append(item)
+                continue
 
-            for path_info in merged_product_items.values():
-                product_name, product_items = path_info
-                (merged_color_hex, merged_color_qt) = self._get_next_color()
-                merged_color = qtawesome.icon(
-                    "fa.circle", color=merged_color_qt)
+            changed_paths.add(path)
+            merged_item = self._merged_items_by_id.get(path)
+            if merged_item is None:
+                # Second product with the same name, move the first one
+                #   under merged item
+                merged_color_hex, merged_color_qt = self._get_next_color()
                 merged_item = self._get_merged_model_item(
-                    product_name, len(product_items), merged_color_hex)
-                merged_item.setData(merged_color, QtCore.Qt.DecorationRole)
+                    path, product_name, len(product_ids), merged_color_hex)
+                merged_item.setData(
+                    qtawesome.icon("fa.circle", color=merged_color_qt),
+                    QtCore.Qt.DecorationRole
+                )
+                first_item = self._items_by_id[product_ids[0]]
+                new_items = new_items_by_group[group_name]
+                new_idx = next(
+                    (
+                        idx
+                        for idx, new_item in enumerate(new_items)
+                        if new_item is first_item
+                    ),
+                    None
+                )
+                if new_idx is not None:
+                    new_items.pop(new_idx)
+                else:
+                    parent_item = first_item.parent() or root_item
+                    parent_item.takeRow(first_item.row())
+                merged_item.appendRow(first_item)
                 new_items.append(merged_item)
+            merged_item.appendRow(item)
 
-                merged_product_types = set()
-                new_merged_items = []
-                for product_item in product_items:
-                    item = self._get_product_model_item(
-                        product_item,
-                        active_site_icon,
-                        remote_site_icon,
-                    )
-                    new_merged_items.append(item)
-                    merged_product_types.add(product_item.product_type)
+        for path in changed_paths:
+            product_ids = self._product_ids_by_path[path]
+            merged_item = self._merged_items_by_id[path]
+            product_name = (
+                self._product_items_by_id[product_ids[0]].product_name
+            )
+            merged_item.setData(
+                "{} ({})".format(product_name, len(product_ids)),
+                QtCore.Qt.DisplayRole
+            )
+            merged_item.setData(
+                "|".join({
+                    self._product_items_by_id[product_id].product_type
+                    for product_id in product_ids
+                }),
+                PRODUCT_TYPE_ROLE
+            )
 
-                merged_item.setData(
-                    "|".join(merged_product_types), PRODUCT_TYPE_ROLE)
-                if new_merged_items:
-                    merged_item.appendRows(new_merged_items)
+        for group_name in changed_group_names:
+            group_item = self._get_group_model_item(group_name)
+            group_item.setData(
+                "|".join(self._product_types_by_group_name[group_name]),
+                PRODUCT_TYPE_ROLE
+            )
 
+        new_root_items = list(new_items_by_group.pop(None, []))
+        for group_name, new_items in new_items_by_group.items():
             if not new_items:
                 continue
-
-            if parent_item is None:
-                new_root_items.extend(new_items)
-            else:
-                parent_item.appendRows(new_items)
+            group_item = self._get_group_model_item(group_name)
+            if group_item.row() < 0:
+                new_root_items.append(group_item)
+            group_item.appendRows(new_items)
 
         if new_root_items:
             root_item.appendRows(new_root_items)
 
-        self.refreshed.emit()
     # ---------------------------------
     #   This implementation does not call '_clear' at the start
     #       but is more complex and probably slower
@@ -155,6 +155,9 @@ class ProductsWidget(QtWidgets.QWidget):
         products_view.selectionModel().selectionChanged.connect(
             self._on_selection_change)
         products_model.version_changed.connect(self._on_version_change)
+        version_delegate.versions_requested.connect(
+            self._on_versions_requested
+        )
 
         controller.register_event_callback(
             "selection.folders.changed",
@@ -393,6 +396,9 @@ class ProductsWidget(QtWidgets.QWidget):
     def _on_version_change(self):
         self._on_selection_change()
 
+    def _on_versions_requested(self, product_id):
+        self._products_model.load_product_versions(product_id)
+
     def _on_folders_selection_change(self, event):
         project_name = event["project_name"]
         site_sync_enabled = self._controller.is_site_sync_enabled(
@@ -231,7 +231,11 @@ class LoaderWindow(QtWidgets.QWidget):
         show_timer = QtCore.QTimer()
         show_timer.setInterval(1)
 
+        thumbnails_timer = QtCore.QTimer()
+        thumbnails_timer.setInterval(50)
+
         show_timer.timeout.connect(self._on_show_timer)
+        thumbnails_timer.timeout.connect(self._on_thumbnails_timer)
 
         projects_combobox.refreshed.connect(self._on_projects_refresh)
         folders_widget.refreshed.connect(self._on_folders_refresh)
@@ -276,6 +280,10 @@ class LoaderWindow(QtWidgets.QWidget):
             "selection.versions.changed",
             self._on_versions_selection_changed,
         )
+        controller.register_event_callback(
+            "thumbnails.ready",
+            self._on_thumbnails_ready,
+        )
         controller.register_event_callback(
             "controller.reset.started",
             self._on_controller_reset_start,
@@ -313,9 +321,11 @@ class LoaderWindow(QtWidgets.QWidget):
         self._reset_on_show = True
         self._show_counter = 0
         self._show_timer = show_timer
+        self._thumbnails_timer = thumbnails_timer
         self._selected_project_name = None
         self._selected_folder_ids = set()
         self._selected_version_ids = set()
+        self._current_thumbnail_ids = set()
 
         self._products_widget.set_enable_grouping(
             self._product_group_checkbox.isChecked()
@@ -491,19 +501,44 @@ class LoaderWindow(QtWidgets.QWidget):
             thumbnail_ids = set(thumbnail_id_by_entity_id.values())
 
         thumbnail_ids.discard(None)
+        self._current_thumbnail_ids = thumbnail_ids
 
         if not thumbnail_ids:
             self._thumbnails_widget.set_current_thumbnails(None)
             return
 
-        thumbnail_paths = set()
-        for thumbnail_id in thumbnail_ids:
-            thumbnail_path = self._controller.get_thumbnail_path(
-                project_name, thumbnail_id)
-            thumbnail_paths.add(thumbnail_path)
+        # Thumbnails which are not available yet are downloaded in
+        #   background and are shown on 'thumbnails.ready' event
+        thumbnail_paths_by_id = self._controller.prefetch_thumbnails(
+            project_name, thumbnail_ids
+        )
+        if len(thumbnail_paths_by_id) != len(thumbnail_ids):
+            self._thumbnails_timer.start()
+
+        self._set_thumbnail_paths(thumbnail_paths_by_id.values())
+
+    def _set_thumbnail_paths(self, thumbnail_paths):
+        thumbnail_paths = set(thumbnail_paths)
         thumbnail_paths.discard(None)
         self._thumbnails_widget.set_current_thumbnail_paths(thumbnail_paths)
 
+    def _on_thumbnails_timer(self):
+        if not self._controller.emit_ready_thumbnails():
+            self._thumbnails_timer.stop()
+
+    def _on_thumbnails_ready(self, event):
+        if event["project_name"] != self._selected_project_name:
+            return
+
+        thumbnail_ids = self._current_thumbnail_ids
+        if not thumbnail_ids.intersection(event["thumbnail_paths"]):
+            return
+
+        thumbnail_paths_by_id = self._controller.prefetch_thumbnails(
+            self._selected_project_name, thumbnail_ids
+        )
+        self._set_thumbnail_paths(thumbnail_paths_by_id.values())
+
     def _on_projects_refresh(self):
         self._refresh_handler.set_project_refreshed()
         if not self._refresh_handler.folders_refreshed:
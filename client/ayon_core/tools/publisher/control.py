@@ -1,4 +1,5 @@
 import os
+import sys
 import copy
 import logging
 import traceback
@@ -84,10 +85,184 @@ class AssetDocsCache:
         return copy.deepcopy(self._asset_docs_by_path[folder_path])
 
 
+class PublishLogItems:
+    """Log items of single plugin result in compact form.
+
+    Log records are stored as tuples with interned strings and preformatted
+    messages, references to the records are not kept. Records with level lower
+    than warning are skipped when there are more than 'max_records' records,
+    warnings and errors are always kept.
+
+    Args:
+        instance_id (Optional[str]): Instance id added to log items.
+        add_instance_id (Optional[bool]): Add 'instance_id' key to log items.
+    """
+
+    max_records = 1000
+
+    def __init__(self, instance_id=None, add_instance_id=False):
+        self._instance_id = instance_id
+        self._add_instance_id = add_instance_id
+        self._records = []
+        self._skipped_count = 0
+        self._error_item = None
+        self._items = None
+
+    def add_result(self, result):
+        """Store log records and error from plugin or action result.
+
+        Args:
+            result (dict[str, Any]): Pyblish result.
+        """
+
+        for record in result.get("records") or []:
+            if (
+                len(self._records) >= self.max_records
+                and record.levelno < logging.WARNING
+            ):
+                self._skipped_count += 1
+                continue
+            self._records.append(self._compact_record(record))
+
+        exception = result.get("error")
+        if exception:
+            self._error_item = self._create_error_item(result, exception)
+        self._items = None
+
+    def get_items(self):
+        """Log items of result.
+
+        Returns:
+            list[dict[str, Any]]: Log items. Output is cached, it should not
+                be modified.
+        """
+
+        if self._items is None:
+            self._items = self._create_items()
+        return self._items
+
+    @staticmethod
+    def _intern(value):
+        if isinstance(value, str):
+            return sys.intern(value)
+        return value
+
+    def _compact_record(self, record):
+        # Traceback is formatted immediately so frames are not kept in memory
+        record_exc_info = record.exc_info
+        if record_exc_info is not None:
+            record_exc_info = "".join(
+                traceback.format_exception(*record_exc_info)
+            )
+
+        try:
+            msg = record.getMessage()
+        except Exception:
+            msg = str(record.msg)
+
+        return (
+            msg,
+            self._intern(record.name),
+            record.lineno,
+            record.levelno,
+            self._intern(record.levelname),
+            self._intern(record.threadName),
+            self._intern(record.filename),
+            self._intern(record.pathname),
+            record.msecs,
+            record_exc_info,
+        )
+
+    def _create_item(
+        self,
+        msg,
+        name,
+        lineno,
+        levelno,
+        levelname,
+        thread_name,
+        filename,
+        pathname,
+        msecs,
+        exc_info,
+    ):
+        item = {
+            "type": "record",
+            "msg": msg,
+            "name": name,
+            "lineno": lineno,
+            "levelno": levelno,
+            "levelname": levelname,
+            "threadName": thread_name,
+            "filename": filename,
+            "pathname": pathname,
+            "msecs": msecs,
+            "exc_info": exc_info
+        }
+        if self._add_instance_id:
+            item["instance_id"] = self._instance_id
+        return item
+
+    def _create_items(self):
+        output = []
+        for compact_record in self._records:
+            output.append(self._create_item(*compact_record))
+
+        if self._skipped_count:
+            output.append(self._create_item(
+                "{} debug and info log records were skipped.".format(
+                    self._skipped_count
+                ),
+                __name__,
+                0,
+                logging.INFO,
+                "INFO",
+                None,
+                None,
+                None,
+                0,
+                None
+            ))
+
+        if self._error_item is not None:
+            output.append(self._error_item)
+        return output
+
+    def _create_error_item(self, result, exception):
+        fname, line_no, func, exc = exception.traceback
+
+        # Conversion of exception into string may crash
+        try:
+            msg = str(exception)
+        except BaseException:
+            msg = (
+                "Publisher Controller: ERROR"
+                " - Failed to get exception message"
+            )
+
+        # Action result does not have 'is_validation_error'
+        is_validation_error = result.get("is_validation_error", False)
+        item = {
+            "type": "error",
+            "is_validation_error": is_validation_error,
+            "msg": msg,
+            "filename": str(fname),
+            "lineno": str(line_no),
+            "func": str(func),
+            "traceback": exception.formatted_traceback
+        }
+        if self._add_instance_id:
+            item["instance_id"] = self._instance_id
+        return item
+
+
 class PublishReportMaker:
     """Report for single publishing process.
 
     Report keeps current state of publishing and currently processed plugin.
+
+    Report data of plugins are cached and created again only for plugins
+    which changed since last 'get_report' call.
     """
 
     def __init__(self, controller):
@@ -97,6 +272,8 @@ class PublishReportMaker:
         self._publish_discover_result = None
 
         self._plugin_data_by_id = {}
+        self._plugin_changes = collections.Counter()
+        self._plugin_report_cache = {}
         self._current_plugin = None
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
@@ -112,6 +289,8 @@ class PublishReportMaker:
         self._publish_discover_result = create_context.publish_discover_result
 
         self._plugin_data_by_id = {}
+        self._plugin_changes = collections.Counter()
+        self._plugin_report_cache = {}
         self._current_plugin = None
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
@@ -128,6 +307,7 @@ class PublishReportMaker:
 
         if self._current_plugin_data:
             self._current_plugin_data["passed"] = True
+            self._plugin_changes[self._current_plugin_data["id"]] += 1
 
         self._current_plugin = plugin
         self._current_plugin_data = self._add_plugin_data_item(plugin)
@@ -166,6 +346,7 @@ class PublishReportMaker:
     def set_plugin_skipped(self):
         """Set that current plugin has been skipped."""
         self._current_plugin_data["skipped"] = True
+        self._plugin_changes[self._current_plugin_data["id"]] += 1
 
     def add_result(self, result):
         """Handle result of one plugin and it's instance."""
@@ -174,11 +355,14 @@ class PublishReportMaker:
         instance_id = None
         if instance is not None:
             instance_id = instance.id
+        log_items = PublishLogItems(instance_id, add_instance_id=True)
+        log_items.add_result(result)
         self._current_plugin_data["instances_data"].append({
             "id": instance_id,
-            "logs": self._extract_instance_log_items(result),
+            "logs": log_items,
             "process_time": result["duration"]
         })
+        self._plugin_changes[self._current_plugin_data["id"]] += 1
 
     def add_action_result(self, action, result):
         """Add result of single action."""
@@ -190,13 +374,15 @@ class PublishReportMaker:
 
         action_name = action.__name__
         action_label = action.label or action_name
-        log_items = self._extract_log_items(result)
+        log_items = PublishLogItems()
+        log_items.add_result(result)
         store_item["actions_data"].append({
             "success": result["success"],
             "name": action_name,
             "label": action_label,
             "logs": log_items
         })
+        self._plugin_changes[plugin.id] += 1
 
     def get_report(self, publish_plugins=None):
         """Report data with all details of current state."""
@@ -208,9 +394,10 @@ class PublishReportMaker:
                 instance, instance in self._current_context
             )
 
-        plugins_data_by_id = copy.deepcopy(
-            self._plugin_data_by_id
-        )
+        plugins_data_by_id = {
+            plugin_id: self._get_plugin_report_data(plugin_data)
+            for plugin_id, plugin_data in self._plugin_data_by_id.items()
+        }
 
         # Ensure the current plug-in is marked as `passed` in the result
         # so that it shows on reports for paused publishes
@@ -219,7 +406,11 @@ class PublishReportMaker:
                 self._current_plugin.id
             )
             if current_plugin_data and not current_plugin_data["passed"]:
+                current_plugin_data = dict(current_plugin_data)
                 current_plugin_data["passed"] = True
+                plugins_data_by_id[self._current_plugin.id] = (
+                    current_plugin_data
+                )
 
         if publish_plugins:
             for plugin in publish_plugins:
@@ -275,72 +466,45 @@ class PublishReportMaker:
             "instance_id": instance.data.get("instance_id"),
         }
 
-    def _extract_instance_log_items(self, result):
-        instance = result["instance"]
-        instance_id = None
-        if instance:
-            instance_id = instance.id
-
-        log_items = self._extract_log_items(result)
-        for item in log_items:
-            item["instance_id"] = instance_id
-        return log_items
+    def _get_plugin_report_data(self, plugin_data):
+        """Report data of plugin.
 
-    def _extract_log_items(self, result):
-        output = []
-        records = result.get("records") or []
-        for record in records:
-            record_exc_info = record.exc_info
-            if record_exc_info is not None:
-                record_exc_info = "".join(
-                    traceback.format_exception(*record_exc_info)
-                )
+        Data are cached until plugin data change.
 
-            try:
-                msg = record.getMessage()
-            except Exception:
-                msg = str(record.msg)
-
-            output.append({
-                "type": "record",
-                "msg": msg,
-                "name": record.name,
-                "lineno": record.lineno,
-                "levelno": record.levelno,
-                "levelname": record.levelname,
-                "threadName": record.threadName,
-                "filename": record.filename,
-                "pathname": record.pathname,
-                "msecs": record.msecs,
-                "exc_info": record_exc_info
-            })
-
-        exception = result.get("error")
-        if exception:
-            fname, line_no, func, exc = exception.traceback
+        Args:
+            plugin_data (dict[str, Any]): Stored plugin data.
 
-            # Conversion of exception into string may crash
-            try:
-                msg = str(exception)
-            except BaseException:
-                msg = (
-                    "Publisher Controller: ERROR"
-                    " - Failed to get exception message"
-                )
+        Returns:
+            dict[str, Any]: Plugin data for report.
+        """
 
-            # Action result does not have 'is_validation_error'
-            is_validation_error = result.get("is_validation_error", False)
-            output.append({
-                "type": "error",
-                "is_validation_error": is_validation_error,
-                "msg": msg,
-                "filename": str(fname),
-                "lineno": str(line_no),
-                "func": str(func),
-                "traceback": exception.formatted_traceback
-            })
+        plugin_id = plugin_data["id"]
+        changes = self._plugin_changes[plugin_id]
+        cached = self._plugin_report_cache.get(plugin_id)
+        if cached is not None and cached[0] == changes:
+            return cached[1]
 
-        return output
+        report_data = dict(plugin_data)
+        report_data["targets"] = list(plugin_data["targets"])
+        report_data["instances_data"] = [
+            {
+                "id": instance_data["id"],
+                "logs": instance_data["logs"].get_items(),
+                "process_time": instance_data["process_time"],
+            }
+            for instance_data in plugin_data["instances_data"]
+        ]
+        report_data["actions_data"] = [
+            {
+                "success": action_data["success"],
+                "name": action_data["name"],
+                "label": action_data["label"],
+                "logs": action_data["logs"].get_items(),
+            }
+            for action_data in plugin_data["actions_data"]
+        ]
+        self._plugin_report_cache[plugin_id] = (changes, report_data)
+        return report_data
 
 
 class PublishPluginsProxy:
@@ -1339,7 +1339,6 @@ class InstancesLogsView(QtWidgets.QFrame):
         self._instances_by_id = {}
         self._views_by_instance_id = {}
         self._is_showed = False
-        self._clear_needed = False
         self._update_needed = False
         self._instance_ids_filter = []
         self._plugin_ids_filter = None
@@ -1361,10 +1360,6 @@ class InstancesLogsView(QtWidgets.QFrame):
         if not self._is_showed:
             return
 
-        if self._clear_needed:
-            self._clear_widgets()
-            self._clear_needed = False
-
         if not self._update_needed:
             return
         self._update_needed = False
@@ -1382,7 +1377,6 @@ class InstancesLogsView(QtWidgets.QFrame):
                 instance = self._instances_by_id[instance_id]
                 widget = InstanceLogsWidget(instance, self._content_widget)
                 self._views_by_instance_id[instance_id] = widget
-                self._content_layout.addWidget(widget, 0)
 
             widget.setVisible(True)
             widget.set_log_filters(
@@ -1394,24 +1388,39 @@ class InstancesLogsView(QtWidgets.QFrame):
             if widget is not None:
                 widget.setVisible(False)
 
-    def _clear_widgets(self):
-        """Remove all widgets from layout and from cache."""
+        self._sort_widgets()
 
-        while self._content_layout.count():
-            item = self._content_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setVisible(False)
-                widget.deleteLater()
-        self._views_by_instance_id = {}
+    def _sort_widgets(self):
+        """Make sure widgets in layout are in order of instances."""
+
+        index = 0
+        for instance_id in self._instances_order:
+            widget = self._views_by_instance_id.get(instance_id)
+            if widget is None:
+                continue
+            if self._content_layout.indexOf(widget) != index:
+                self._content_layout.removeWidget(widget)
+                self._content_layout.insertWidget(index, widget, 0)
+            index += 1
+
+    def _remove_widget(self, instance_id):
+        widget = self._views_by_instance_id.pop(instance_id, None)
+        if widget is not None:
+            self._content_layout.removeWidget(widget)
+            widget.setVisible(False)
+            widget.deleteLater()
 
     def update_instances(self, instances):
         """Update publish instance from report.
 
+        Widgets of instances with unchanged logs are kept, only widgets of
+        new or changed instances are recreated.
+
         Args:
             instances (list[_InstanceItem]): Instance data from report.
         """
 
+        old_instances_by_id = self._instances_by_id
         self._instances_order = [
             instance.id for instance in instances
         ]
@@ -1419,9 +1428,19 @@ class InstancesLogsView(QtWidgets.QFrame):
             instance.id: instance
             for instance in instances
         }
+        for instance_id in tuple(self._views_by_instance_id):
+            old_instance = old_instances_by_id.get(instance_id)
+            instance = self._instances_by_id.get(instance_id)
+            if (
+                instance is None
+                or old_instance is None
+                or instance.label != old_instance.label
+                or instance.logs != old_instance.logs
+            ):
+                self._remove_widget(instance_id)
+
         self._instance_ids_filter = []
         self._plugin_ids_filter = None
-        self._clear_needed = True
         self._update_needed = True
         self._update_instances()
 
@@ -1719,9 +1738,11 @@ class ReportsWidget(QtWidgets.QWidget):
             plugin_id = plugin_info["id"]
             for instance_info in plugin_info["instances_data"]:
                 instance_id = instance_info["id"] or CONTEXT_ID
-                for log in instance_info["logs"]:
-                    log["plugin_id"] = plugin_id
-                logs_by_instance_id[instance_id].extend(instance_info["logs"])
+                # Log items in report are shared, don't modify them
+                logs_by_instance_id[instance_id].extend(
+                    dict(log, plugin_id=plugin_id)
+                    for log in instance_info["logs"]
+                )
 
         context_item = _InstanceItem.create_context_item(
             context_label, logs_by_instance_id[CONTEXT_ID])
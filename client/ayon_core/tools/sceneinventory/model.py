@@ -2,27 +2,23 @@ import collections
 import re
 import logging
 import uuid
-import copy
 
 from collections import defaultdict
 
 from qtpy import QtCore, QtGui
 import qtawesome
 
-from ayon_core.client import (
-    get_assets,
-    get_subsets,
-    get_versions,
-    get_last_version_by_subset_id,
-    get_representations,
+from ayon_core.client.entities_v4 import (
+    get_last_versions,
+    get_representations_hierarchy,
 )
 from ayon_core.pipeline import (
     get_current_project_name,
-    schema,
     HeroVersionType,
 )
 from ayon_core.style import get_default_entity_icon_color
 from ayon_core.tools.utils.models import TreeModel, Item
+from ayon_core.tools.ayon_utils.models import NestedCacheItem
 from ayon_core.tools.ayon_utils.widgets import get_qt_icon
 
 
@@ -59,6 +55,9 @@ class InventoryModel(TreeModel):
 
     UniqueRole = QtCore.Qt.UserRole + 2     # unique label role
 
+    # Lifetime of cached representations hierarchy in seconds
+    hierarchy_cache_lifetime = 300
+
     def __init__(self, controller, parent=None):
         super(InventoryModel, self).__init__(parent)
         self.log = logging.getLogger(self.__class__.__name__)
@@ -75,6 +74,17 @@ class InventoryModel(TreeModel):
             provider: get_qt_icon(icon_def)
             for provider, icon_def in site_icons.items()
         }
+        # TODO Use product icons
+        self._product_type_icon = qtawesome.icon(
+            "fa.folder", color="#0091B2"
+        )
+
+        self._repre_info_cache = NestedCacheItem(
+            levels=2, lifetime=self.hierarchy_cache_lifetime
+        )
+        self._group_items_by_repre_id = {}
+        self._containers_by_repre_id = {}
+        self._not_found_items = []
 
     def outdated(self, item):
         value = item.get("version")
@@ -180,27 +190,45 @@ class InventoryModel(TreeModel):
         if state != self._hierarchy_view:
             self._hierarchy_view = state
 
-    def refresh(self, selected=None, containers=None):
-        """Refresh the model"""
+    def clear(self):
+        super(InventoryModel, self).clear()
+        self._group_items_by_repre_id = {}
+        self._containers_by_repre_id = {}
+        self._not_found_items = []
+
+    def refresh(self, selected=None, containers=None, clear_cache=False):
+        """Refresh the model.
+
+        Only rows of containers which changed since last refresh are
+        rebuilt, other rows are updated in place.
+
+        Args:
+            selected (Optional[list[str]]): Object names of containers
+                to show in hierarchy view.
+            containers (Optional[Iterable[dict[str, Any]]]): Containers,
+                containers from controller are used if not passed.
+            clear_cache (Optional[bool]): Clear cached representations
+                information so it is queried again.
+        """
+
+        if clear_cache:
+            self._repre_info_cache.reset()
 
         # for debugging or testing, injecting items from outside
         if containers is None:
             containers = self._controller.get_containers()
 
-        self.clear()
-        if not selected or not self._hierarchy_view:
-            self._add_containers(containers)
-            return
-
-        # Filter by cherry-picked items
-        self._add_containers((
-            container
-            for container in containers
-            if container["objectName"] in selected
-        ))
+        if selected and self._hierarchy_view:
+            # Filter by cherry-picked items
+            containers = (
+                container
+                for container in containers
+                if container["objectName"] in selected
+            )
+        self._update_containers(containers)
 
-    def _add_containers(self, containers, parent=None):
-        """Add the items to the model.
+    def _update_containers(self, containers):
+        """Update the model with containers.
 
         The items should be formatted similar to `api.ls()` returns, an item
         is then represented as:
@@ -209,74 +237,187 @@ class InventoryModel(TreeModel):
              "nodetype" : "reference",
              "node": "referenceNode1"}
 
-        Note: When performing an additional call to `add_items` it will *not*
-            group the new items with previously existing item groups of the
-            same type.
+        Containers are grouped by representation. Group is rebuilt only
+        if its containers changed, otherwise only data of the group item
+        (e.g. highest version) are updated. Whole model is reset if most
+        of the groups changed.
 
         Args:
-            containers (generator): Container items.
-            parent (Item, optional): Set this item as parent for the added
-              items when provided. Defaults to the root of the model.
-
-        Returns:
-            node.Item: root node which has children added based on the data
+            containers (Iterable[dict[str, Any]]): Container items.
         """
 
         project_name = get_current_project_name()
 
-        self.beginResetModel()
-
         # Group by representation
-        grouped = defaultdict(lambda: {"containers": list()})
+        grouped = collections.OrderedDict()
         for container in containers:
             repre_id = container["representation"]
-            grouped[repre_id]["containers"].append(container)
-
-        (
-            repres_by_id,
-            versions_by_id,
-            products_by_id,
-            folders_by_id,
-        ) = self._query_entities(project_name, set(grouped.keys()))
-        # Add to model
+            grouped.setdefault(repre_id, []).append(container)
+
+        repre_info_by_id = self._get_representations_info(
+            project_name, set(grouped.keys())
+        )
+
+        found = collections.OrderedDict()
         not_found = defaultdict(list)
-        not_found_ids = []
-        for repre_id, group_dict in sorted(grouped.items()):
-            group_containers = group_dict["containers"]
-            representation = repres_by_id.get(repre_id)
-            if not representation:
-                not_found["representation"].extend(group_containers)
-                not_found_ids.append(repre_id)
-                continue
+        for repre_id, group_containers in sorted(grouped.items()):
+            repre_info = repre_info_by_id.get(repre_id)
+            if isinstance(repre_info, dict):
+                found[repre_id] = group_containers
+            else:
+                where = repre_info or "representation"
+                not_found[where].extend(group_containers)
+
+        highest_versions = self._get_highest_versions(
+            project_name,
+            {
+                repre_info_by_id[repre_id]["productId"]
+                for repre_id in found
+            }
+        )
+        # Prepare site sync specific data
+        progress_by_id = self._controller.get_representations_site_progress(
+            set(found.keys())
+        )
+        sites_info = self._controller.get_sites_information()
 
-            version = versions_by_id.get(representation["parent"])
-            if not version:
-                not_found["version"].extend(group_containers)
-                not_found_ids.append(repre_id)
-                continue
+        group_data_by_repre_id = {}
+        for repre_id in found:
+            repre_info = repre_info_by_id[repre_id]
+            group_data_by_repre_id[repre_id] = self._get_group_data(
+                repre_id,
+                repre_info,
+                found[repre_id],
+                highest_versions.get(repre_info["productId"]),
+                progress_by_id[repre_id],
+                sites_info
+            )
 
-            product = products_by_id.get(version["parent"])
-            if not product:
-                not_found["product"].extend(group_containers)
-                not_found_ids.append(repre_id)
+        old_containers_by_repre_id = self._containers_by_repre_id
+        changed_ids = [
+            repre_id
+            for repre_id, group_containers in found.items()
+            if old_containers_by_repre_id.get(repre_id) != group_containers
+        ]
+        removed_ids = set(old_containers_by_repre_id) - set(found)
+
+        changes_count = len(changed_ids) + len(removed_ids)
+        if (
+            not self._group_items_by_repre_id
+            or changes_count > len(found) // 2
+        ):
+            self._reset_items(
+                found, not_found, repre_info_by_id, group_data_by_repre_id
+            )
+            return
+
+        root_index = QtCore.QModelIndex()
+        root_item = self._root_item
+
+        # Not found items are always recreated
+        self._remove_root_items(self._not_found_items)
+        self._not_found_items = self._create_not_found_items(not_found)
+        if self._not_found_items:
+            count = len(self._not_found_items)
+            row = root_item.childCount()
+            self.beginInsertRows(root_index, row, row + count - 1)
+            for group_node in self._not_found_items:
+                self.add_child(group_node)
+            self.endInsertRows()
+
+        self._remove_root_items([
+            self._group_items_by_repre_id.pop(repre_id)
+            for repre_id in removed_ids
+        ])
+
+        last_column = len(self.Columns) - 1
+        new_group_items = []
+        for repre_id in changed_ids:
+            repre_info = repre_info_by_id[repre_id]
+            group_node = self._group_items_by_repre_id.get(repre_id)
+            if group_node is None:
+                group_node = Item()
+                group_node.update(group_data_by_repre_id[repre_id])
+                self._fill_group_item(group_node, repre_info, found[repre_id])
+                self._group_items_by_repre_id[repre_id] = group_node
+                new_group_items.append(group_node)
                 continue
 
-            folder = folders_by_id.get(product["parent"])
-            if not folder:
-                not_found["folder"].extend(group_containers)
-                not_found_ids.append(repre_id)
+            group_index = self.createIndex(group_node.row(), 0, group_node)
+            children = list(group_node.children())
+            if children:
+                self.beginRemoveRows(group_index, 0, len(children) - 1)
+                for child in children:
+                    group_node.remove_child(child)
+                self.endRemoveRows()
+
+            group_containers = found[repre_id]
+            self.beginInsertRows(group_index, 0, len(group_containers) - 1)
+            self._fill_group_item(group_node, repre_info, group_containers)
+            self.endInsertRows()
+
+        if new_group_items:
+            row = root_item.childCount()
+            self.beginInsertRows(
+                root_index, row, row + len(new_group_items) - 1
+            )
+            for group_node in new_group_items:
+                self.add_child(group_node)
+            self.endInsertRows()
+
+        # Update data of existing groups (highest version, site progress)
+        for repre_id, group_data in group_data_by_repre_id.items():
+            group_node = self._group_items_by_repre_id[repre_id]
+            if all(
+                group_node.get(key) == value
+                for key, value in group_data.items()
+            ):
                 continue
+            group_node.update(group_data)
+            row = group_node.row()
+            self.dataChanged.emit(
+                self.createIndex(row, 0, group_node),
+                self.createIndex(row, last_column, group_node)
+            )
+
+        self._containers_by_repre_id = found
+
+    def _reset_items(
+        self, found, not_found, repre_info_by_id, group_data_by_repre_id
+    ):
+        """Recreate all items of the model."""
+
+        self.beginResetModel()
+
+        self._root_item = self.ItemClass()
+        self._not_found_items = self._create_not_found_items(not_found)
+        for group_node in self._not_found_items:
+            self.add_child(group_node)
+
+        self._group_items_by_repre_id = {}
+        for repre_id, group_containers in found.items():
+            group_node = Item()
+            group_node.update(group_data_by_repre_id[repre_id])
+            self._fill_group_item(
+                group_node, repre_info_by_id[repre_id], group_containers
+            )
+            self._group_items_by_repre_id[repre_id] = group_node
+            self.add_child(group_node)
+
+        self._containers_by_repre_id = found
 
-            group_dict.update({
-                "representation": representation,
-                "version": version,
-                "subset": product,
-                "asset": folder
-            })
+        self.endResetModel()
 
-        for _repre_id in not_found_ids:
-            grouped.pop(_repre_id)
+    def _remove_root_items(self, items):
+        root_index = QtCore.QModelIndex()
+        for item in items:
+            row = item.row()
+            self.beginRemoveRows(root_index, row, row)
+            self._root_item.remove_child(item)
+            self.endRemoveRows()
 
+    def _create_not_found_items(self, not_found):
+        items = []
         for where, group_containers in not_found.items():
             # create the group header
             group_node = Item()
@@ -287,191 +428,149 @@ class InventoryModel(TreeModel):
             group_node["isGroupNode"] = False
             group_node["isNotSet"] = True
 
-            self.add_child(group_node, parent=parent)
-
             for container in group_containers:
                 item_node = Item()
                 item_node.update(container)
                 item_node["Name"] = container.get("objectName", "NO NAME")
                 item_node["isNotFound"] = True
-                self.add_child(item_node, parent=group_node)
-
-        # TODO Use product icons
-        product_type_icon = qtawesome.icon(
-            "fa.folder", color="#0091B2"
-        )
-        # Prepare site sync specific data
-        progress_by_id = self._controller.get_representations_site_progress(
-            set(grouped.keys())
-        )
-        sites_info = self._controller.get_sites_information()
-
-        for repre_id, group_dict in sorted(grouped.items()):
-            group_containers = group_dict["containers"]
-            representation = group_dict["representation"]
-            version = group_dict["version"]
-            subset = group_dict["subset"]
-            asset = group_dict["asset"]
-
-            # Get product type
-            maj_version, _ = schema.get_schema_version(subset["schema"])
-            if maj_version < 3:
-                src_doc = version
-            else:
-                src_doc = subset
-
-            product_type = src_doc["data"].get("family")
-            if not product_type:
-                families = src_doc["data"].get("families")
-                if families:
-                    product_type = families[0]
-
-            # Store the highest available version so the model can know
-            # whether current version is currently up-to-date.
-            highest_version = get_last_version_by_subset_id(
-                project_name, version["parent"]
-            )
-
-            # create the group header
-            group_node = Item()
-            group_node["Name"] = "{}_{}: ({})".format(
-                asset["name"], subset["name"], representation["name"]
-            )
-            group_node["representation"] = repre_id
-            group_node["version"] = version["name"]
-            group_node["highest_version"] = highest_version["name"]
-            group_node["productType"] = product_type or ""
-            group_node["productTypeIcon"] = product_type_icon
-            group_node["count"] = len(group_containers)
-            group_node["isGroupNode"] = True
-            group_node["group"] = subset["data"].get("subsetGroup")
-
+                group_node.add_child(item_node)
+            items.append(group_node)
+        return items
+
+    def _get_group_data(
+        self,
+        repre_id,
+        repre_info,
+        group_containers,
+        highest_version,
+        progress,
+        sites_info
+    ):
+        """Data of group item which can change between refreshes."""
+
+        data = {
+            "Name": "{}_{}: ({})".format(
+                repre_info["folderName"],
+                repre_info["productName"],
+                repre_info["name"]
+            ),
+            "representation": repre_id,
+            "version": repre_info["version"],
+            "highest_version": highest_version,
+            "productType": repre_info["productType"] or "",
+            "productTypeIcon": self._product_type_icon,
+            "count": len(group_containers),
+            "isGroupNode": True,
+            "group": repre_info["productGroup"],
             # Site sync specific data
-            progress = progress_by_id[repre_id]
-            group_node.update(sites_info)
-            group_node["active_site_progress"] = progress["active_site"]
-            group_node["remote_site_progress"] = progress["remote_site"]
+            "active_site_progress": progress["active_site"],
+            "remote_site_progress": progress["remote_site"],
+        }
+        data.update(sites_info)
+        return data
 
-            self.add_child(group_node, parent=parent)
+    def _fill_group_item(self, group_node, repre_info, group_containers):
+        for container in group_containers:
+            item_node = Item()
+            item_node.update(container)
 
-            for container in group_containers:
-                item_node = Item()
-                item_node.update(container)
+            # store the current version on the item
+            item_node["version"] = repre_info["version"]
 
-                # store the current version on the item
-                item_node["version"] = version["name"]
+            # Remapping namespace to item name.
+            # Noted that the name key is capital "N", by doing this, we
+            # can view namespace in GUI without changing container data.
+            item_node["Name"] = container["namespace"]
 
-                # Remapping namespace to item name.
-                # Noted that the name key is capital "N", by doing this, we
-                # can view namespace in GUI without changing container data.
-                item_node["Name"] = container["namespace"]
+            group_node.add_child(item_node)
 
-                self.add_child(item_node, parent=group_node)
+    def _get_highest_versions(self, project_name, product_ids):
+        """Highest version numbers of products.
 
-        self.endResetModel()
+        Returns:
+            dict[str, int]: Last version number by product id.
+        """
+
+        if not product_ids:
+            return {}
+        versions_by_product_id = get_last_versions(
+            project_name, product_ids, fields={"version"}
+        )
+        return {
+            product_id: version["version"]
+            for product_id, version in versions_by_product_id.items()
+        }
 
-        return self._root_item
+    def _get_representations_info(self, project_name, repre_ids):
+        """Information about representations from containers.
 
-    def _query_entities(self, project_name, repre_ids):
-        """Query entities for representations from containers.
+        Hierarchy of representations is queried in bulk and is cached
+        per representation id between refreshes.
 
         Returns:
-            tuple[dict, dict, dict, dict]: Representation, version, product
-                and folder documents by id.
+            dict[str, Union[dict[str, Any], str]]: Representation info by
+                representation id. Name of entity type which was not
+                found is used instead of info for incomplete hierarchy.
         """
 
-        repres_by_id = {}
-        versions_by_id = {}
-        products_by_id = {}
-        folders_by_id = {}
-        output = (
-            repres_by_id,
-            versions_by_id,
-            products_by_id,
-            folders_by_id,
-        )
+        output = {}
+        if not project_name:
+            return output
 
-        filtered_repre_ids = set()
+        project_cache = self._repre_info_cache[project_name]
+        missing_ids = set()
         for repre_id in repre_ids:
             # Filter out invalid representation ids
             # NOTE: This is added because scenes from OpenPype did contain
             #   ObjectId from mongo.
             try:
                 uuid.UUID(repre_id)
-                filtered_repre_ids.add(repre_id)
             except ValueError:
                 continue
-        if not filtered_repre_ids:
-            return output
 
-        repre_docs = get_representations(project_name, repre_ids)
-        repres_by_id.update({
-            repre_doc["_id"]: repre_doc
-            for repre_doc in repre_docs
-        })
-        version_ids = {
-            repre_doc["parent"] for repre_doc in repres_by_id.values()
-        }
-        if not version_ids:
+            cache = project_cache[repre_id]
+            if cache.is_valid:
+                output[repre_id] = cache.get_data()
+            else:
+                missing_ids.add(repre_id)
+
+        if not missing_ids:
             return output
 
-        version_docs = get_versions(project_name, version_ids, hero=True)
-        versions_by_id.update({
-            version_doc["_id"]: version_doc
-            for version_doc in version_docs
-        })
-        hero_versions_by_subversion_id = collections.defaultdict(list)
-        for version_doc in versions_by_id.values():
-            if version_doc["type"] != "hero_version":
+        repres_by_id = get_representations_hierarchy(
+            project_name, missing_ids
+        )
+        for repre_id, repre in repres_by_id.items():
+            version = repre["version"]
+            if not version:
+                output[repre_id] = "version"
+                continue
+
+            product = version["product"]
+            if not product:
+                output[repre_id] = "product"
                 continue
-            subversion = version_doc["version_id"]
-            hero_versions_by_subversion_id[subversion].append(version_doc)
 
-        if hero_versions_by_subversion_id:
-            subversion_ids = set(
-                hero_versions_by_subversion_id.keys()
-            )
-            subversion_docs = get_versions(project_name, subversion_ids)
-            for subversion_doc in subversion_docs:
-                subversion_id = subversion_doc["_id"]
-                subversion_ids.discard(subversion_id)
-                h_version_docs = hero_versions_by_subversion_id[subversion_id]
-                for version_doc in h_version_docs:
-                    version_doc["name"] = HeroVersionType(
-                        subversion_doc["name"]
-                    )
-                    version_doc["data"] = copy.deepcopy(
-                        subversion_doc["data"]
-                    )
-
-            for subversion_id in subversion_ids:
-                h_version_docs = hero_versions_by_subversion_id[subversion_id]
-                for version_doc in h_version_docs:
-                    versions_by_id.pop(version_doc["_id"])
-
-        product_ids = {
-            version_doc["parent"]
-            for version_doc in versions_by_id.values()
-        }
-        if not product_ids:
-            return output
-        product_docs = get_subsets(project_name, product_ids)
-        products_by_id.update({
-            product_doc["_id"]: product_doc
-            for product_doc in product_docs
-        })
-        folder_ids = {
-            product_doc["parent"]
-            for product_doc in products_by_id.values()
-        }
-        if not folder_ids:
-            return output
+            folder = product["folder"]
+            if not folder:
+                output[repre_id] = "folder"
+                continue
 
-        folder_docs = get_assets(project_name, folder_ids)
-        folders_by_id.update({
-            folder_doc["_id"]: folder_doc
-            for folder_doc in folder_docs
-        })
+            version_value = version["version"]
+            if version_value < 0:
+                version_value = HeroVersionType(abs(version_value))
+
+            repre_info = {
+                "name": repre["name"],
+                "version": version_value,
+                "productId": version["productId"],
+                "productName": product["name"],
+                "productType": product["productType"],
+                "productGroup": product["attrib"].get("productGroup"),
+                "folderName": folder["name"],
+            }
+            project_cache[repre_id].update_data(repre_info)
+            output[repre_id] = repre_info
         return output
 
 
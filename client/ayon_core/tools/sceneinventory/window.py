@@ -105,7 +105,7 @@ class SceneInventoryWindow(QtWidgets.QDialog):
             self._on_hierarchy_view_change
         )
         view.data_changed.connect(self._on_refresh_request)
-        refresh_button.clicked.connect(self._on_refresh_request)
+        refresh_button.clicked.connect(self._on_refresh_button_click)
         update_all_button.clicked.connect(self._on_update_all)
 
         self._show_timer = show_timer
@@ -145,7 +145,19 @@ class SceneInventoryWindow(QtWidgets.QDialog):
 
         self.refresh()
 
-    def refresh(self, containers=None):
+    def _on_refresh_button_click(self):
+        self.refresh(clear_cache=True)
+
+    def refresh(self, containers=None, clear_cache=False):
+        """Refresh containers in the tool.
+
+        Args:
+            containers (Optional[list[dict[str, Any]]]): Containers to show,
+                containers from host are used if not passed.
+            clear_cache (Optional[bool]): Clear cached representations
+                information of the model.
+        """
+
         self._first_refresh = False
         self._controller.reset()
         with preserve_expanded_rows(
@@ -157,7 +169,10 @@ class SceneInventoryWindow(QtWidgets.QDialog):
                 role=self._model.UniqueRole,
                 current_index=False
             ):
-                kwargs = {"containers": containers}
+                kwargs = {
+                    "containers": containers,
+                    "clear_cache": clear_cache,
+                }
                 # TODO do not touch view's inner attribute
                 if self._view._hierarchy_view:
                     kwargs["selected"] = self._view._selected
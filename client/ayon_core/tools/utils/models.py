@@ -195,6 +195,11 @@ class Item(dict):
         child._parent = self
         self._children.append(child)
 
+    def remove_child(self, child):
+        """Remove a child from this item"""
+        self._children.remove(child)
+        child._parent = None
+
 
 class RecursiveSortFilterProxyModel(QtCore.QSortFilterProxyModel):
     """Recursive proxy model.
@@ -1,3 +1,5 @@
+import collections
+
 from qtpy import QtWidgets, QtCore, QtGui
 
 from ayon_core.style import get_objected_colors
@@ -6,6 +8,44 @@ from .lib import paint_image_with_color
 from .images import get_image
 
 
+class _ThumbnailPixmapCache:
+    """Memory cache of decoded thumbnail pixmaps by path.
+
+    Least recently used pixmaps are removed when size of cached pixmaps
+    reaches 'max_bytes'.
+    """
+
+    # Max size of decoded pixmaps (in bytes)
+    # - default 64 Mb
+    max_bytes = 64 * 1024 * 1024
+
+    def __init__(self):
+        self._pixmaps_by_path = collections.OrderedDict()
+        self._size = 0
+
+    @staticmethod
+    def _get_pix_size(pix):
+        return pix.width() * pix.height() * max(pix.depth(), 8) // 8
+
+    def get_pixmap(self, path):
+        pix = self._pixmaps_by_path.get(path)
+        if pix is not None:
+            self._pixmaps_by_path.move_to_end(path)
+            return pix
+
+        pix = QtGui.QPixmap(path)
+        pix_size = self._get_pix_size(pix)
+        if pix.isNull() or pix_size > self.max_bytes:
+            return pix
+
+        self._pixmaps_by_path[path] = pix
+        self._size += pix_size
+        while self._size > self.max_bytes:
+            _, old_pix = self._pixmaps_by_path.popitem(last=False)
+            self._size -= self._get_pix_size(old_pix)
+        return pix
+
+
 class ThumbnailPainterWidget(QtWidgets.QWidget):
     """Widget for painting of thumbnails.
 
@@ -23,6 +63,7 @@ class ThumbnailPainterWidget(QtWidgets.QWidget):
     max_thumbnails = 3
     offset_sep = 4
     checker_boxes_count = 20
+    _pixmap_cache = _ThumbnailPixmapCache()
 
     def __init__(self, parent):
         super(ThumbnailPainterWidget, self).__init__(parent)
@@ -122,7 +163,9 @@ class ThumbnailPainterWidget(QtWidgets.QWidget):
         pixes = []
         if thumbnail_paths:
             for thumbnail_path in thumbnail_paths:
-                pixes.append(QtGui.QPixmap(thumbnail_path))
+                pixes.append(
+                    self._pixmap_cache.get_pixmap(thumbnail_path)
+                )
 
         self.set_current_thumbnails(pixes)
 
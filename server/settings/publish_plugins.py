@@ -710,6 +710,22 @@ class IntegrateHeroTemplateNameProfileModel(BaseSettingsModel):
     template_name: str = SettingsField("", title="Template name")
 
 
+class IntegrateAssetModel(BaseSettingsModel):
+    defer_entity_commit: bool = SettingsField(
+        False,
+        title="Defer entity commit",
+        description=(
+            "Commit published entities of all instances together after"
+            " integration instead of per instance"
+        )
+    )
+    max_operations_per_request: int = SettingsField(
+        1000,
+        title="Max operations per request",
+        ge=1,
+    )
+
+
 class IntegrateHeroVersionModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
@@ -793,6 +809,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
     )
+    IntegrateAsset: IntegrateAssetModel = SettingsField(
+        default_factory=IntegrateAssetModel,
+        title="Integrate Asset"
+    )
     IntegrateHeroVersion: IntegrateHeroVersionModel = SettingsField(
         default_factory=IntegrateHeroVersionModel,
         title="Integrate Hero Version"
@@ -1054,6 +1074,10 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "IntegrateAsset": {
+        "defer_entity_commit": False,
+        "max_operations_per_request": 1000
+    },
     "IntegrateHeroVersion": {
         "enabled": True,
         "optional": True,
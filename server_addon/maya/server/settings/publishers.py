@@ -355,11 +355,47 @@ class ExtractLookArgsModel(BaseSettingsModel):
     )
 
 
+class ExtractLookTextureCacheModel(BaseSettingsModel):
+    enabled: bool = SettingsField(False, title="Enabled")
+    root: MultiplatformPathModel = SettingsField(
+        default_factory=MultiplatformPathModel,
+        title="Cache root",
+        description=(
+            "Studio directory where converted textures are cached."
+            " Environment variables can be used, e.g. '{STUDIO_CACHE}'."
+            " Cached files are hardlinked to publish if they're on"
+            " the same device."
+        )
+    )
+    max_size_gb: float = SettingsField(
+        500.0,
+        ge=0.0,
+        title="Maximum size (GB)",
+        description=(
+            "Least recently used textures are removed when cache is"
+            " larger. Size is not limited if set to 0."
+        )
+    )
+
+
 class ExtractLookModel(BaseSettingsModel):
     maketx_arguments: list[ExtractLookArgsModel] = SettingsField(
         default_factory=list,
         title="Extra arguments for maketx command line"
     )
+    texture_processing_workers: int = SettingsField(
+        4,
+        ge=1,
+        title="Concurrent texture conversions",
+        description=(
+            "Maximum count of texture conversions (maketx, rstex)"
+            " running at the same time."
+        )
+    )
+    texture_cache: ExtractLookTextureCacheModel = SettingsField(
+        default_factory=ExtractLookTextureCacheModel,
+        title="Converted textures cache"
+    )
 
 
 class ExtractGPUCacheModel(BaseSettingsModel):
@@ -1344,7 +1380,17 @@ DEFAULT_PUBLISH_SETTINGS = {
         "ogsfx_path": "/maya2glTF/PBR/shaders/glTF_PBR.ogsfx"
     },
     "ExtractLook": {
-        "maketx_arguments": []
+        "maketx_arguments": [],
+        "texture_processing_workers": 4,
+        "texture_cache": {
+            "enabled": False,
+            "root": {
+                "windows": "",
+                "darwin": "",
+                "linux": ""
+            },
+            "max_size_gb": 500.0
+        }
     },
     "ExtractGPUCache": {
         "enabled": False,